@@ -0,0 +1,190 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.standin import Catalog, StandinServer, make_jar
+from mc_mod_updater import ModAnalyzer, ModIndex, ModrinthAPI, RateLimiter, UpdateChecker, scan_folders
+
+DEFAULT_SIZES = (50, 500, 5000)
+PARSE_SAMPLE = 500
+
+
+def measure(function: Callable, *args, **kwargs) -> Dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        value = function(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    
+    return {"value": value, "seconds": round(seconds, 4), "peak_mb": round(peak / 1024 / 1024, 2)}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def get_max_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(usage / 1024 / 1024 if sys.platform == "darwin" else usage / 1024, 1)
+
+
+def generate_folder(folder: str, catalog: Catalog, count: int, unknown: int) -> List[str]:
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    
+    for filename, data in catalog.get_installed_files(count - unknown).items():
+        paths.append(os.path.join(folder, filename))
+        with open(paths[-1], 'wb') as jar_file:
+            jar_file.write(data)
+    
+    for number in range(unknown):
+        paths.append(os.path.join(folder, f"private-mod-{number}.jar"))
+        with open(paths[-1], 'wb') as jar_file:
+            jar_file.write(make_jar("fabric", f"private_mod_{number}", "0.1.0"))
+    
+    return paths
+
+
+def bench_parse(paths: List[str]) -> Dict:
+    timings = []
+    for path in paths[:PARSE_SAMPLE]:
+        started = time.perf_counter()
+        ModAnalyzer.get_mod_info_from_jar(path)
+        timings.append((time.perf_counter() - started) * 1000)
+    
+    return {
+        "jars": len(timings),
+        "mean_ms": round(sum(timings) / len(timings), 3),
+        "p95_ms": round(percentile(timings, 0.95), 3)
+    }
+
+
+def bench_scan(folder: str, index: ModIndex, count: int) -> Dict:
+    run = measure(scan_folders, [folder], index)
+    registry = run.pop("value")[folder]
+    run["jars"] = len(registry)
+    run["jars_per_s"] = round(count / run["seconds"], 1) if run["seconds"] else None
+    return run
+
+
+def bench_check(server: StandinServer, folder: str, index: ModIndex, game_version: str, concurrency: int) -> Dict:
+    registry = scan_folders([folder], index)[folder]
+    api = ModrinthAPI(base_url=server.base_url, pool_size=concurrency * 2, rate_limiter=RateLimiter(rate=50, burst=50))
+    checker = UpdateChecker(api, max_workers=concurrency, log=lambda message: None)
+    
+    server.reset_stats()
+    try:
+        run = measure(checker.check, registry.records, game_version, lambda key, result: None)
+    finally:
+        api.close()
+    
+    statuses = {}
+    for result in run.pop("value").values():
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+    
+    stats = server.get_stats()
+    run.update({
+        "requests": stats["requests"],
+        "bytes": stats["bytes"],
+        "rate_limited": stats["rate_limited"],
+        "endpoints": stats["endpoints"],
+        "statuses": statuses
+    })
+    return run
+
+
+def run_size(server: StandinServer, workdir: str, count: int, args) -> Dict:
+    unknown = int(count * args.unknown_ratio)
+    folder = os.path.join(workdir, f"mods-{count}")
+    
+    started = time.perf_counter()
+    paths = generate_folder(folder, server.catalog, count, unknown)
+    generate_seconds = time.perf_counter() - started
+    
+    index = ModIndex(os.path.join(workdir, f"index-{count}.json"))
+    result = {
+        "jars": count,
+        "unknown_jars": unknown,
+        "generate_s": round(generate_seconds, 3),
+        "parse": bench_parse(paths),
+        "scan_cold": bench_scan(folder, index, count),
+        "scan_warm": bench_scan(folder, index, count),
+        "check": bench_check(server, folder, index, args.game_version, args.concurrency)
+    }
+    
+    shutil.rmtree(folder, ignore_errors=True)
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scanning and update checks against a local Modrinth stand-in.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated jar counts")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every API request")
+    parser.add_argument("--rate-limit", type=int, default=300, help="stand-in requests allowed per minute (0 disables)")
+    parser.add_argument("--unknown-ratio", type=float, default=0.02, help="share of jars that are not in the catalog")
+    parser.add_argument("--padding-kb", type=int, default=16, help="incompressible bytes added to every jar")
+    parser.add_argument("--versions", type=int, default=2, help="versions per catalog project")
+    parser.add_argument("--game-version", default="1.21.1")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    catalog = Catalog(max(sizes), versions=args.versions, padding=os.urandom(args.padding_kb * 1024))
+    server = StandinServer(catalog, args.latency, args.rate_limit or None).start()
+    workdir = tempfile.mkdtemp(prefix="mc-mod-bench-")
+    
+    try:
+        results = [run_size(server, workdir, count, args) for count in sizes]
+    finally:
+        server.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+    
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "sizes": sizes,
+            "latency": args.latency,
+            "rate_limit": args.rate_limit,
+            "unknown_ratio": args.unknown_ratio,
+            "padding_kb": args.padding_kb,
+            "game_version": args.game_version,
+            "concurrency": args.concurrency
+        },
+        "results": results,
+        "max_rss_mb": get_max_rss_mb()
+    }
+    
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+import io
+import json
+import re
+import threading
+import time
+import zipfile
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from typing import Dict, List, Optional
+
+LOADERS = ("forge", "fabric", "quilt")
+GAME_VERSIONS = ("1.20.1", "1.21.1", "1.21.5")
+
+
+def make_jar(loader: str, mod_id: str, version: str, padding: bytes = b"") -> bytes:
+    buffer = io.BytesIO()
+    name = mod_id.replace("_", " ").title()
+    
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as jar:
+        jar.writestr("META-INF/MANIFEST.MF", f"Manifest-Version: 1.0\r\nImplementation-Version: {version}\r\n")
+        if loader == "forge":
+            jar.writestr("META-INF/mods.toml", (
+                'modLoader="javafml"\nloaderVersion="[47,)"\nlicense="MIT"\n\n'
+                f'[[mods]]\nmodId="{mod_id}"\nversion="{version}"\ndisplayName="{name}"\n\n'
+                f'[[dependencies.{mod_id}]]\nmodId="forge"\nmandatory=true\nversionRange="[47,)"\n'
+            ))
+        elif loader == "fabric":
+            jar.writestr("fabric.mod.json", json.dumps({
+                "schemaVersion": 1, "id": mod_id, "version": version, "name": name,
+                "depends": {"fabricloader": ">=0.15"}
+            }))
+        else:
+            jar.writestr("quilt.mod.json", json.dumps({
+                "schema_version": 1,
+                "quilt_loader": {"id": mod_id, "version": version, "metadata": {"name": name}}
+            }))
+        jar.writestr(f"{mod_id}/Main.class", b"\xca\xfe\xba\xbe" + mod_id.encode() * 16)
+        if padding:
+            jar.writestr(f"{mod_id}/assets.bin", padding, compress_type=zipfile.ZIP_STORED)
+    
+    return buffer.getvalue()
+
+
+class Catalog:
+    def __init__(self, projects: int = 50, versions: int = 2, padding: bytes = b""):
+        self.projects = {}
+        self.versions = {}
+        self.by_hash = {}
+        self.by_slug = {}
+        self.blobs = {}
+        
+        for number in range(projects):
+            project_id = f"P{number:07d}"
+            mod_id = f"bench_mod_{number}"
+            loader = LOADERS[number % len(LOADERS)]
+            version_ids = []
+            
+            for index in range(versions):
+                version_number = f"1.{index}.0"
+                data = make_jar(loader, mod_id, version_number, padding)
+                filename = f"{mod_id}-{version_number}.jar"
+                hashes = {"sha1": hashlib.sha1(data).hexdigest(), "sha512": hashlib.sha512(data).hexdigest()}
+                version_id = f"V{number:07d}{index:03d}"
+                
+                self.blobs[filename] = data
+                self.versions[version_id] = {
+                    "id": version_id,
+                    "project_id": project_id,
+                    "name": f"{mod_id} {version_number}",
+                    "version_number": version_number,
+                    "changelog": "Fixed things.\n" * 100,
+                    "version_type": "release",
+                    "loaders": [loader],
+                    "game_versions": [GAME_VERSIONS[min(index, len(GAME_VERSIONS) - 1)]],
+                    "date_published": f"2024-01-{index + 1:02d}T00:00:00Z",
+                    "dependencies": [],
+                    "files": [{
+                        "hashes": hashes,
+                        "url": f"/files/{filename}",
+                        "filename": filename,
+                        "primary": True,
+                        "size": len(data)
+                    }]
+                }
+                self.by_hash[hashes["sha1"]] = version_id
+                self.by_hash[hashes["sha512"]] = version_id
+                version_ids.append(version_id)
+            
+            self.projects[project_id] = {
+                "id": project_id,
+                "slug": mod_id,
+                "title": mod_id.replace("_", " ").title(),
+                "updated": "2024-02-01T00:00:00Z",
+                "versions": version_ids,
+                "loaders": [loader],
+                "game_versions": list(GAME_VERSIONS)
+            }
+            self.by_slug[mod_id] = self.projects[project_id]
+    
+    def get_project(self, project_id: str) -> Optional[Dict]:
+        return self.projects.get(project_id) or self.by_slug.get(project_id)
+    
+    def get_project_versions(self, project_id: str, loaders: Optional[List[str]] = None, 
+                             game_versions: Optional[List[str]] = None) -> Optional[List[Dict]]:
+        project = self.get_project(project_id)
+        if project is None:
+            return None
+        
+        versions = []
+        for version_id in reversed(project["versions"]):
+            version = self.versions[version_id]
+            if loaders and not set(loaders) & set(version["loaders"]):
+                continue
+            if game_versions and not set(game_versions) & set(version["game_versions"]):
+                continue
+            versions.append(version)
+        return versions
+    
+    def get_installed_files(self, count: int, version_index: int = 0) -> Dict[str, bytes]:
+        files = {}
+        for project in list(self.projects.values())[:count]:
+            version = self.versions[project["versions"][min(version_index, len(project["versions"]) - 1)]]
+            filename = version["files"][0]["filename"]
+            files[filename] = self.blobs[filename]
+        return files
+
+
+class RateLimit:
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self.window_start = time.monotonic()
+        self.used = 0
+        self.lock = threading.Lock()
+    
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 60:
+                self.window_start = now
+                self.used = 0
+            
+            reset = max(1, int(60 - (now - self.window_start)))
+            if self.used >= self.per_minute:
+                return False, 0, reset
+            
+            self.used += 1
+            return True, self.per_minute - self.used, reset
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    rate_headers = {}
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def count(self, endpoint: str, sent: int):
+        with self.server.stats_lock:
+            stats = self.server.stats
+            stats["requests"] += 1
+            stats["bytes"] += sent
+            stats["endpoints"][endpoint] = stats["endpoints"].get(endpoint, 0) + 1
+    
+    def send_body(self, endpoint: str, body: bytes, status: int = 200, content_type: str = "application/json", 
+                  headers: Optional[Dict[str, str]] = None):
+        self.count(endpoint, len(body))
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_json(self, endpoint: str, data, status: int = 200):
+        base_url = f"http://{self.server.server_address[0]}:{self.server.server_port}/files/"
+        body = json.dumps(data).replace('"url": "/files/', f'"url": "{base_url}').encode()
+        self.send_body(endpoint, body, status, headers=self.rate_headers)
+    
+    def admit(self, endpoint: str) -> bool:
+        time.sleep(self.server.latency)
+        self.rate_headers = {}
+        
+        if self.server.rate_limit is None:
+            return True
+        
+        allowed, remaining, reset = self.server.rate_limit.take()
+        self.rate_headers = {
+            "X-Ratelimit-Limit": str(self.server.rate_limit.per_minute),
+            "X-Ratelimit-Remaining": str(remaining),
+            "X-Ratelimit-Reset": str(reset)
+        }
+        if not allowed:
+            with self.server.stats_lock:
+                self.server.stats["rate_limited"] += 1
+            self.rate_headers["Retry-After"] = str(reset)
+            self.send_json(endpoint, {"error": "ratelimited"}, 429)
+        return allowed
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        catalog = self.server.catalog
+        
+        if url.path.startswith("/files/"):
+            self.send_file(url.path[len("/files/"):])
+            return
+        
+        match = re.match(r"^/v2/project/([^/]+)/version$", url.path)
+        if match:
+            if not self.admit("project_versions"):
+                return
+            versions = catalog.get_project_versions(
+                match.group(1),
+                json.loads(query["loaders"][0]) if "loaders" in query else None,
+                json.loads(query["game_versions"][0]) if "game_versions" in query else None
+            )
+            if versions is None:
+                self.send_json("project_versions", {"error": "not_found"}, 404)
+            elif query.get("include_changelog") == ["false"]:
+                self.send_json("project_versions", [dict(version, changelog=None) for version in versions])
+            else:
+                self.send_json("project_versions", versions)
+        elif url.path in ("/v2/projects", "/v2/versions"):
+            endpoint = url.path[len("/v2/"):]
+            if not self.admit(endpoint):
+                return
+            table = catalog.projects if endpoint == "projects" else catalog.versions
+            ids = json.loads(query.get("ids", ["[]"])[0])
+            self.send_json(endpoint, [table[item_id] for item_id in ids if item_id in table])
+        elif url.path == "/v2/search":
+            if not self.admit("search"):
+                return
+            words = query.get("query", [""])[0].lower()
+            hits = [
+                {"project_id": project["id"], "slug": project["slug"], "title": project["title"]}
+                for project in catalog.projects.values() if words and words in project["title"].lower()
+            ]
+            self.send_json("search", {"hits": hits[:10], "total_hits": len(hits)})
+        else:
+            self.send_json("unknown", {"error": "not_found"}, 404)
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        catalog = self.server.catalog
+        
+        if self.path == "/v2/version_files":
+            if not self.admit("version_files"):
+                return
+            self.send_json("version_files", {
+                digest: catalog.versions[catalog.by_hash[digest]]
+                for digest in body.get("hashes", []) if digest in catalog.by_hash
+            })
+        elif self.path == "/v2/version_files/update":
+            if not self.admit("version_files_update"):
+                return
+            latest = {}
+            for digest in body.get("hashes", []):
+                if digest not in catalog.by_hash:
+                    continue
+                versions = catalog.get_project_versions(
+                    catalog.versions[catalog.by_hash[digest]]["project_id"],
+                    body.get("loaders"),
+                    body.get("game_versions")
+                )
+                if versions:
+                    latest[digest] = versions[0]
+            self.send_json("version_files_update", latest)
+        else:
+            self.send_json("unknown", {"error": "not_found"}, 404)
+    
+    def send_file(self, filename: str):
+        data = self.server.catalog.blobs.get(filename)
+        if data is None:
+            self.send_body("files", b"", 404, "application/octet-stream")
+            return
+        
+        byte_range = self.headers.get("Range")
+        if byte_range:
+            start = int(byte_range.split("=", 1)[1].split("-", 1)[0])
+            if start >= len(data):
+                self.send_body("files", b"", 416, "application/octet-stream")
+                return
+            self.send_body("files", data[start:], 206, "application/java-archive")
+        else:
+            self.send_body("files", data, 200, "application/java-archive")
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, catalog: Catalog, latency: float = 0.0, rate_limit: Optional[int] = None, 
+                 host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), StandinHandler)
+        self.catalog = catalog
+        self.latency = latency
+        self.rate_limit = RateLimit(rate_limit) if rate_limit else None
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+        self.thread = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_port}/v2"
+    
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = {"requests": 0, "bytes": 0, "rate_limited": 0, "endpoints": {}}
+    
+    def get_stats(self) -> Dict:
+        with self.stats_lock:
+            return dict(self.stats, endpoints=dict(self.stats["endpoints"]))
+    
+    def start(self) -> "StandinServer":
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Modrinth v2 API.")
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every API request")
+    parser.add_argument("--rate-limit", type=int, default=None, help="requests allowed per minute")
+    args = parser.parse_args()
+    
+    server = StandinServer(Catalog(args.projects), args.latency, args.rate_limit, port=args.port)
+    print(f"Serving {args.projects} projects on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
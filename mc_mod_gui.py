@@ -0,0 +1,1292 @@
+import os
+import datetime
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter.scrolledtext import ScrolledText
+from PIL import Image, ImageTk, ImageDraw, ImageFont
+
+from mc_mod_updater import (
+    DEFAULT_MINECRAFT_VERSION,
+    DependencyResolver,
+    FolderWatcher,
+    LogSink,
+    METRICS,
+    ModFilter,
+    ModInstaller,
+    ModRecord,
+    ModRegistry,
+    ModrinthAPI,
+    SinkHandler,
+    UpdateChecker,
+    UpdateScheduler,
+    get_default_mods_folder,
+    open_default_cache,
+    open_default_index,
+    open_default_store
+)
+
+class CustomTkTheme:
+    DARK_BG = "#0f0f0f"
+    DARK_SECONDARY = "#1a1a1a"
+    DARK_TERTIARY = "#252525"
+    ACCENT = "#8c52ff"
+    ACCENT_HOVER = "#9d6fff"
+    TEXT_PRIMARY = "#ffffff"
+    TEXT_SECONDARY = "#b0b0b0"
+    SUCCESS = "#4ade80"
+    WARNING = "#facc15"
+    ERROR = "#f87171"
+    
+    IMAGE_CACHE_SIZE = 128
+    image_cache = OrderedDict()
+    image_cache_stats = {"hits": 0, "misses": 0}
+    
+    @staticmethod
+    def apply_theme(root, style):
+        root.configure(bg=CustomTkTheme.DARK_BG)
+        
+        style.configure("TFrame", background=CustomTkTheme.DARK_BG)
+        
+        style.configure("Card.TFrame", 
+                       background=CustomTkTheme.DARK_SECONDARY,
+                       relief="flat",
+                       borderwidth=0)
+        
+        style.configure("TLabel", 
+                       background=CustomTkTheme.DARK_BG, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       font=("Segoe UI", 10))
+        
+        style.configure("Header.TLabel", 
+                       background=CustomTkTheme.DARK_BG, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       font=("Segoe UI", 18, "bold"))
+        
+        style.configure("Subheader.TLabel", 
+                       background=CustomTkTheme.DARK_BG, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       font=("Segoe UI", 14))
+        
+        style.configure("Card.TLabel", 
+                       background=CustomTkTheme.DARK_SECONDARY, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY)
+        
+        style.configure("TButton", 
+                       background=CustomTkTheme.ACCENT, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       font=("Segoe UI", 10, "bold"),
+                       borderwidth=0,
+                       focusthickness=0,
+                       padding=(15, 8))
+        
+        style.map("TButton", 
+                 background=[("active", CustomTkTheme.ACCENT_HOVER)],
+                 foreground=[("active", CustomTkTheme.TEXT_PRIMARY)])
+        
+        style.configure("Secondary.TButton", 
+                       background=CustomTkTheme.DARK_TERTIARY)
+        
+        style.map("Secondary.TButton", 
+                 background=[("active", "#333333")])
+        
+        style.configure("TEntry", 
+                       fieldbackground=CustomTkTheme.DARK_TERTIARY, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       borderwidth=0,
+                       padding=10)
+        
+        style.configure("Treeview", 
+                       background=CustomTkTheme.DARK_SECONDARY, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       fieldbackground=CustomTkTheme.DARK_SECONDARY,
+                       font=("Segoe UI", 10),
+                       borderwidth=0,
+                       rowheight=30)
+        
+        style.map("Treeview", 
+                 background=[("selected", CustomTkTheme.ACCENT)],
+                 foreground=[("selected", CustomTkTheme.TEXT_PRIMARY)])
+        
+        style.configure("Treeview.Heading", 
+                       background=CustomTkTheme.DARK_TERTIARY, 
+                       foreground=CustomTkTheme.TEXT_PRIMARY,
+                       font=("Segoe UI", 10, "bold"),
+                       borderwidth=0,
+                       padding=10)
+        
+        style.configure("TScrollbar", 
+                       background=CustomTkTheme.DARK_TERTIARY, 
+                       troughcolor=CustomTkTheme.DARK_BG,
+                       borderwidth=0,
+                       arrowsize=14,
+                       arrowcolor=CustomTkTheme.TEXT_PRIMARY)
+        
+        style.configure("TSeparator", 
+                       background=CustomTkTheme.DARK_TERTIARY)
+        
+        style.configure("Horizontal.TProgressbar", 
+                       background=CustomTkTheme.ACCENT, 
+                       troughcolor=CustomTkTheme.DARK_TERTIARY,
+                       borderwidth=0,
+                       thickness=8)
+    
+    @staticmethod
+    def create_rounded_rectangle(width, height, radius, fill_color):
+        key = (width, height, radius, fill_color)
+        cache = CustomTkTheme.image_cache
+        
+        photo = cache.get(key)
+        if photo is not None:
+            cache.move_to_end(key)
+            CustomTkTheme.image_cache_stats["hits"] += 1
+            return photo
+        
+        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        
+        draw.rounded_rectangle([(0, 0), (width-1, height-1)], radius, fill=fill_color)
+        
+        photo = ImageTk.PhotoImage(image)
+        CustomTkTheme.image_cache_stats["misses"] += 1
+        
+        cache[key] = photo
+        if len(cache) > CustomTkTheme.IMAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return photo
+
+
+class RoundedButton(tk.Canvas):
+    def __init__(self, parent, text, command=None, width=120, height=36, 
+                 bg_color=CustomTkTheme.ACCENT, hover_color=CustomTkTheme.ACCENT_HOVER, 
+                 text_color=CustomTkTheme.TEXT_PRIMARY, **kwargs):
+        super().__init__(parent, width=width, height=height, 
+                         bg=CustomTkTheme.DARK_BG, highlightthickness=0, **kwargs)
+        
+        self.bg_color = bg_color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.command = command
+        self.text = text
+        
+        self.normal_bg = CustomTkTheme.create_rounded_rectangle(width, height, 8, bg_color)
+        self.hover_bg = CustomTkTheme.create_rounded_rectangle(width, height, 8, hover_color)
+        
+        self.bg_img = self.create_image(width//2, height//2, image=self.normal_bg)
+        self.text_id = self.create_text(width//2, height//2, text=text, 
+                                       fill=text_color, font=("Segoe UI", 10, "bold"))
+        
+        self.bind("<Enter>", self.on_enter)
+        self.bind("<Leave>", self.on_leave)
+        self.bind("<Button-1>", self.on_click)
+        
+    def on_enter(self, event):
+        self.itemconfig(self.bg_img, image=self.hover_bg)
+    
+    def on_leave(self, event):
+        self.itemconfig(self.bg_img, image=self.normal_bg)
+    
+    def on_click(self, event):
+        if self.command:
+            self.command()
+
+
+class RoundedFrame(tk.Canvas):
+    def __init__(self, parent, width, height, bg_color=CustomTkTheme.DARK_SECONDARY, **kwargs):
+        super().__init__(parent, width=width, height=height, 
+                         bg=CustomTkTheme.DARK_BG, highlightthickness=0, **kwargs)
+        
+        self.bg_img = CustomTkTheme.create_rounded_rectangle(width, height, 10, bg_color)
+        self.create_image(width//2, height//2, image=self.bg_img)
+        
+        self.frame = tk.Frame(self, bg=bg_color)
+        self.frame.place(x=10, y=10, width=width-20, height=height-20)
+
+
+class StatusBadge(tk.Canvas):
+    def __init__(self, parent, text, status_type="normal", **kwargs):
+        if status_type == "success":
+            bg_color = CustomTkTheme.SUCCESS
+            text_color = "#000000"
+        elif status_type == "warning":
+            bg_color = CustomTkTheme.WARNING
+            text_color = "#000000"
+        elif status_type == "error":
+            bg_color = CustomTkTheme.ERROR
+            text_color = "#000000"
+        else:
+            bg_color = CustomTkTheme.DARK_TERTIARY
+            text_color = CustomTkTheme.TEXT_PRIMARY
+        
+        text_width = len(text) * 7 + 20
+        width = max(text_width, 80)
+        height = 24
+        
+        super().__init__(parent, width=width, height=height, 
+                         bg=CustomTkTheme.DARK_SECONDARY, highlightthickness=0, **kwargs)
+        
+        self.bg_img = CustomTkTheme.create_rounded_rectangle(width, height, 12, bg_color)
+        self.create_image(width//2, height//2, image=self.bg_img)
+        
+        self.create_text(width//2, height//2, text=text, 
+                        fill=text_color, font=("Segoe UI", 9, "bold"))
+
+
+class VersionSelectionDialog(tk.Toplevel):
+    PAGE_SIZE = 100
+    LOAD_THRESHOLD = 0.9
+    ALL = "All"
+    
+    def __init__(self, parent, title, versions):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry("700x600")
+        self.resizable(True, True)
+        self.transient(parent)
+        self.grab_set()
+        
+        self.configure(bg=CustomTkTheme.DARK_BG)
+        
+        self.versions = versions
+        self.selected_version = None
+        self.filtered = list(range(len(versions)))
+        self.loaded = 0
+        self.loading = False
+        
+        self.create_ui()
+        self.load_page()
+        
+        self.update_idletasks()
+        width = self.winfo_width()
+        height = self.winfo_height()
+        x = (self.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.winfo_screenheight() // 2) - (height // 2)
+        self.geometry(f"{width}x{height}+{x}+{y}")
+        
+        self.wait_window()
+    
+    def get_choices(self, key: str) -> List[str]:
+        choices = {}
+        for version in self.versions:
+            for value in version.get(key) or ():
+                choices.setdefault(value, None)
+        return [self.ALL] + list(choices)
+    
+    def create_filter(self, parent, label: str, choices: List[str]) -> tk.StringVar:
+        tk.Label(parent, text=label, 
+                 bg=CustomTkTheme.DARK_BG, 
+                 fg=CustomTkTheme.TEXT_SECONDARY,
+                 font=("Segoe UI", 10)).pack(side=tk.LEFT, padx=(0, 8))
+        
+        variable = tk.StringVar(value=self.ALL)
+        combobox = ttk.Combobox(parent, textvariable=variable, values=choices, 
+                                state="readonly", width=12)
+        combobox.pack(side=tk.LEFT, padx=(0, 20))
+        combobox.bind("<<ComboboxSelected>>", lambda event: self.apply_filters())
+        return variable
+    
+    def create_ui(self):
+        main_frame = tk.Frame(self, bg=CustomTkTheme.DARK_BG)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
+        
+        header_label = tk.Label(main_frame, text="Select Version", 
+                               bg=CustomTkTheme.DARK_BG, 
+                               fg=CustomTkTheme.TEXT_PRIMARY,
+                               font=("Segoe UI", 18, "bold"))
+        header_label.pack(anchor=tk.W, pady=(0, 15))
+        
+        filters_frame = tk.Frame(main_frame, bg=CustomTkTheme.DARK_BG)
+        filters_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        self.game_version_var = self.create_filter(filters_frame, "Minecraft:", self.get_choices("game_versions"))
+        self.loader_var = self.create_filter(filters_frame, "Loader:", self.get_choices("loaders"))
+        self.channel_var = self.create_filter(filters_frame, "Channel:", [self.ALL] + list(ModrinthAPI.CHANNELS))
+        
+        self.count_label = tk.Label(filters_frame, text="", 
+                                    bg=CustomTkTheme.DARK_BG, 
+                                    fg=CustomTkTheme.TEXT_SECONDARY,
+                                    font=("Segoe UI", 10))
+        self.count_label.pack(side=tk.RIGHT)
+        
+        columns = ("version", "mc_version", "loaders", "channel", "date")
+        
+        tree_frame = RoundedFrame(main_frame, 640, 420)
+        tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 25))
+        
+        self.versions_tree = ttk.Treeview(tree_frame.frame, columns=columns, show="headings", selectmode="browse")
+        
+        self.versions_tree.heading("version", text="Version")
+        self.versions_tree.heading("mc_version", text="Minecraft Version")
+        self.versions_tree.heading("loaders", text="Loaders")
+        self.versions_tree.heading("channel", text="Channel")
+        self.versions_tree.heading("date", text="Release Date")
+        
+        self.versions_tree.column("version", width=160)
+        self.versions_tree.column("mc_version", width=160)
+        self.versions_tree.column("loaders", width=110)
+        self.versions_tree.column("channel", width=70)
+        self.versions_tree.column("date", width=100)
+        
+        self.scrollbar = ttk.Scrollbar(tree_frame.frame, orient=tk.VERTICAL, command=self.versions_tree.yview)
+        self.versions_tree.configure(yscrollcommand=self.on_scroll)
+        
+        self.versions_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.versions_tree.bind("<Double-1>", self.on_version_select)
+        
+        buttons_frame = tk.Frame(main_frame, bg=CustomTkTheme.DARK_BG)
+        buttons_frame.pack(fill=tk.X)
+        
+        cancel_btn = RoundedButton(buttons_frame, "Cancel", 
+                                  command=self.destroy, 
+                                  width=140,
+                                  height=40,
+                                  bg_color=CustomTkTheme.DARK_TERTIARY,
+                                  hover_color="#333333")
+        cancel_btn.pack(side=tk.RIGHT, padx=(15, 0))
+        
+        select_btn = RoundedButton(buttons_frame, "Select", 
+                                  command=self.on_select_button,
+                                  width=140,
+                                  height=40)
+        select_btn.pack(side=tk.RIGHT)
+    
+    @staticmethod
+    def row_values(version) -> Tuple[str, ...]:
+        return (
+            version.get("version_number", "Unknown"),
+            ", ".join(version.get("game_versions", ["Unknown"])),
+            ", ".join(version.get("loaders", ["Unknown"])),
+            version.get("version_type", "Unknown"),
+            version.get("date_published", "Unknown").split("T")[0]
+        )
+    
+    def matches(self, version) -> bool:
+        game_version = self.game_version_var.get()
+        loader = self.loader_var.get()
+        channel = self.channel_var.get()
+        
+        if game_version != self.ALL and game_version not in version.get("game_versions", ()):
+            return False
+        if loader != self.ALL and loader not in version.get("loaders", ()):
+            return False
+        if channel != self.ALL and version.get("version_type") != channel:
+            return False
+        return True
+    
+    def apply_filters(self):
+        self.filtered = [index for index, version in enumerate(self.versions) if self.matches(version)]
+        self.versions_tree.delete(*self.versions_tree.get_children())
+        self.loaded = 0
+        self.load_page()
+        self.versions_tree.yview_moveto(0)
+    
+    def load_page(self):
+        self.loading = False
+        page = self.filtered[self.loaded:self.loaded + self.PAGE_SIZE]
+        for index in page:
+            self.versions_tree.insert("", tk.END, iid=str(index), values=self.row_values(self.versions[index]))
+        self.loaded += len(page)
+        self.count_label.config(text=f"{self.loaded} of {len(self.filtered)} versions")
+    
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if float(last) >= self.LOAD_THRESHOLD and self.loaded < len(self.filtered) and not self.loading:
+            self.loading = True
+            self.after_idle(self.load_page)
+    
+    def on_version_select(self, event):
+        self.on_select_button()
+    
+    def on_select_button(self):
+        selected = self.versions_tree.selection()
+        if not selected:
+            messagebox.showinfo("Info", "No version selected")
+            return
+        
+        self.selected_version = self.versions[int(selected[0])]
+        self.destroy()
+
+
+class ModManagerApp:
+    SCAN_BATCH_SIZE = 200
+    SCAN_POLL_MS = 50
+    VIEW_REFRESH_MS = 100
+    AUTO_CHECK_INTERVALS = OrderedDict([
+        ("Off", 0),
+        ("Every 15 minutes", 15),
+        ("Every hour", 60),
+        ("Every 6 hours", 360)
+    ])
+    AUTO_CHECK_RETRY_MS = 30 * 1000
+    LOG_POLL_MS = 100
+    LOG_MAX_LINES = 2000
+    
+    def __init__(self, root, on_ready: Optional[Callable[[Dict[str, float]], None]] = None):
+        self.started_at = time.perf_counter()
+        self.on_ready = on_ready
+        self.startup_timings = {}
+        
+        self.root = root
+        self.root.title("Minecraft Mod Manager")
+        
+        self.log_sink = LogSink(
+            capacity=self.LOG_MAX_LINES,
+            level=os.environ.get("MC_MOD_UPDATER_LOG_LEVEL", "INFO"),
+            file_path=os.environ.get("MC_MOD_UPDATER_LOG_FILE"),
+            echo=True
+        )
+        logging.getLogger("mc_mod_updater").addHandler(SinkHandler(self.log_sink))
+        logging.getLogger("mc_mod_updater").setLevel(self.log_sink.level)
+        
+        self.root.geometry("1400x900")
+        self.root.minsize(1200, 800)
+        
+        self.center_window()
+        
+        self.minecraft_version = DEFAULT_MINECRAFT_VERSION
+        
+        self.style = ttk.Style()
+        CustomTkTheme.apply_theme(root, self.style)
+        
+        self.mods_folder = get_default_mods_folder()
+        self.registry = ModRegistry()
+        self.mod_filter = ModFilter()
+        self.sort_column = None
+        self.sort_descending = False
+        self.view_pending = False
+        self.scheduler = None
+        self.auto_check_job = None
+        self.auto_check_running = False
+        self.check_concurrency = 8
+        self.api = ModrinthAPI(pool_size=self.check_concurrency * 2, cache=open_default_cache())
+        self.mod_index = open_default_index()
+        self.jar_store = open_default_store()
+        self.resolver = DependencyResolver(self.api, max_workers=self.check_concurrency, log=self.log)
+        self.scan_executor = None
+        self.scan_queue = queue.Queue()
+        self.scan_generation = 0
+        self.scan_cancelled = None
+        self.scan_total = 0
+        self.scan_loaded = 0
+        self.folder_watcher = None
+        
+        self.create_ui()
+        self.startup_timings["build_ms"] = (time.perf_counter() - self.started_at) * 1000
+        
+        self.load_mods()
+        
+        self.root.after_idle(self.on_first_paint)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_first_paint(self):
+        self.startup_timings["first_paint_ms"] = (time.perf_counter() - self.started_at) * 1000
+        
+        stats = CustomTkTheme.image_cache_stats
+        self.log(
+            f"Window ready in {self.startup_timings['first_paint_ms']:.0f} ms "
+            f"(UI built in {self.startup_timings['build_ms']:.0f} ms, "
+            f"{stats['misses']} shapes rendered, {stats['hits']} reused)"
+        )
+        
+        if self.on_ready:
+            self.on_ready(self.startup_timings)
+    
+    def on_close(self):
+        if self.auto_check_job:
+            self.root.after_cancel(self.auto_check_job)
+        if self.folder_watcher:
+            self.folder_watcher.stop()
+        self.log_sink.close()
+        self.root.destroy()
+    
+    def center_window(self):
+        self.root.update_idletasks()
+        width = self.root.winfo_width()
+        height = self.root.winfo_height()
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f"+{x}+{y}")
+    
+    def create_ui(self):
+        container = tk.Frame(self.root, bg=CustomTkTheme.DARK_BG)
+        container.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+        
+        self.create_header(container)
+        
+        self.create_folder_section(container)
+        
+        self.create_mods_section(container)
+        
+        self.create_actions_section(container)
+        
+        self.create_log_section(container)
+    
+    def create_header(self, parent):
+        header_frame = tk.Frame(parent, bg=CustomTkTheme.DARK_BG)
+        header_frame.pack(fill=tk.X, pady=(0, 30))
+        
+        title_label = tk.Label(header_frame, text="Minecraft Mod Manager", 
+                              bg=CustomTkTheme.DARK_BG, 
+                              fg=CustomTkTheme.TEXT_PRIMARY,
+                              font=("Segoe UI", 28, "bold"))
+        title_label.pack(side=tk.LEFT)
+        
+        version_frame = tk.Frame(header_frame, bg=CustomTkTheme.DARK_BG)
+        version_frame.pack(side=tk.RIGHT, padx=10)
+        
+        version_label = tk.Label(version_frame, text="Minecraft Version:", 
+                                bg=CustomTkTheme.DARK_BG, 
+                                fg=CustomTkTheme.TEXT_SECONDARY,
+                                font=("Segoe UI", 12))
+        version_label.pack(side=tk.LEFT, padx=(0, 15))
+        
+        version_entry_frame = RoundedFrame(version_frame, 120, 40, bg_color=CustomTkTheme.DARK_TERTIARY)
+        version_entry_frame.pack(side=tk.LEFT)
+        
+        self.version_var = tk.StringVar(value=self.minecraft_version)
+        version_entry = tk.Entry(version_entry_frame.frame, 
+                                textvariable=self.version_var, 
+                                width=8,
+                                bg=CustomTkTheme.DARK_TERTIARY,
+                                fg=CustomTkTheme.TEXT_PRIMARY,
+                                font=("Segoe UI", 12),
+                                bd=0,
+                                insertbackground=CustomTkTheme.TEXT_PRIMARY)
+        version_entry.pack(fill=tk.BOTH, expand=True, padx=10)
+    
+    def create_folder_section(self, parent):
+        folder_frame = RoundedFrame(parent, 1320, 90)
+        folder_frame.pack(fill=tk.X, pady=(0, 30))
+        
+        inner_frame = tk.Frame(folder_frame.frame, bg=CustomTkTheme.DARK_SECONDARY)
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        
+        folder_label = tk.Label(inner_frame, text="Mods Folder:", 
+                               bg=CustomTkTheme.DARK_SECONDARY, 
+                               fg=CustomTkTheme.TEXT_PRIMARY,
+                               font=("Segoe UI", 12))
+        folder_label.pack(side=tk.LEFT, padx=(0, 15))
+        
+        entry_frame = RoundedFrame(inner_frame, 900, 40, bg_color=CustomTkTheme.DARK_TERTIARY)
+        entry_frame.pack(side=tk.LEFT, padx=(0, 15))
+        
+        self.folder_var = tk.StringVar(value=self.mods_folder)
+        folder_entry = tk.Entry(entry_frame.frame, 
+                               textvariable=self.folder_var, 
+                               bg=CustomTkTheme.DARK_TERTIARY,
+                               fg=CustomTkTheme.TEXT_PRIMARY,
+                               font=("Segoe UI", 12),
+                               bd=0,
+                               insertbackground=CustomTkTheme.TEXT_PRIMARY)
+        folder_entry.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        browse_btn = RoundedButton(inner_frame, "Browse", 
+                                  command=self.browse_folder,
+                                  width=140,
+                                  height=40)
+        browse_btn.pack(side=tk.LEFT, padx=(0, 15))
+        
+        refresh_btn = RoundedButton(inner_frame, "Refresh", 
+                                   command=self.load_mods,
+                                   width=140,
+                                   height=40,
+                                   bg_color=CustomTkTheme.DARK_TERTIARY,
+                                   hover_color="#333333")
+        refresh_btn.pack(side=tk.LEFT)
+    
+    def create_mods_section(self, parent):
+        header_frame = tk.Frame(parent, bg=CustomTkTheme.DARK_BG)
+        header_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        mods_label = tk.Label(header_frame, text="Installed Mods", 
+                             bg=CustomTkTheme.DARK_BG, 
+                             fg=CustomTkTheme.TEXT_PRIMARY,
+                             font=("Segoe UI", 18, "bold"))
+        mods_label.pack(side=tk.LEFT)
+        
+        self.scan_cancel_btn = RoundedButton(header_frame, "Cancel Scan", 
+                                            command=self.cancel_scan,
+                                            width=140,
+                                            height=32,
+                                            bg_color=CustomTkTheme.DARK_TERTIARY,
+                                            hover_color="#333333")
+        
+        filter_frame = RoundedFrame(header_frame, 260, 32, bg_color=CustomTkTheme.DARK_TERTIARY)
+        filter_frame.pack(side=tk.RIGHT, padx=(15, 0))
+        
+        self.filter_var = tk.StringVar(value="")
+        self.filter_var.trace_add("write", lambda *args: self.apply_view())
+        filter_entry = tk.Entry(filter_frame.frame, 
+                               textvariable=self.filter_var, 
+                               bg=CustomTkTheme.DARK_TERTIARY,
+                               fg=CustomTkTheme.TEXT_PRIMARY,
+                               font=("Segoe UI", 11),
+                               bd=0,
+                               insertbackground=CustomTkTheme.TEXT_PRIMARY)
+        filter_entry.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        filter_label = tk.Label(header_frame, text="Filter:", 
+                               bg=CustomTkTheme.DARK_BG, 
+                               fg=CustomTkTheme.TEXT_SECONDARY,
+                               font=("Segoe UI", 11))
+        filter_label.pack(side=tk.RIGHT)
+        
+        self.scan_progress = ttk.Progressbar(header_frame, length=240, mode="determinate")
+        
+        self.scan_status_var = tk.StringVar(value="")
+        self.scan_status_label = tk.Label(header_frame, textvariable=self.scan_status_var, 
+                                         bg=CustomTkTheme.DARK_BG, 
+                                         fg=CustomTkTheme.TEXT_SECONDARY,
+                                         font=("Segoe UI", 11))
+        
+        mods_frame = RoundedFrame(parent, 1320, 450)
+        mods_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 30))
+        
+        self.mods_tree = ttk.Treeview(mods_frame.frame, columns=ModFilter.COLUMNS, show="headings")
+        
+        self.column_titles = {
+            "name": "Mod Name",
+            "current_version": "Current Version",
+            "latest_version": "Latest Version",
+            "loader": "Loader",
+            "status": "Status"
+        }
+        for column, title in self.column_titles.items():
+            self.mods_tree.heading(column, text=title, command=lambda column=column: self.sort_by(column))
+        
+        self.mods_tree.column("name", width=500, minwidth=300)
+        self.mods_tree.column("current_version", width=200, minwidth=150)
+        self.mods_tree.column("latest_version", width=200, minwidth=150)
+        self.mods_tree.column("loader", width=100, minwidth=80)
+        self.mods_tree.column("status", width=200, minwidth=150)
+        
+        scrollbar = ttk.Scrollbar(mods_frame.frame, orient=tk.VERTICAL, command=self.mods_tree.yview)
+        self.mods_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.mods_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    
+    def create_actions_section(self, parent):
+        actions_frame = RoundedFrame(parent, 1320, 80)
+        actions_frame.pack(fill=tk.X, pady=(0, 30))
+        
+        inner_frame = tk.Frame(actions_frame.frame, bg=CustomTkTheme.DARK_SECONDARY)
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        
+        check_updates_btn = RoundedButton(inner_frame, "Check for Updates", 
+                                         width=180,
+                                         height=40,
+                                         command=self.check_updates)
+        check_updates_btn.pack(side=tk.LEFT, padx=(0, 20))
+        
+        update_btn = RoundedButton(inner_frame, "Update Selected", 
+                                  width=180,
+                                  height=40,
+                                  command=self.update_selected)
+        update_btn.pack(side=tk.LEFT, padx=(0, 20))
+        
+        downgrade_btn = RoundedButton(inner_frame, "Downgrade Selected", 
+                                     width=180,
+                                     height=40,
+                                     command=self.downgrade_selected)
+        downgrade_btn.pack(side=tk.LEFT)
+        
+        self.auto_check_var = tk.StringVar(value="Off")
+        auto_check_box = ttk.Combobox(inner_frame, textvariable=self.auto_check_var, 
+                                      values=list(self.AUTO_CHECK_INTERVALS), 
+                                      state="readonly", width=18)
+        auto_check_box.pack(side=tk.RIGHT)
+        auto_check_box.bind("<<ComboboxSelected>>", lambda event: self.set_auto_check())
+        
+        auto_check_label = tk.Label(inner_frame, text="Auto-check:", 
+                                   bg=CustomTkTheme.DARK_SECONDARY, 
+                                   fg=CustomTkTheme.TEXT_SECONDARY,
+                                   font=("Segoe UI", 12))
+        auto_check_label.pack(side=tk.RIGHT, padx=(0, 10))
+    
+    def create_log_section(self, parent):
+        log_label = tk.Label(parent, text="Activity Log", 
+                            bg=CustomTkTheme.DARK_BG, 
+                            fg=CustomTkTheme.TEXT_PRIMARY,
+                            font=("Segoe UI", 18, "bold"))
+        log_label.pack(anchor=tk.W, pady=(0, 15))
+        
+        log_frame = RoundedFrame(parent, 1320, 180)
+        log_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.log_text = tk.Text(log_frame.frame, 
+                               height=8, 
+                               bg=CustomTkTheme.DARK_SECONDARY, 
+                               fg=CustomTkTheme.TEXT_PRIMARY,
+                               font=("Consolas", 11),
+                               bd=0,
+                               padx=15,
+                               pady=15,
+                               insertbackground=CustomTkTheme.TEXT_PRIMARY)
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+        
+        log_scrollbar = ttk.Scrollbar(log_frame.frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.log_text.config(state=tk.DISABLED)
+        self.root.after(self.LOG_POLL_MS, self.drain_log)
+        
+        self.log(f"Application started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.log(f"Default Minecraft version: {self.minecraft_version}")
+    
+    def browse_folder(self):
+        folder = filedialog.askdirectory(initialdir=self.folder_var.get())
+        if folder:
+            self.folder_var.set(folder)
+            self.mods_folder = folder
+            self.load_mods()
+    
+    def log(self, message: str, level: str = "INFO"):
+        self.log_sink.emit(message, level)
+    
+    def drain_log(self):
+        lines = self.log_sink.drain()
+        
+        if lines:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            
+            line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+            if line_count > self.LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{line_count - self.LOG_MAX_LINES + 1}.0")
+            
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        
+        self.root.after(1 if lines and not self.log_sink.queue.empty() else self.LOG_POLL_MS, self.drain_log)
+    
+    def get_scan_executor(self):
+        if self.scan_executor is None:
+            try:
+                self.scan_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            except (OSError, NotImplementedError) as e:
+                self.log(f"Parallel scanning unavailable: {e}", "WARNING")
+        return self.scan_executor
+    
+    def load_mods(self):
+        if self.scan_cancelled:
+            self.scan_cancelled.set()
+        if self.folder_watcher:
+            self.folder_watcher.stop()
+            self.folder_watcher = None
+        
+        self.mods_tree.delete(*[path for path in self.registry.records if self.mods_tree.exists(path)])
+        self.mods_tree.delete(*self.mods_tree.get_children())
+        self.registry.clear()
+        self.mod_filter.clear()
+        
+        folder = self.folder_var.get()
+        if not os.path.exists(folder):
+            self.log(f"Folder not found: {folder}")
+            return
+        
+        self.log(f"Loading mods from: {folder}")
+        
+        self.scan_generation += 1
+        self.watch_folder(folder, self.scan_generation)
+        self.scan_cancelled = threading.Event()
+        self.scan_total = 0
+        self.scan_loaded = 0
+        self.show_scan_progress(True)
+        
+        threading.Thread(
+            target=self._load_mods_thread, 
+            args=(folder, self.scan_generation, self.scan_cancelled), 
+            daemon=True
+        ).start()
+        
+        self.root.after(self.SCAN_POLL_MS, self._drain_scan_queue)
+    
+    def _load_mods_thread(self, folder: str, generation: int, cancelled: threading.Event):
+        def post(kind, payload=None):
+            self.scan_queue.put((generation, kind, payload))
+        
+        try:
+            jars = self.mod_index.list_jars(folder)
+            post("total", len(jars))
+            
+            self.mod_index.scan(
+                folder, 
+                jars=jars, 
+                executor=self.get_scan_executor(), 
+                on_entry=lambda entry: post("entry", entry), 
+                cancelled=cancelled
+            )
+            self.mod_index.save()
+        except OSError as e:
+            post("error", str(e))
+        except Exception as e:
+            post("error", f"{type(e).__name__}: {e}")
+        finally:
+            post("done", (dict(self.mod_index.last_scan), cancelled.is_set()))
+    
+    def _drain_scan_queue(self):
+        inserted = 0
+        done = None
+        
+        while inserted < self.SCAN_BATCH_SIZE:
+            try:
+                generation, kind, payload = self.scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if generation != self.scan_generation:
+                continue
+            
+            if kind == "total":
+                self.scan_total = payload
+                self.scan_progress.configure(maximum=max(payload, 1))
+                if not payload:
+                    self.log("No mod files (.jar) found in the folder.")
+                else:
+                    self.log(f"Found {payload} mod files.")
+            elif kind == "entry":
+                self.add_mod_row(payload)
+                self.scan_loaded += 1
+                inserted += 1
+            elif kind == "error":
+                self.log(f"Error scanning folder: {payload}", "ERROR")
+            elif kind == "done":
+                done = payload
+                break
+        
+        self.scan_progress.configure(value=self.scan_loaded)
+        self.scan_status_var.set(f"Scanning {self.scan_loaded}/{self.scan_total}")
+        
+        if done is None:
+            self.root.after(self.SCAN_POLL_MS if not inserted else 1, self._drain_scan_queue)
+            return
+        
+        stats, cancelled = done
+        self.show_scan_progress(False)
+        self.scan_cancelled = None
+        
+        if cancelled:
+            self.log(f"Scan cancelled after {self.scan_loaded} of {self.scan_total} mods.")
+        else:
+            self.log(f"Parsed {stats['parsed']} changed jars, reused {stats['cached']} from the index.")
+            self.log("Finished loading mods.")
+    
+    @staticmethod
+    def row_values(record: ModRecord):
+        latest_version = record.latest.get("version_number", "Unknown") if record.latest else "Not checked"
+        return (record.name, record.current_version or "Unknown", latest_version, 
+                record.loader or "Unknown", record.status)
+    
+    def refresh_row(self, record: ModRecord):
+        self.mod_filter.update(record)
+        self.schedule_view()
+        if self.mods_tree.exists(record.path):
+            self.mods_tree.item(record.path, values=self.row_values(record))
+    
+    def add_mod_row(self, entry: Dict):
+        record = self.registry.update_entry(entry)
+        
+        if self.mods_tree.exists(record.path):
+            self.refresh_row(record)
+        else:
+            self.mods_tree.insert("", tk.END, iid=record.path, values=self.row_values(record))
+            self.mod_filter.update(record)
+            self.schedule_view()
+    
+    def remove_mod_row(self, path: str):
+        self.registry.remove(path)
+        self.mod_filter.remove(path)
+        if self.mods_tree.exists(path):
+            self.mods_tree.delete(path)
+    
+    def is_view_active(self) -> bool:
+        return bool(self.sort_column or self.filter_var.get().strip())
+    
+    def schedule_view(self):
+        if self.view_pending or not self.is_view_active():
+            return
+        self.view_pending = True
+        self.root.after(self.VIEW_REFRESH_MS, self.apply_view)
+    
+    def apply_view(self):
+        self.view_pending = False
+        paths = self.mod_filter.search(self.filter_var.get())
+        if self.sort_column:
+            paths = self.mod_filter.sort(paths, self.sort_column, self.sort_descending)
+        self.mods_tree.set_children("", *paths)
+    
+    def sort_by(self, column: str):
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+        
+        for name, title in self.column_titles.items():
+            arrow = (" \u25bc" if self.sort_descending else " \u25b2") if name == column else ""
+            self.mods_tree.heading(name, text=title + arrow)
+        self.apply_view()
+    
+    def watch_folder(self, folder: str, generation: int):
+        self.folder_watcher = FolderWatcher(folder, lambda paths: self._folder_changed_thread(paths, generation))
+        self.folder_watcher.start()
+        self.log(f"Watching {folder} for changes ({self.folder_watcher.backend}).", "DEBUG")
+    
+    def _folder_changed_thread(self, paths, generation: int):
+        entries, removed = self.mod_index.refresh(paths, self.get_scan_executor())
+        stats = dict(self.mod_index.last_scan)
+        
+        try:
+            self.mod_index.save()
+        except OSError as e:
+            self.log(f"Could not save mod index: {e}", "WARNING")
+        
+        self.root.after(0, self.apply_folder_changes, generation, entries, removed, stats)
+    
+    def apply_folder_changes(self, generation: int, entries: List[Dict], removed: List[str], stats: Dict):
+        if generation != self.scan_generation:
+            return
+        
+        for path in removed:
+            self.remove_mod_row(path)
+        for entry in entries:
+            self.add_mod_row(entry)
+        
+        self.log(f"Folder changed: {len(entries)} added or modified ({stats['parsed']} parsed), {len(removed)} removed.")
+    
+    def show_scan_progress(self, visible: bool):
+        if visible:
+            self.scan_status_var.set("Scanning...")
+            self.scan_progress.configure(value=0)
+            self.scan_cancel_btn.pack(side=tk.RIGHT)
+            self.scan_progress.pack(side=tk.RIGHT, padx=(0, 15))
+            self.scan_status_label.pack(side=tk.RIGHT, padx=(0, 15))
+        else:
+            self.scan_cancel_btn.pack_forget()
+            self.scan_progress.pack_forget()
+            self.scan_status_label.pack_forget()
+    
+    def cancel_scan(self):
+        if self.scan_cancelled:
+            self.scan_cancelled.set()
+            self.log("Cancelling scan...")
+    
+    def check_updates(self):
+        if self.scan_cancelled:
+            messagebox.showinfo("Info", "Please wait for the mods folder scan to finish")
+            return
+        
+        if not self.registry:
+            messagebox.showinfo("Info", "No mods loaded")
+            return
+        
+        self.log("Checking for updates for all mods...")
+        
+        self.root.config(cursor="wait")
+        
+        threading.Thread(
+            target=self._check_updates_thread, 
+            args=(dict(self.registry.records), self.version_var.get()), 
+            daemon=True
+        ).start()
+    
+    def _check_updates_thread(self, mods: Dict[str, ModRecord], game_version: str):
+        checker = UpdateChecker(self.api, max_workers=self.check_concurrency, log=self.log)
+        
+        started = time.monotonic()
+        checker.check(
+            mods,
+            game_version,
+            lambda item, result: self.root.after(0, self.show_check_result, item, result)
+        )
+        
+        self.log(f"Update check completed in {time.monotonic() - started:.1f}s.")
+        
+        if self.api.cache:
+            stats = self.api.cache.stats
+            self.log(f"Response cache: {stats['hits']} hits, {stats['revalidated']} revalidated, {stats['misses']} misses.")
+        self.log(f"Session totals: {METRICS.describe()}.")
+        
+        self.root.after(0, lambda: self.root.config(cursor=""))
+    
+    def show_check_result(self, item, result: Dict):
+        record = self.registry.apply_result(item, result)
+        if record is None:
+            return
+        
+        if not result["latest"]:
+            self.log(f"No versions found for {result['name']}", "WARNING")
+            return
+        
+        self.refresh_row(record)
+    
+    def get_auto_check_ms(self) -> int:
+        return self.AUTO_CHECK_INTERVALS.get(self.auto_check_var.get(), 0) * 60 * 1000
+    
+    def set_auto_check(self):
+        if self.auto_check_job:
+            self.root.after_cancel(self.auto_check_job)
+            self.auto_check_job = None
+        
+        if self.get_auto_check_ms():
+            self.log(f"Automatic update checks: {self.auto_check_var.get().lower()}.")
+            self.auto_check_job = self.root.after(0, self.run_scheduled_check)
+        else:
+            self.log("Automatic update checks turned off.")
+    
+    def run_scheduled_check(self):
+        self.auto_check_job = None
+        interval = self.get_auto_check_ms()
+        if not interval:
+            return
+        
+        if self.scan_cancelled or not self.registry or self.auto_check_running:
+            self.auto_check_job = self.root.after(self.AUTO_CHECK_RETRY_MS, self.run_scheduled_check)
+            return
+        
+        folder = self.folder_var.get()
+        game_version = self.version_var.get()
+        state_path = UpdateScheduler.get_state_path(folder)
+        if not self.scheduler or self.scheduler.state_path != state_path or self.scheduler.game_version != game_version:
+            self.scheduler = UpdateScheduler(self.api, game_version, state_path, 
+                                             max_workers=self.check_concurrency, log=self.log)
+        
+        self.auto_check_running = True
+        threading.Thread(
+            target=self._scheduled_check_thread, 
+            args=(self.scheduler, dict(self.registry.records), self.scan_generation), 
+            daemon=True
+        ).start()
+    
+    def _scheduled_check_thread(self, scheduler: UpdateScheduler, mods: Dict[str, ModRecord], generation: int):
+        outcome = None
+        try:
+            outcome = scheduler.run_once(mods)
+        except Exception as e:
+            self.log(f"Scheduled update check failed: {e}", "ERROR")
+        
+        self.root.after(0, self.show_scheduled_result, outcome, generation)
+    
+    def show_scheduled_result(self, outcome: Optional[Dict], generation: int):
+        self.auto_check_running = False
+        interval = self.get_auto_check_ms()
+        if interval and not self.auto_check_job:
+            self.auto_check_job = self.root.after(interval, self.run_scheduled_check)
+        
+        if outcome is None or generation != self.scan_generation:
+            return
+        
+        for item, result in outcome["results"].items():
+            record = self.registry.get(item)
+            if record is None:
+                continue
+            if result["current"] is None:
+                result = dict(result, current=record.current)
+            self.registry.apply_result(item, result)
+            self.refresh_row(record)
+        
+        diff = outcome["diff"]
+        self.log(f"Scheduled check: {len(diff['new_updates'])} new updates, {diff['updates']} available "
+                 f"({len(diff['changed_projects'])} of {diff['projects']} projects changed).")
+        for entry in diff["new_updates"]:
+            self.log(f"Update available: {entry['name']} {entry['current_version']} -> {entry['latest_version']}")
+    
+    def update_selected(self):
+        self.install_selected(self.version_var.get(), "Updated")
+    
+    def downgrade_selected(self):
+        self.install_selected(None, "Downgraded")
+    
+    def install_selected(self, game_version: Optional[str], action: str):
+        selected = self.mods_tree.selection()
+        if not selected:
+            messagebox.showinfo("Info", "No mods selected")
+            return
+        
+        records = [self.registry.get(item) for item in selected if item in self.registry]
+        missing = [record for record in records if not record.project_id or record.get_versions(game_version) is None]
+        if not missing:
+            self.choose_versions(records, {}, game_version, action, self.scan_generation)
+            return
+        
+        self.root.config(cursor="wait")
+        threading.Thread(
+            target=self._lookup_versions_thread, 
+            args=(records, missing, game_version, action, self.scan_generation), 
+            daemon=True
+        ).start()
+    
+    def _lookup_versions_thread(self, records: List[ModRecord], missing: List[ModRecord], 
+                                game_version: Optional[str], action: str, generation: int):
+        lookups = {}
+        try:
+            checker = UpdateChecker(self.api, log=self.log)
+            unresolved = {record.path: record for record in missing if not record.project_id}
+            identified = checker.identify(unresolved) if unresolved else {}
+            
+            for record in missing:
+                project_id = record.project_id
+                if not project_id:
+                    if record.path in identified:
+                        project_id = identified[record.path].get("project_id")
+                    else:
+                        project = checker.search_project(record.name)
+                        project_id = project.get("project_id") if project else None
+                if not project_id:
+                    continue
+                
+                versions = record.get_versions(game_version)
+                if versions is None:
+                    versions = self.api.get_mod_versions(
+                        project_id, game_version, 
+                        loaders=self.api.get_compatible_loaders(checker.get_mod_loader(record, record.current))
+                    )
+                lookups[record.path] = (project_id, versions)
+        except Exception as e:
+            self.log(f"Could not look up versions: {e}", "ERROR")
+        
+        self.root.after(0, self.choose_versions, records, lookups, game_version, action, generation)
+    
+    def choose_versions(self, records: List[ModRecord], lookups: Dict[str, Tuple[str, List[Dict]]], 
+                        game_version: Optional[str], action: str, generation: int):
+        self.root.config(cursor="")
+        if generation != self.scan_generation:
+            return
+        
+        jobs = {}
+        for record in records:
+            if self.registry.get(record.path) is not record:
+                continue
+            
+            if record.path in lookups:
+                project_id, versions = lookups[record.path]
+                self.registry.set_project(record, project_id)
+                if versions:
+                    record.set_versions(game_version, versions)
+            
+            if not record.project_id:
+                continue
+            
+            versions = record.get_versions(game_version)
+            if not versions:
+                self.log(f"No versions found for {record.name}", "WARNING")
+                continue
+            
+            dialog = VersionSelectionDialog(self.root, f"Select version for {record.name}", versions)
+            
+            if dialog.selected_version:
+                selected_version = dialog.selected_version
+                self.log(f"Selected version {selected_version.get('version_number')} for {record.name}")
+                
+                jobs[record.path] = {
+                    "version": selected_version,
+                    "replace": record.path
+                }
+        
+        if not jobs:
+            return
+        
+        threading.Thread(
+            target=self._install_thread, 
+            args=(jobs, self.folder_var.get(), action, dict(self.registry.records), self.version_var.get()), 
+            daemon=True
+        ).start()
+    
+    def resolve_dependencies(self, jobs: Dict[str, Dict], mods: Dict[str, ModRecord], game_version: str):
+        resolution = self.resolver.resolve(mods, {key: job["version"] for key, job in jobs.items()}, game_version)
+        
+        for key, reason in resolution["held_back"].items():
+            del jobs[key]
+            self.log(f"Keeping {mods[key].name} at its installed version: {reason}", "WARNING")
+        for issue in resolution["issues"]:
+            self.log(DependencyResolver.describe_issue(issue), "WARNING")
+        for dependency in resolution["added"]:
+            self.log(f"Adding {dependency['name']} {dependency['version'].get('version_number')} "
+                     f"(required by {dependency['required_by']})")
+            jobs[f"dependency:{dependency['project_id']}"] = {"version": dependency["version"], "replace": None}
+    
+    def _install_thread(self, jobs: Dict[str, Dict], folder: str, action: str, 
+                        mods: Dict[str, ModRecord], game_version: str):
+        self.resolve_dependencies(jobs, mods, game_version)
+        if not jobs:
+            return
+        
+        self.log(f"Downloading {len(jobs)} mod(s)...")
+        installer = ModInstaller(self.api, log=self.log, store=self.jar_store)
+        
+        def on_done(item, path, error):
+            entry = None
+            if path:
+                try:
+                    entry = self.mod_index.get_entry(path)
+                except OSError as e:
+                    error = e
+            self.root.after(0, self.finish_install, item, jobs[item]["version"], entry, error, action)
+        
+        installer.install_many(jobs, folder, on_done)
+        
+        try:
+            self.mod_index.save()
+        except OSError as e:
+            self.log(f"Could not save mod index: {e}", "WARNING")
+    
+    def finish_install(self, item, version: Dict, entry: Optional[Dict], error: Optional[Exception], action: str):
+        previous = self.registry.get(item)
+        mod_name = previous.name if previous else version.get("name", "mod")
+        version_number = version.get('version_number')
+        
+        if error:
+            self.log(f"Failed to install {mod_name} {version_number}: {error}", "ERROR")
+            return
+        
+        record = ModRecord.from_entry(entry)
+        previous = previous or self.registry.get(record.path)
+        if previous:
+            self.registry.remove(item)
+            record.carry_over(previous)
+        record.current = version
+        if action == "Updated":
+            record.latest = version
+            record.status = "Up to date"
+        else:
+            record.status = action
+        self.registry.add(record)
+        
+        if record.path != item and self.mods_tree.exists(item):
+            position = self.mods_tree.index(item)
+            self.mods_tree.delete(item)
+            if self.mods_tree.exists(record.path):
+                self.mods_tree.delete(record.path)
+            self.mods_tree.insert("", position, iid=record.path, values=self.row_values(record))
+        elif self.mods_tree.exists(record.path):
+            self.refresh_row(record)
+        else:
+            self.mods_tree.insert("", tk.END, iid=record.path, values=self.row_values(record))
+        
+        self.mod_filter.remove(item)
+        self.mod_filter.update(record)
+        self.schedule_view()
+        
+        self.log(f"{action} {mod_name} to version {version_number}")
+
+
+def run(on_ready: Optional[Callable[[Dict[str, float]], None]] = None):
+    root = tk.Tk()
+    app = ModManagerApp(root, on_ready=on_ready)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    run()
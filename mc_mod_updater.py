@@ -1,810 +1,3625 @@
+import time
+START_TIME = time.perf_counter()
+
 import os
 import sys
 import json
+import re
 import zipfile
+import hashlib
+import importlib.util
+import mmap
+import random
+import select
+import struct
+import ctypes
+import ctypes.util
+import sqlite3
+import zlib
+import argparse
+import shutil
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib.parse import urlencode, urlparse
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import threading
-import datetime
-
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
-from tkinter.scrolledtext import ScrolledText
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-
-class CustomTkTheme:
-    DARK_BG = "#0f0f0f"
-    DARK_SECONDARY = "#1a1a1a"
-    DARK_TERTIARY = "#252525"
-    ACCENT = "#8c52ff"
-    ACCENT_HOVER = "#9d6fff"
-    TEXT_PRIMARY = "#ffffff"
-    TEXT_SECONDARY = "#b0b0b0"
-    SUCCESS = "#4ade80"
-    WARNING = "#facc15"
-    ERROR = "#f87171"
-    
-    @staticmethod
-    def apply_theme(root, style):
-        root.configure(bg=CustomTkTheme.DARK_BG)
-        
-        style.configure("TFrame", background=CustomTkTheme.DARK_BG)
-        
-        style.configure("Card.TFrame", 
-                       background=CustomTkTheme.DARK_SECONDARY,
-                       relief="flat",
-                       borderwidth=0)
-        
-        style.configure("TLabel", 
-                       background=CustomTkTheme.DARK_BG, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       font=("Segoe UI", 10))
-        
-        style.configure("Header.TLabel", 
-                       background=CustomTkTheme.DARK_BG, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       font=("Segoe UI", 18, "bold"))
-        
-        style.configure("Subheader.TLabel", 
-                       background=CustomTkTheme.DARK_BG, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       font=("Segoe UI", 14))
-        
-        style.configure("Card.TLabel", 
-                       background=CustomTkTheme.DARK_SECONDARY, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY)
-        
-        style.configure("TButton", 
-                       background=CustomTkTheme.ACCENT, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       font=("Segoe UI", 10, "bold"),
-                       borderwidth=0,
-                       focusthickness=0,
-                       padding=(15, 8))
-        
-        style.map("TButton", 
-                 background=[("active", CustomTkTheme.ACCENT_HOVER)],
-                 foreground=[("active", CustomTkTheme.TEXT_PRIMARY)])
-        
-        style.configure("Secondary.TButton", 
-                       background=CustomTkTheme.DARK_TERTIARY)
-        
-        style.map("Secondary.TButton", 
-                 background=[("active", "#333333")])
-        
-        style.configure("TEntry", 
-                       fieldbackground=CustomTkTheme.DARK_TERTIARY, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       borderwidth=0,
-                       padding=10)
-        
-        style.configure("Treeview", 
-                       background=CustomTkTheme.DARK_SECONDARY, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       fieldbackground=CustomTkTheme.DARK_SECONDARY,
-                       font=("Segoe UI", 10),
-                       borderwidth=0,
-                       rowheight=30)
-        
-        style.map("Treeview", 
-                 background=[("selected", CustomTkTheme.ACCENT)],
-                 foreground=[("selected", CustomTkTheme.TEXT_PRIMARY)])
-        
-        style.configure("Treeview.Heading", 
-                       background=CustomTkTheme.DARK_TERTIARY, 
-                       foreground=CustomTkTheme.TEXT_PRIMARY,
-                       font=("Segoe UI", 10, "bold"),
-                       borderwidth=0,
-                       padding=10)
-        
-        style.configure("TScrollbar", 
-                       background=CustomTkTheme.DARK_TERTIARY, 
-                       troughcolor=CustomTkTheme.DARK_BG,
-                       borderwidth=0,
-                       arrowsize=14,
-                       arrowcolor=CustomTkTheme.TEXT_PRIMARY)
-        
-        style.configure("TSeparator", 
-                       background=CustomTkTheme.DARK_TERTIARY)
-    
-    @staticmethod
-    def create_rounded_rectangle(width, height, radius, fill_color):
-        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        draw.rounded_rectangle([(0, 0), (width-1, height-1)], radius, fill=fill_color)
-        
-        return ImageTk.PhotoImage(image)
+import multiprocessing
+import queue
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
 
-class ModrinthAPI:
-    BASE_URL = "https://api.modrinth.com/v2"
-    USER_AGENT = "MinecraftModManager/1.0 (github.com/user/mod-manager)"
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DEFAULT_MINECRAFT_VERSION = "1.21.5"
+
+logger = logging.getLogger("mc_mod_updater")
+
+
+def get_default_mods_folder() -> str:
+    home = Path.home()
+    
+    if sys.platform == "win32":
+        return str(home / "AppData" / "Roaming" / ".minecraft" / "mods")
+    elif sys.platform == "darwin":
+        return str(home / "Library" / "Application Support" / "minecraft" / "mods")
+    else:
+        return str(home / ".minecraft" / "mods")
+
+
+def get_cache_dir() -> str:
+    home = Path.home()
+    
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local"))
+        return str(base / "MinecraftModManager" / "Cache")
+    elif sys.platform == "darwin":
+        return str(home / "Library" / "Caches" / "MinecraftModManager")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", home / ".cache"))
+        return str(base / "minecraft-mod-manager")
+
+
+def write_json_file(path: str, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as json_file:
+            json.dump(data, json_file, separators=(",", ":"))
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ResponseCache:
+    DEFAULT_TTLS = (
+        ("/version_files", 10 * 60),
+        ("/search", 60 * 60),
+        ("/projects", 15 * 60),
+        ("/versions", 60 * 60),
+        ("/project/", 30 * 60),
+    )
+    DEFAULT_TTL = 10 * 60
+    MAX_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self, path: str, max_bytes: int = MAX_BYTES, ttls=DEFAULT_TTLS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+        self.lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, body BLOB, etag TEXT, last_modified TEXT, "
+            "fetched_at REAL, accessed_at REAL, size INTEGER)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self.db.commit()
+        
+        self.total_size = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
     
     @staticmethod
-    def search_mod(query: str) -> List[Dict]:
-        headers = {"User-Agent": ModrinthAPI.USER_AGENT}
-        params = {
-            "query": query,
-            "limit": 10
+    def get_key(method: str, url: str, params: Optional[Dict] = None, body=None) -> str:
+        parts = [method.upper(), url]
+        if params:
+            parts.append(urlencode(sorted(params.items())))
+        if body is not None:
+            parts.append(json.dumps(body, sort_keys=True, separators=(",", ":")))
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+    
+    def get_ttl(self, url: str) -> float:
+        path = urlparse(url).path
+        for endpoint, ttl in self.ttls:
+            if endpoint in path:
+                return ttl
+        return self.DEFAULT_TTL
+    
+    def get(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.db.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            
+            self.db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.db.commit()
+        
+        url, body, etag, last_modified, fetched_at = row
+        return {
+            "url": url,
+            "body": zlib.decompress(body),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": time.time() - fetched_at < self.get_ttl(url)
         }
-        
-        try:
-            response = requests.get(
-                f"{ModrinthAPI.BASE_URL}/search", 
-                headers=headers,
-                params=params
+    
+    def put(self, key: str, url: str, body: bytes, etag: Optional[str] = None, 
+            last_modified: Optional[str] = None):
+        compressed = zlib.compress(body)
+        now = time.time()
+        
+        with self.lock:
+            row = self.db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, compressed, etag, last_modified, now, now, len(compressed))
             )
+            self.total_size += len(compressed) - (row[0] if row else 0)
+            self.stats["stores"] += 1
             
-            if response.status_code == 200:
-                return response.json()["hits"]
-            else:
-                print(f"Error searching mods: {response.status_code}, {response.text}")
-                return []
-        except Exception as e:
-            print(f"Exception during search: {e}")
-            return []
+            if self.total_size > self.max_bytes:
+                self._evict()
+            
+            self.db.commit()
     
-    @staticmethod
-    def get_mod_versions(mod_id: str, game_version: str = None) -> List[Dict]:
-        headers = {"User-Agent": ModrinthAPI.USER_AGENT}
-        url = f"{ModrinthAPI.BASE_URL}/project/{mod_id}/version"
+    def count(self, stat: str):
+        with self.lock:
+            self.stats[stat] += 1
+    
+    def touch(self, key: str):
+        with self.lock:
+            now = time.time()
+            self.db.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self.db.commit()
+    
+    def _evict(self):
+        target = self.max_bytes * 0.9
+        rows = self.db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
         
-        params = {}
-        if game_version:
-            params["game_versions"] = f"[\"{game_version}\"]"
+        evicted = []
+        for key, size in rows:
+            if self.total_size <= target:
+                break
+            evicted.append((key,))
+            self.total_size -= size
         
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Error getting mod versions: {response.status_code}, {response.text}")
-                return []
-        except Exception as e:
-            print(f"Exception getting versions: {e}")
-            return []
+        self.db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.stats["evictions"] += len(evicted)
+    
+    def clear(self):
+        with self.lock:
+            self.db.execute("DELETE FROM responses")
+            self.db.commit()
+            self.total_size = 0
+    
+    def close(self):
+        with self.lock:
+            self.db.close()
+    
+    @staticmethod
+    def to_response(entry: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry["url"]
+        response._content = entry["body"]
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.encoding = "utf-8"
+        response.from_cache = True
+        return response
 
 
-class ModAnalyzer:
+class MetadataSnapshot:
+    FORMAT_VERSION = 1
+    DEPENDENCY_DEPTH = 8
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+            "CREATE TABLE IF NOT EXISTS projects ("
+            "project_id TEXT PRIMARY KEY, slug TEXT, title TEXT, updated TEXT, body BLOB);"
+            "CREATE INDEX IF NOT EXISTS projects_slug ON projects (slug);"
+            "CREATE TABLE IF NOT EXISTS versions ("
+            "version_id TEXT PRIMARY KEY, project_id TEXT, date_published TEXT, body BLOB);"
+            "CREATE INDEX IF NOT EXISTS versions_project ON versions (project_id, date_published);"
+            "CREATE TABLE IF NOT EXISTS files ("
+            "hash TEXT, algorithm TEXT, version_id TEXT, PRIMARY KEY (algorithm, hash));"
+            "CREATE INDEX IF NOT EXISTS files_version ON files (version_id);"
+        )
+        self.db.execute("INSERT OR IGNORE INTO meta VALUES ('version', ?)", (str(self.FORMAT_VERSION),))
+        self.db.commit()
+    
     @staticmethod
-    def get_mod_info_from_jar(jar_path: str) -> Dict:
-        try:
-            with zipfile.ZipFile(jar_path, 'r') as jar:
-                if "META-INF/mods.toml" in jar.namelist():
-                    with jar.open("META-INF/mods.toml") as toml_file:
-                        content = toml_file.read().decode('utf-8')
-                        mod_id = None
-                        version = None
-                        display_name = None
-                        
-                        for line in content.split('\n'):
-                            line = line.strip()
-                            if line.startswith("modId"):
-                                mod_id = line.split('=')[1].strip().strip('"\'')
-                            elif line.startswith("version"):
-                                version = line.split('=')[1].strip().strip('"\'')
-                            elif line.startswith("displayName"):
-                                display_name = line.split('=')[1].strip().strip('"\'')
-                        
-                        return {
-                            "mod_id": mod_id,
-                            "version": version,
-                            "name": display_name,
-                            "type": "forge"
-                        }
-                
-                elif "fabric.mod.json" in jar.namelist():
-                    with jar.open("fabric.mod.json") as json_file:
-                        data = json.loads(json_file.read().decode('utf-8'))
-                        return {
-                            "mod_id": data.get("id"),
-                            "version": data.get("version"),
-                            "name": data.get("name"),
-                            "type": "fabric"
-                        }
-                
-                return {
-                    "mod_id": None,
-                    "version": None,
-                    "name": os.path.basename(jar_path).replace(".jar", ""),
-                    "type": "unknown"
-                }
-        except Exception as e:
-            print(f"Error analyzing JAR file {jar_path}: {e}")
+    def pack(data) -> bytes:
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+    
+    @staticmethod
+    def unpack(body: bytes):
+        return json.loads(zlib.decompress(body))
+    
+    def close(self):
+        with self.lock:
+            self.db.close()
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        with self.lock:
+            row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def get_counts(self) -> Dict[str, int]:
+        with self.lock:
             return {
-                "mod_id": None,
-                "version": None,
-                "name": os.path.basename(jar_path).replace(".jar", ""),
-                "type": "error",
-                "error": str(e)
+                table: self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("projects", "versions", "files")
             }
+    
+    def get_updated(self) -> Dict[str, str]:
+        with self.lock:
+            return dict(self.db.execute("SELECT project_id, updated FROM projects"))
+    
+    def store_project(self, project: Dict, versions: List[Dict]):
+        with self.lock:
+            self.db.execute(
+                "DELETE FROM files WHERE version_id IN (SELECT version_id FROM versions WHERE project_id = ?)", 
+                (project["id"],)
+            )
+            self.db.execute("DELETE FROM versions WHERE project_id = ?", (project["id"],))
+            self.db.execute(
+                "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?)",
+                (project["id"], project.get("slug"), project.get("title"), project.get("updated"), self.pack(project))
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?)",
+                [(version["id"], project["id"], version.get("date_published"), self.pack(version)) for version in versions]
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                [
+                    (digest, algorithm, version["id"])
+                    for version in versions
+                    for file_info in version.get("files", [])
+                    for algorithm, digest in file_info.get("hashes", {}).items()
+                ]
+            )
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('refreshed_at', ?)", (str(time.time()),))
+            self.db.commit()
+    
+    def get_project(self, project_id: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.db.execute(
+                "SELECT body FROM projects WHERE project_id = ? OR slug = ?", (project_id, project_id)
+            ).fetchone()
+        return self.unpack(row[0]) if row else None
+    
+    def get_projects(self, project_ids: List[str]) -> Dict[str, Dict]:
+        projects = {}
+        for project_id in project_ids:
+            project = self.get_project(project_id)
+            if project:
+                projects[project["id"]] = project
+        return projects
+    
+    def get_versions(self, version_ids: List[str]) -> Dict[str, Dict]:
+        versions = {}
+        with self.lock:
+            for version_id in version_ids:
+                row = self.db.execute("SELECT body FROM versions WHERE version_id = ?", (version_id,)).fetchone()
+                if row:
+                    versions[version_id] = self.unpack(row[0])
+        return versions
+    
+    def get_project_versions(self, project_id: str) -> List[Dict]:
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT versions.body FROM versions JOIN projects USING (project_id) "
+                "WHERE projects.project_id = ? OR projects.slug = ? ORDER BY versions.date_published DESC",
+                (project_id, project_id)
+            ).fetchall()
+        return [self.unpack(row[0]) for row in rows]
+    
+    @staticmethod
+    def matches(version: Dict, loaders: Optional[List[str]] = None, game_versions: Optional[List[str]] = None) -> bool:
+        if loaders and not set(loaders) & set(version.get("loaders", [])):
+            return False
+        if game_versions and not set(game_versions) & set(version.get("game_versions", [])):
+            return False
+        return True
+    
+    def get_versions_from_hashes(self, hashes: List[str], algorithm: str = "sha1") -> Dict[str, Dict]:
+        results = {}
+        with self.lock:
+            for digest in hashes:
+                row = self.db.execute(
+                    "SELECT versions.body FROM files JOIN versions USING (version_id) "
+                    "WHERE files.algorithm = ? AND files.hash = ?", (algorithm, digest)
+                ).fetchone()
+                if row:
+                    results[digest] = self.unpack(row[0])
+        return results
+    
+    def get_latest_versions_from_hashes(self, hashes: List[str], loaders: Optional[List[str]] = None, 
+                                        game_versions: Optional[List[str]] = None, 
+                                        algorithm: str = "sha1") -> Dict[str, Dict]:
+        results = {}
+        latest = {}
+        for digest, version in self.get_versions_from_hashes(hashes, algorithm).items():
+            project_id = version["project_id"]
+            if project_id not in latest:
+                latest[project_id] = next(
+                    (candidate for candidate in self.get_project_versions(project_id) 
+                     if self.matches(candidate, loaders, game_versions)), 
+                    None
+                )
+            if latest[project_id]:
+                results[digest] = latest[project_id]
+        return results
+    
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        pattern = f"%{query.lower()}%"
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT project_id, slug, title FROM projects WHERE LOWER(title) LIKE ? OR LOWER(slug) LIKE ? "
+                "ORDER BY LOWER(title) = ? DESC, LENGTH(title) LIMIT ?", 
+                (pattern, pattern, query.lower(), limit)
+            ).fetchall()
+        return [{"project_id": project_id, "slug": slug, "title": title} for project_id, slug, title in rows]
+    
+    def refresh(self, api, project_ids: List[str], dependencies: bool = True, 
+                log: Callable[[str], None] = print) -> Dict[str, int]:
+        stats = {"checked": 0, "updated": 0, "unchanged": 0, "versions": 0, "missing": 0}
+        known = self.get_updated()
+        pending = list(dict.fromkeys(project_ids))
+        seen = set()
+        
+        for _ in range(self.DEPENDENCY_DEPTH if dependencies else 1):
+            pending = [project_id for project_id in pending if project_id not in seen]
+            if not pending:
+                break
+            seen.update(pending)
+            
+            projects = api.get_projects(pending, revalidate=True)
+            seen.update(projects)
+            stats["checked"] += len(projects)
+            stats["missing"] += len([project_id for project_id in pending if project_id not in projects and 
+                                     not any(project.get("slug") == project_id for project in projects.values())])
+            
+            changed = [project for project in projects.values() if known.get(project["id"]) != project.get("updated")]
+            stats["unchanged"] += len(projects) - len(changed)
+            
+            version_ids = [version_id for project in changed for version_id in project.get("versions", [])]
+            versions = api.get_versions(version_ids, revalidate=True) if version_ids else {}
+            by_project = {}
+            for version in versions.values():
+                by_project.setdefault(version["project_id"], []).append(version)
+            
+            for project in changed:
+                self.store_project(project, by_project.get(project["id"], []))
+                stats["updated"] += 1
+                stats["versions"] += len(by_project.get(project["id"], []))
+            
+            log(f"Snapshot: {len(changed)} of {len(projects)} projects changed, {len(versions)} versions fetched.")
+            
+            pending = [
+                dependency["project_id"]
+                for project in changed
+                for version in by_project.get(project["id"], [])
+                for dependency in version.get("dependencies") or []
+                if dependency.get("dependency_type") == "required" and dependency.get("project_id")
+            ]
+        
+        return stats
 
 
-class RoundedButton(tk.Canvas):
-    def __init__(self, parent, text, command=None, width=120, height=36, 
-                 bg_color=CustomTkTheme.ACCENT, hover_color=CustomTkTheme.ACCENT_HOVER, 
-                 text_color=CustomTkTheme.TEXT_PRIMARY, **kwargs):
-        super().__init__(parent, width=width, height=height, 
-                         bg=CustomTkTheme.DARK_BG, highlightthickness=0, **kwargs)
-        
-        self.bg_color = bg_color
-        self.hover_color = hover_color
-        self.text_color = text_color
-        self.command = command
-        self.text = text
-        
-        self.normal_bg = CustomTkTheme.create_rounded_rectangle(width, height, 8, bg_color)
-        self.hover_bg = CustomTkTheme.create_rounded_rectangle(width, height, 8, hover_color)
-        
-        self.bg_img = self.create_image(width//2, height//2, image=self.normal_bg)
-        self.text_id = self.create_text(width//2, height//2, text=text, 
-                                       fill=text_color, font=("Segoe UI", 10, "bold"))
-        
-        self.bind("<Enter>", self.on_enter)
-        self.bind("<Leave>", self.on_leave)
-        self.bind("<Button-1>", self.on_click)
+class Metrics:
+    PREFIX = "mc_mod_updater"
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def get_key(name: str, labels: Dict) -> Tuple:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        key = self.get_key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def set(self, name: str, value: float, **labels):
+        key = self.get_key(name, labels)
+        with self.lock:
+            self.gauges[key] = value
+    
+    def observe(self, name: str, value: float, **labels):
+        key = self.get_key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {"count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * len(self.BUCKETS)}
+            
+            histogram["count"] += 1
+            histogram["sum"] += value
+            histogram["max"] = max(histogram["max"], value)
+            for position, bound in enumerate(self.BUCKETS):
+                if value <= bound:
+                    histogram["buckets"][position] += 1
+    
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+    
+    def get_counter(self, name: str, **labels) -> float:
+        with self.lock:
+            return sum(
+                value for (counter, counter_labels), value in self.counters.items()
+                if counter == name and set(labels.items()) <= set(counter_labels)
+            )
+    
+    @classmethod
+    def get_quantile(cls, histogram: Dict, fraction: float) -> float:
+        target = histogram["count"] * fraction
+        for position, bound in enumerate(cls.BUCKETS):
+            if histogram["buckets"][position] >= target:
+                return bound
+        return histogram["max"]
+    
+    def summary(self) -> Dict:
+        def label_text(labels: Tuple) -> str:
+            return ",".join(f"{key}={value}" for key, value in labels)
+        
+        with self.lock:
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                counters.setdefault(name, {})[label_text(labels)] = value
+            
+            gauges = {}
+            for (name, labels), value in sorted(self.gauges.items()):
+                gauges.setdefault(name, {})[label_text(labels)] = value
+            
+            histograms = {}
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                histograms.setdefault(name, {})[label_text(labels)] = {
+                    "count": histogram["count"],
+                    "sum": round(histogram["sum"], 6),
+                    "mean": round(histogram["sum"] / histogram["count"], 6),
+                    "p50": self.get_quantile(histogram, 0.5),
+                    "p95": self.get_quantile(histogram, 0.95),
+                    "max": round(histogram["max"], 6)
+                }
         
-    def on_enter(self, event):
-        self.itemconfig(self.bg_img, image=self.hover_bg)
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+    
+    def to_prometheus(self) -> str:
+        def label_text(labels, extra=()) -> str:
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            escaped = (
+                str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs
+            )
+            return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+        
+        lines = []
+        with self.lock:
+            typed = set()
+            for kind, values in (("counter", self.counters), ("gauge", self.gauges)):
+                for (name, labels), value in sorted(values.items()):
+                    metric = f"{self.PREFIX}_{name}"
+                    if metric not in typed:
+                        lines.append(f"# TYPE {metric} {kind}")
+                        typed.add(metric)
+                    lines.append(f"{metric}{label_text(labels)} {value}")
+            
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                metric = f"{self.PREFIX}_{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} histogram")
+                    typed.add(metric)
+                for bound, count in zip(self.BUCKETS, histogram["buckets"]):
+                    lines.append(f"{metric}_bucket{label_text(labels, [('le', bound)])} {count}")
+                lines.append(f"{metric}_bucket{label_text(labels, [('le', '+Inf')])} {histogram['count']}")
+                lines.append(f"{metric}_sum{label_text(labels)} {histogram['sum']}")
+                lines.append(f"{metric}_count{label_text(labels)} {histogram['count']}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def describe(self) -> str:
+        summary = self.summary()
+        requests_made = sum(summary["counters"].get("api_requests_total", {}).values())
+        received = sum(summary["counters"].get("api_response_bytes_total", {}).values())
+        latency = summary["histograms"].get("api_request_seconds", {}).values()
+        total_seconds = sum(item["sum"] for item in latency)
+        cache_hits = self.get_counter("api_cache_total", result="hit")
+        retries = sum(summary["counters"].get("api_retries_total", {}).values())
+        waited = sum(item["sum"] for item in summary["histograms"].get("rate_limit_wait_seconds", {}).values())
+        
+        mean_ms = total_seconds / requests_made * 1000 if requests_made else 0.0
+        return (f"{requests_made} API requests ({received / 1024:.0f} KiB, mean {mean_ms:.0f} ms), "
+                f"{cache_hits:.0f} cache hits, {retries:.0f} retries, {waited:.1f}s rate-limit waits")
+    
+    @staticmethod
+    def write_file(path: str, text: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(text)
+        os.replace(temp_path, path)
     
-    def on_leave(self, event):
-        self.itemconfig(self.bg_img, image=self.normal_bg)
+    def write_json(self, path: str):
+        self.write_file(path, json.dumps(self.summary(), indent=2) + "\n")
     
-    def on_click(self, event):
-        if self.command:
-            self.command()
+    def write_prometheus(self, path: str):
+        self.write_file(path, self.to_prometheus())
 
 
-class RoundedFrame(tk.Canvas):
-    def __init__(self, parent, width, height, bg_color=CustomTkTheme.DARK_SECONDARY, **kwargs):
-        super().__init__(parent, width=width, height=height, 
-                         bg=CustomTkTheme.DARK_BG, highlightthickness=0, **kwargs)
-        
-        self.bg_img = CustomTkTheme.create_rounded_rectangle(width, height, 10, bg_color)
-        self.create_image(width//2, height//2, image=self.bg_img)
-        
-        self.frame = tk.Frame(self, bg=bg_color)
-        self.frame.place(x=10, y=10, width=width-20, height=height-20)
+METRICS = Metrics()
 
 
-class StatusBadge(tk.Canvas):
-    def __init__(self, parent, text, status_type="normal", **kwargs):
-        if status_type == "success":
-            bg_color = CustomTkTheme.SUCCESS
-            text_color = "#000000"
-        elif status_type == "warning":
-            bg_color = CustomTkTheme.WARNING
-            text_color = "#000000"
-        elif status_type == "error":
-            bg_color = CustomTkTheme.ERROR
-            text_color = "#000000"
-        else:
-            bg_color = CustomTkTheme.DARK_TERTIARY
-            text_color = CustomTkTheme.TEXT_PRIMARY
-        
-        text_width = len(text) * 7 + 20
-        width = max(text_width, 80)
-        height = 24
-        
-        super().__init__(parent, width=width, height=height, 
-                         bg=CustomTkTheme.DARK_SECONDARY, highlightthickness=0, **kwargs)
-        
-        self.bg_img = CustomTkTheme.create_rounded_rectangle(width, height, 12, bg_color)
-        self.create_image(width//2, height//2, image=self.bg_img)
-        
-        self.create_text(width//2, height//2, text=text, 
-                        fill=text_color, font=("Segoe UI", 9, "bold"))
+class LogSink:
+    LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+    CAPACITY = 2000
+    
+    def __init__(self, capacity: int = CAPACITY, level: str = "INFO", 
+                 file_path: Optional[str] = None, echo: bool = False):
+        self.queue = queue.Queue()
+        self.records = deque(maxlen=capacity)
+        self.level = self.LEVELS.get(level.upper(), self.LEVELS["INFO"])
+        self.echo = echo
+        self.file = open(file_path, 'a', encoding='utf-8') if file_path else None
+    
+    def emit(self, message: str, level: str = "INFO"):
+        if self.LEVELS.get(level, 0) >= self.level:
+            self.queue.put((time.time(), level, message))
+    
+    @staticmethod
+    def format(record: Tuple[float, str, str]) -> str:
+        created, level, message = record
+        timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+        if level == "INFO":
+            return f"[{timestamp}] {message}"
+        return f"[{timestamp}] {level}: {message}"
+    
+    def drain(self, limit: int = 500) -> List[str]:
+        lines = []
+        while len(lines) < limit:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.records.append(record)
+            lines.append(self.format(record))
+        
+        if lines:
+            text = "\n".join(lines)
+            if self.file:
+                self.file.write(text + "\n")
+                self.file.flush()
+            if self.echo:
+                print(text)
+        
+        return lines
+    
+    def close(self):
+        self.drain(limit=sys.maxsize)
+        if self.file:
+            self.file.close()
+            self.file = None
 
 
-class VersionSelectionDialog(tk.Toplevel):
-    def __init__(self, parent, title, versions):
-        super().__init__(parent)
-        self.title(title)
-        self.geometry("700x600")
-        self.resizable(True, True)
-        self.transient(parent)
-        self.grab_set()
-        
-        self.configure(bg=CustomTkTheme.DARK_BG)
-        
-        self.versions = versions
-        self.selected_version = None
-        
-        self.create_ui()
-        
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        
-        self.wait_window()
+class SinkHandler(logging.Handler):
+    def __init__(self, sink: LogSink):
+        super().__init__()
+        self.sink = sink
     
-    def create_ui(self):
-        main_frame = tk.Frame(self, bg=CustomTkTheme.DARK_BG)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
-        
-        header_label = tk.Label(main_frame, text="Select Version", 
-                               bg=CustomTkTheme.DARK_BG, 
-                               fg=CustomTkTheme.TEXT_PRIMARY,
-                               font=("Segoe UI", 18, "bold"))
-        header_label.pack(anchor=tk.W, pady=(0, 25))
-        
-        columns = ("version", "mc_version", "date")
-        
-        tree_frame = RoundedFrame(main_frame, 640, 420)
-        tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 25))
-        
-        self.versions_tree = ttk.Treeview(tree_frame.frame, columns=columns, show="headings")
-        
-        self.versions_tree.heading("version", text="Version")
-        self.versions_tree.heading("mc_version", text="Minecraft Version")
-        self.versions_tree.heading("date", text="Release Date")
-        
-        self.versions_tree.column("version", width=200)
-        self.versions_tree.column("mc_version", width=200)
-        self.versions_tree.column("date", width=200)
-        
-        scrollbar = ttk.Scrollbar(tree_frame.frame, orient=tk.VERTICAL, command=self.versions_tree.yview)
-        self.versions_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.versions_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        for version in self.versions:
-            version_number = version.get("version_number", "Unknown")
-            game_versions = ", ".join(version.get("game_versions", ["Unknown"]))
-            date_published = version.get("date_published", "Unknown").split("T")[0]
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.sink.emit(record.getMessage(), record.levelname)
+        except Exception:
+            self.handleError(record)
+
+
+class RateLimiter:
+    def __init__(self, rate: float = 10.0, burst: int = 20, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
             
-            self.versions_tree.insert("", tk.END, values=(
-                version_number,
-                game_versions,
-                date_published
-            ))
-        
-        self.versions_tree.bind("<Double-1>", self.on_version_select)
-        
-        buttons_frame = tk.Frame(main_frame, bg=CustomTkTheme.DARK_BG)
-        buttons_frame.pack(fill=tk.X)
-        
-        cancel_btn = RoundedButton(buttons_frame, "Cancel", 
-                                  command=self.destroy, 
-                                  width=140,
-                                  height=40,
-                                  bg_color=CustomTkTheme.DARK_TERTIARY,
-                                  hover_color="#333333")
-        cancel_btn.pack(side=tk.RIGHT, padx=(15, 0))
-        
-        select_btn = RoundedButton(buttons_frame, "Select", 
-                                  command=self.on_select_button,
-                                  width=140,
-                                  height=40)
-        select_btn.pack(side=tk.RIGHT)
+            time.sleep(wait)
+            waited += wait
     
-    def on_version_select(self, event):
-        self.on_select_button()
+    def pause(self, seconds: float):
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
     
-    def on_select_button(self):
-        selected = self.versions_tree.selection()
-        if not selected:
-            messagebox.showinfo("Info", "No version selected")
+    def update_from_headers(self, headers):
+        try:
+            remaining = int(headers["X-Ratelimit-Remaining"])
+            reset = float(headers["X-Ratelimit-Reset"])
+        except (KeyError, TypeError, ValueError):
             return
         
-        values = self.versions_tree.item(selected[0], "values")
-        version_number = values[0]
-        
-        for version in self.versions:
-            if version.get("version_number") == version_number:
-                self.selected_version = version
-                break
-        
-        self.destroy()
+        with self.lock:
+            if remaining <= 0:
+                self.paused_until = max(self.paused_until, time.monotonic() + reset)
+            elif reset > 0:
+                self.rate = max(self.min_rate, min(self.max_rate, remaining / reset))
+            else:
+                self.rate = self.max_rate
 
 
-class ModManagerApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Minecraft Mod Manager")
-        
-        self.root.geometry("1400x900")
-        self.root.minsize(1200, 800)
-        
-        self.center_window()
-        
-        self.minecraft_version = "1.21.5"
+class VersionRecord:
+    __slots__ = (
+        "id", "project_id", "name", "version_number", "version_type", "loaders", 
+        "game_versions", "date_published", "featured", "dependencies", "files"
+    )
+    FILE_FIELDS = ("url", "filename", "hashes", "primary", "size")
+    
+    def __init__(self, data: Dict):
+        self.id = data.get("id")
+        self.project_id = data.get("project_id")
+        self.name = data.get("name")
+        self.version_number = data.get("version_number")
+        self.version_type = data.get("version_type")
+        self.loaders = tuple(data.get("loaders") or ())
+        self.game_versions = tuple(data.get("game_versions") or ())
+        self.date_published = data.get("date_published")
+        self.featured = data.get("featured", False)
+        self.dependencies = [
+            {"project_id": dependency.get("project_id"), "version_id": dependency.get("version_id"), 
+             "dependency_type": dependency.get("dependency_type")}
+            for dependency in data.get("dependencies") or []
+        ]
+        self.files = [
+            {field: file_info.get(field) for field in self.FILE_FIELDS}
+            for file_info in data.get("files") or []
+        ]
+    
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def __repr__(self) -> str:
+        return f"VersionRecord({self.id!r}, {self.version_number!r})"
+    
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class ModrinthAPI:
+    BASE_URL = "https://api.modrinth.com/v2"
+    USER_AGENT = "MinecraftModManager/1.0 (github.com/user/mod-manager)"
+    HASH_CHUNK_SIZE = 1000
+    ID_CHUNK_SIZE = 200
+    LOADERS = ("forge", "neoforge", "fabric", "quilt")
+    LOADER_FALLBACKS = {"quilt": ("quilt", "fabric")}
+    CHANNELS = ("release", "beta", "alpha")
+    MAX_RETRIES = 4
+    BACKOFF_BASE = 0.5
+    BACKOFF_CAP = 30.0
+    RETRY_STATUSES = (500, 502, 503, 504)
+    TIMEOUT = (5.0, 30.0)
+    POOL_SIZE = 16
+    
+    def __init__(self, base_url: str = BASE_URL, timeout: Tuple[float, float] = TIMEOUT, 
+                 retries: int = MAX_RETRIES, pool_size: int = POOL_SIZE, 
+                 rate_limiter: Optional[RateLimiter] = None, 
+                 cache: Optional[ResponseCache] = None, metrics: Optional[Metrics] = None, 
+                 snapshot: Optional[MetadataSnapshot] = None):
+        self.base_url = base_url.rstrip("/")
+        self.base_path = urlparse(self.base_url).path
+        self.timeout = timeout
+        self.retries = retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.metrics = metrics or METRICS
+        self.snapshot = snapshot
+        self.errors = 0
+        self.errors_lock = threading.Lock()
+        
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": self.USER_AGENT,
+            "Accept-Encoding": self.get_accept_encoding()
+        })
+        
+        # Retries happen in request(), where they are jittered and go through the rate limiter.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    @staticmethod
+    def get_accept_encoding() -> str:
+        if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+            return "gzip, deflate, br"
+        return "gzip, deflate"
+    
+    def close(self):
+        self.session.close()
+        if self.snapshot:
+            self.snapshot.close()
+    
+    def offline(self, endpoint: str) -> bool:
+        if self.snapshot is None:
+            return False
+        self.metrics.inc("api_snapshot_total", endpoint=endpoint)
+        return True
+    
+    def get_retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        for header in ("Retry-After", "X-Ratelimit-Reset"):
+            value = response.headers.get(header) if response is not None else None
+            if value:
+                try:
+                    return float(value) + random.uniform(0, self.BACKOFF_BASE)
+                except ValueError:
+                    pass
+        
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt))
+    
+    def record_error(self, message: str):
+        logger.error(message)
+        self.metrics.inc("api_errors_total")
+        with self.errors_lock:
+            self.errors += 1
+    
+    def get_endpoint(self, url: str) -> str:
+        path = urlparse(url).path
+        if path.startswith(self.base_path):
+            path = path[len(self.base_path):]
+        
+        parts = path.strip("/").split("/")
+        if len(parts) > 1 and parts[0] in ("project", "version", "version_file", "team", "user"):
+            parts[1] = "{id}"
+        return "/" + "/".join(parts)
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        endpoint = self.get_endpoint(url)
+        
+        for attempt in range(self.retries + 1):
+            waited = self.rate_limiter.acquire()
+            if waited:
+                self.metrics.observe("rate_limit_wait_seconds", waited, reason="throttle")
+            
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retries:
+                    raise
+                delay = self.get_retry_delay(attempt)
+                self.metrics.inc("api_retries_total", endpoint=endpoint, reason="connection")
+                logger.info(f"Request to {endpoint} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            self.metrics.observe("api_request_seconds", time.perf_counter() - started, endpoint=endpoint)
+            self.metrics.inc("api_requests_total", endpoint=endpoint, method=method, status=response.status_code)
+            self.metrics.inc("api_response_bytes_total", len(response.content), endpoint=endpoint)
+            
+            self.rate_limiter.update_from_headers(response.headers)
+            
+            if response.status_code == 429:
+                reason = "429"
+            elif response.status_code in self.RETRY_STATUSES:
+                reason = "5xx"
+            else:
+                return response
+            
+            if attempt == self.retries:
+                return response
+            
+            delay = self.get_retry_delay(attempt, response if reason == "429" else None)
+            self.metrics.inc("api_retries_total", endpoint=endpoint, reason=reason)
+            if reason == "429":
+                self.metrics.observe("rate_limit_wait_seconds", delay, reason="429")
+                logger.info(f"Rate limited on {endpoint}, retrying in {delay:.1f}s")
+                self.rate_limiter.pause(delay)
+            else:
+                logger.info(f"{endpoint} returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
         
-        self.style = ttk.Style()
-        CustomTkTheme.apply_theme(root, self.style)
+        return response
+    
+    def cached_request(self, method: str, url: str, params: Optional[Dict] = None, 
+                       json: Optional[Dict] = None, revalidate: bool = False) -> requests.Response:
+        if self.cache is None:
+            return self.request(method, url, params=params, json=json)
+        
+        key = self.cache.get_key(method, url, params, json)
+        entry = self.cache.get(key)
+        endpoint = self.get_endpoint(url)
+        
+        if entry and entry["fresh"] and not revalidate:
+            self.cache.count("hits")
+            self.metrics.inc("api_cache_total", endpoint=endpoint, result="hit")
+            return self.cache.to_response(entry)
+        
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        
+        response = self.request(method, url, params=params, json=json, headers=headers)
+        
+        if response.status_code == 304 and entry:
+            self.cache.touch(key)
+            self.cache.count("revalidated")
+            self.metrics.inc("api_cache_total", endpoint=endpoint, result="revalidated")
+            return self.cache.to_response(entry)
+        
+        self.cache.count("misses")
+        self.metrics.inc("api_cache_total", endpoint=endpoint, result="miss")
+        if response.status_code == 200:
+            self.cache.put(
+                key, url, response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified")
+            )
         
-        self.mods_folder = self.get_default_mods_folder()
+        return response
+    
+    def search_mod(self, query: str) -> List[Dict]:
+        if self.offline("/search"):
+            return self.snapshot.search(query)
         
-        self.create_ui()
+        params = {
+            "query": query,
+            "limit": 10
+        }
         
-        self.load_mods()
+        try:
+            response = self.cached_request(
+                "GET",
+                f"{self.base_url}/search", 
+                params=params
+            )
+            
+            if response.status_code == 200:
+                return response.json()["hits"]
+            else:
+                self.record_error(f"Error searching mods: {response.status_code}, {response.text}")
+                return []
+        except Exception as e:
+            self.record_error(f"Exception during search: {e}")
+            return []
     
-    def center_window(self):
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"+{x}+{y}")
+    @classmethod
+    def get_compatible_loaders(cls, loader: Optional[str]) -> Optional[List[str]]:
+        if not loader:
+            return None
+        return list(cls.LOADER_FALLBACKS.get(loader, (loader,)))
     
-    def get_default_mods_folder(self) -> str:
-        home = Path.home()
-        
-        if sys.platform == "win32":
-            return str(home / "AppData" / "Roaming" / ".minecraft" / "mods")
-        elif sys.platform == "darwin":
-            return str(home / "Library" / "Application Support" / "minecraft" / "mods")
-        else:
-            return str(home / ".minecraft" / "mods")
-    
-    def create_ui(self):
-        container = tk.Frame(self.root, bg=CustomTkTheme.DARK_BG)
-        container.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
-        
-        self.create_header(container)
-        
-        self.create_folder_section(container)
-        
-        self.create_mods_section(container)
-        
-        self.create_actions_section(container)
-        
-        self.create_log_section(container)
-    
-    def create_header(self, parent):
-        header_frame = tk.Frame(parent, bg=CustomTkTheme.DARK_BG)
-        header_frame.pack(fill=tk.X, pady=(0, 30))
-        
-        title_label = tk.Label(header_frame, text="Minecraft Mod Manager", 
-                              bg=CustomTkTheme.DARK_BG, 
-                              fg=CustomTkTheme.TEXT_PRIMARY,
-                              font=("Segoe UI", 28, "bold"))
-        title_label.pack(side=tk.LEFT)
-        
-        version_frame = tk.Frame(header_frame, bg=CustomTkTheme.DARK_BG)
-        version_frame.pack(side=tk.RIGHT, padx=10)
-        
-        version_label = tk.Label(version_frame, text="Minecraft Version:", 
-                                bg=CustomTkTheme.DARK_BG, 
-                                fg=CustomTkTheme.TEXT_SECONDARY,
-                                font=("Segoe UI", 12))
-        version_label.pack(side=tk.LEFT, padx=(0, 15))
-        
-        version_entry_frame = RoundedFrame(version_frame, 120, 40, bg_color=CustomTkTheme.DARK_TERTIARY)
-        version_entry_frame.pack(side=tk.LEFT)
-        
-        self.version_var = tk.StringVar(value=self.minecraft_version)
-        version_entry = tk.Entry(version_entry_frame.frame, 
-                                textvariable=self.version_var, 
-                                width=8,
-                                bg=CustomTkTheme.DARK_TERTIARY,
-                                fg=CustomTkTheme.TEXT_PRIMARY,
-                                font=("Segoe UI", 12),
-                                bd=0,
-                                insertbackground=CustomTkTheme.TEXT_PRIMARY)
-        version_entry.pack(fill=tk.BOTH, expand=True, padx=10)
-    
-    def create_folder_section(self, parent):
-        folder_frame = RoundedFrame(parent, 1320, 90)
-        folder_frame.pack(fill=tk.X, pady=(0, 30))
-        
-        inner_frame = tk.Frame(folder_frame.frame, bg=CustomTkTheme.DARK_SECONDARY)
-        inner_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        folder_label = tk.Label(inner_frame, text="Mods Folder:", 
-                               bg=CustomTkTheme.DARK_SECONDARY, 
-                               fg=CustomTkTheme.TEXT_PRIMARY,
-                               font=("Segoe UI", 12))
-        folder_label.pack(side=tk.LEFT, padx=(0, 15))
-        
-        entry_frame = RoundedFrame(inner_frame, 900, 40, bg_color=CustomTkTheme.DARK_TERTIARY)
-        entry_frame.pack(side=tk.LEFT, padx=(0, 15))
-        
-        self.folder_var = tk.StringVar(value=self.mods_folder)
-        folder_entry = tk.Entry(entry_frame.frame, 
-                               textvariable=self.folder_var, 
-                               bg=CustomTkTheme.DARK_TERTIARY,
-                               fg=CustomTkTheme.TEXT_PRIMARY,
-                               font=("Segoe UI", 12),
-                               bd=0,
-                               insertbackground=CustomTkTheme.TEXT_PRIMARY)
-        folder_entry.pack(fill=tk.BOTH, expand=True, padx=10)
-        
-        browse_btn = RoundedButton(inner_frame, "Browse", 
-                                  command=self.browse_folder,
-                                  width=140,
-                                  height=40)
-        browse_btn.pack(side=tk.LEFT, padx=(0, 15))
-        
-        refresh_btn = RoundedButton(inner_frame, "Refresh", 
-                                   command=self.load_mods,
-                                   width=140,
-                                   height=40,
-                                   bg_color=CustomTkTheme.DARK_TERTIARY,
-                                   hover_color="#333333")
-        refresh_btn.pack(side=tk.LEFT)
-    
-    def create_mods_section(self, parent):
-        mods_label = tk.Label(parent, text="Installed Mods", 
-                             bg=CustomTkTheme.DARK_BG, 
-                             fg=CustomTkTheme.TEXT_PRIMARY,
-                             font=("Segoe UI", 18, "bold"))
-        mods_label.pack(anchor=tk.W, pady=(0, 15))
-        
-        mods_frame = RoundedFrame(parent, 1320, 450)
-        mods_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 30))
-        
-        columns = ("name", "current_version", "latest_version", "status")
-        self.mods_tree = ttk.Treeview(mods_frame.frame, columns=columns, show="headings")
-        
-        self.mods_tree.heading("name", text="Mod Name")
-        self.mods_tree.heading("current_version", text="Current Version")
-        self.mods_tree.heading("latest_version", text="Latest Version")
-        self.mods_tree.heading("status", text="Status")
-        
-        self.mods_tree.column("name", width=600, minwidth=300)
-        self.mods_tree.column("current_version", width=200, minwidth=150)
-        self.mods_tree.column("latest_version", width=200, minwidth=150)
-        self.mods_tree.column("status", width=200, minwidth=150)
-        
-        scrollbar = ttk.Scrollbar(mods_frame.frame, orient=tk.VERTICAL, command=self.mods_tree.yview)
-        self.mods_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.mods_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    def create_actions_section(self, parent):
-        actions_frame = RoundedFrame(parent, 1320, 80)
-        actions_frame.pack(fill=tk.X, pady=(0, 30))
-        
-        inner_frame = tk.Frame(actions_frame.frame, bg=CustomTkTheme.DARK_SECONDARY)
-        inner_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        check_updates_btn = RoundedButton(inner_frame, "Check for Updates", 
-                                         width=180,
-                                         height=40,
-                                         command=self.check_updates)
-        check_updates_btn.pack(side=tk.LEFT, padx=(0, 20))
-        
-        update_btn = RoundedButton(inner_frame, "Update Selected", 
-                                  width=180,
-                                  height=40,
-                                  command=self.update_selected)
-        update_btn.pack(side=tk.LEFT, padx=(0, 20))
-        
-        downgrade_btn = RoundedButton(inner_frame, "Downgrade Selected", 
-                                     width=180,
-                                     height=40,
-                                     command=self.downgrade_selected)
-        downgrade_btn.pack(side=tk.LEFT)
-    
-    def create_log_section(self, parent):
-        log_label = tk.Label(parent, text="Activity Log", 
-                            bg=CustomTkTheme.DARK_BG, 
-                            fg=CustomTkTheme.TEXT_PRIMARY,
-                            font=("Segoe UI", 18, "bold"))
-        log_label.pack(anchor=tk.W, pady=(0, 15))
-        
-        log_frame = RoundedFrame(parent, 1320, 180)
-        log_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.log_text = tk.Text(log_frame.frame, 
-                               height=8, 
-                               bg=CustomTkTheme.DARK_SECONDARY, 
-                               fg=CustomTkTheme.TEXT_PRIMARY,
-                               font=("Consolas", 11),
-                               bd=0,
-                               padx=15,
-                               pady=15,
-                               insertbackground=CustomTkTheme.TEXT_PRIMARY)
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        log_scrollbar = ttk.Scrollbar(log_frame.frame, orient=tk.VERTICAL, command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=log_scrollbar.set)
-        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.log_text.config(state=tk.DISABLED)
-        
-        self.log(f"Application started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.log(f"Default Minecraft version: {self.minecraft_version}")
-    
-    def browse_folder(self):
-        folder = filedialog.askdirectory(initialdir=self.folder_var.get())
-        if folder:
-            self.folder_var.set(folder)
-            self.mods_folder = folder
-            self.load_mods()
-    
-    def log(self, message: str):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{formatted_message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-        print(formatted_message)
-    
-    def load_mods(self):
-        for item in self.mods_tree.get_children():
-            self.mods_tree.delete(item)
-        
-        folder = self.folder_var.get()
-        if not os.path.exists(folder):
-            self.log(f"Folder not found: {folder}")
-            return
-        
-        self.log(f"Loading mods from: {folder}")
+    def to_records(self, versions: List[Dict], channel: Optional[str] = None, 
+                   limit: Optional[int] = None) -> List[VersionRecord]:
+        started = time.perf_counter()
+        allowed = self.CHANNELS[:self.CHANNELS.index(channel) + 1] if channel in self.CHANNELS else None
+        
+        records = []
+        for version in versions:
+            if allowed and version.get("version_type") not in allowed:
+                continue
+            records.append(VersionRecord(version))
+            if limit and len(records) >= limit:
+                break
         
-        jar_files = [f for f in os.listdir(folder) if f.endswith('.jar')]
+        self.metrics.observe("version_parse_seconds", time.perf_counter() - started)
+        self.metrics.inc("version_records_total", len(records))
+        return records
+    
+    def get_mod_versions(self, mod_id: str, game_version: str = None, loaders: Optional[List[str]] = None, 
+                         channel: Optional[str] = None, limit: Optional[int] = None) -> List[VersionRecord]:
+        if self.offline("/project/{id}/version"):
+            return self.to_records([
+                version for version in self.snapshot.get_project_versions(mod_id)
+                if self.snapshot.matches(version, loaders, [game_version] if game_version else None)
+            ], channel, limit)
         
-        if not jar_files:
-            self.log("No mod files (.jar) found in the folder.")
-            return
+        url = f"{self.base_url}/project/{mod_id}/version"
         
-        self.log(f"Found {len(jar_files)} mod files.")
+        params = {"include_changelog": "false"}
+        if game_version:
+            params["game_versions"] = f"[\"{game_version}\"]"
+        if loaders:
+            params["loaders"] = json.dumps(sorted(loaders))
         
-        for jar_file in jar_files:
-            jar_path = os.path.join(folder, jar_file)
-            mod_info = ModAnalyzer.get_mod_info_from_jar(jar_path)
+        try:
+            response = self.cached_request("GET", url, params=params)
             
-            self.mods_tree.insert("", tk.END, values=(
-                mod_info.get("name", jar_file),
-                mod_info.get("version", "Unknown"),
-                "Not checked",
-                "Installed"
-            ))
-        
-        self.log("Finished loading mods.")
+            if response.status_code == 200:
+                return self.to_records(response.json(), channel, limit)
+            else:
+                self.record_error(f"Error getting mod versions: {response.status_code}, {response.text}")
+                return []
+        except Exception as e:
+            self.record_error(f"Exception getting versions: {e}")
+            return []
     
-    def check_updates(self):
-        mods = self.mods_tree.get_children()
-        if not mods:
-            messagebox.showinfo("Info", "No mods loaded")
-            return
+    def get_versions_from_hashes(self, hashes: List[str], algorithm: str = "sha1") -> Dict[str, Dict]:
+        if self.offline("/version_files"):
+            return self.snapshot.get_versions_from_hashes(hashes, algorithm)
         
-        self.log("Checking  "No mods loaded")
-            return
-        
-        self.log("Checking for updates for all mods...")
+        url = f"{self.base_url}/version_files"
+        results = {}
         
-        self.root.config(cursor="wait")
+        for start in range(0, len(hashes), self.HASH_CHUNK_SIZE):
+            chunk = hashes[start:start + self.HASH_CHUNK_SIZE]
+            
+            try:
+                response = self.cached_request("POST", url, json={
+                    "hashes": chunk,
+                    "algorithm": algorithm
+                })
+                
+                if response.status_code == 200:
+                    results.update(response.json())
+                else:
+                    self.record_error(f"Error identifying mod files: {response.status_code}, {response.text}")
+            except Exception as e:
+                self.record_error(f"Exception identifying mod files: {e}")
         
-        threading.Thread(target=self._check_updates_thread, args=(mods,), daemon=True).start()
+        return results
     
-    def _check_updates_thread(self, mods):
-        for item in mods:
-            values = self.mods_tree.item(item, "values")
-            mod_name = values[0]
-            
-            self.log(f"Searching for updates for: {mod_name}")
+    def get_latest_versions_from_hashes(self, hashes: List[str], loaders: List[str] = None, 
+                                              game_versions: List[str] = None, 
+                                              algorithm: str = "sha1", revalidate: bool = False) -> Dict[str, Dict]:
+        if self.offline("/version_files/update"):
+            return self.snapshot.get_latest_versions_from_hashes(hashes, loaders, game_versions, algorithm)
+        
+        url = f"{self.base_url}/version_files/update"
+        results = {}
+        
+        for start in range(0, len(hashes), self.HASH_CHUNK_SIZE):
+            body = {
+                "hashes": hashes[start:start + self.HASH_CHUNK_SIZE],
+                "algorithm": algorithm
+            }
+            if loaders:
+                body["loaders"] = list(loaders)
+            if game_versions:
+                body["game_versions"] = list(game_versions)
             
-            search_results = ModrinthAPI.search_mod(mod_name)
-            if search_results:
-                mod = search_results[0]
-                self.log(f"Found mod: {mod.get('title')} (ID: {mod.get('project_id')})")
-                
-                versions = ModrinthAPI.get_mod_versions(
-                    mod.get('project_id'), 
-                    self.version_var.get()
-                )
+            try:
+                response = self.cached_request("POST", url, json=body, revalidate=revalidate)
                 
-                if versions:
-                    latest_version = versions[0].get('version_number', 'Unknown')
-                    self.log(f"Latest version: {latest_version}")
-                    
-                    current_version = values[1]
-                    if current_version == "Unknown":
-                        status = "Unknown"
-                    elif latest_version == current_version:
-                        status = "Up to date"
-                    else:
-                        status = "Update available"
-                    
-                    self.root.after(0, lambda i=item, n=mod_name, c=current_version, l=latest_version, s=status: 
-                        self.mods_tree.item(i, values=(n, c, l, s))
-                    )
+                if response.status_code == 200:
+                    results.update(response.json())
                 else:
-                    self.log(f"No versions found for {mod_name}")
-            else:
-                self.log(f"No results found for {mod_name}")
-        
-        self.log("Update check completed.")
+                    self.record_error(f"Error resolving latest versions: {response.status_code}, {response.text}")
+            except Exception as e:
+                self.record_error(f"Exception resolving latest versions: {e}")
         
-        self.root.after(0, lambda: self.root.config(cursor=""))
+        return results
     
-    def update_selected(self):
-        selected = self.mods_tree.selection()
-        if not selected:
-            messagebox.showinfo("Info", "No mods selected")
-            return
+    def _get_by_ids(self, path: str, ids: List[str], label: str, revalidate: bool = False) -> Dict[str, Dict]:
+        url = f"{self.base_url}/{path}"
+        results = {}
         
-        for item in selected:
-            values = self.mods_tree.item(item, "values")
-            mod_name = values[0]
-            
-            search_results = ModrinthAPI.search_mod(mod_name)
-            if not search_results:
-                self.log(f"No results found for {mod_name}")
-                continue
-            
-            mod = search_results[0]
-            
-            versions = ModrinthAPI.get_mod_versions(
-                mod.get('project_id'), 
-                self.version_var.get()
-            )
+        for start in range(0, len(ids), self.ID_CHUNK_SIZE):
+            chunk = ids[start:start + self.ID_CHUNK_SIZE]
             
-            if not versions:
-                self.log(f"No versions found for {mod_name}")
-                continue
-            
-            dialog = VersionSelectionDialog(self.root, f"Select version for {mod_name}", versions)
-            
-            if dialog.selected_version:
-                selected_version = dialog.selected_version
-                version_number = selected_version.get('version_number')
-                
-                self.log(f"Selected version {version_number} for {mod_name}")
+            try:
+                response = self.cached_request("GET", url, params={"ids": json.dumps(chunk)}, revalidate=revalidate)
                 
-                self.mods_tree.item(item, values=(
-                    mod_name,
-                    version_number,
-                    version_number,
-                    "Up to date"
-                ))
-                
-                self.log(f"Updated {mod_name} to version {version_number}")
-    
-    def downgrade_selected(self):
-        selected = self.mods_tree.selection()
-        if not selected:
-            messagebox.showinfo("Info", "No mods selected")
-            return
+                if response.status_code == 200:
+                    for item in response.json():
+                        results[item["id"]] = item
+                else:
+                    self.record_error(f"Error getting {label}: {response.status_code}, {response.text}")
+            except Exception as e:
+                self.record_error(f"Exception getting {label}: {e}")
         
-        for item in selected:
-            values = self.mods_tree.item(item, "values")
-            mod_name = values[0]
+        return results
+    
+    def get_projects(self, project_ids: List[str], revalidate: bool = False) -> Dict[str, Dict]:
+        if self.offline("/projects"):
+            return self.snapshot.get_projects(project_ids)
+        return self._get_by_ids("projects", project_ids, "projects", revalidate)
+    
+    def get_versions(self, version_ids: List[str], revalidate: bool = False) -> Dict[str, Dict]:
+        if self.offline("/versions"):
+            return self.snapshot.get_versions(version_ids)
+        return self._get_by_ids("versions", version_ids, "versions", revalidate)
+
+
+class MappedFile(mmap.mmap):
+    def seekable(self) -> bool:
+        return True
+
+
+class ModAnalyzer:
+    HASH_BLOCK_SIZE = 1024 * 1024
+    
+    DESCRIPTORS = (
+        ("META-INF/neoforge.mods.toml", "neoforge"),
+        ("META-INF/mods.toml", "forge"),
+        ("quilt.mod.json", "quilt"),
+        ("fabric.mod.json", "fabric"),
+        ("mcmod.info", "forge"),
+    )
+    
+    @staticmethod
+    def get_fallback_info(jar_path: str, mod_type: str = "unknown", error: Optional[Exception] = None) -> Dict:
+        info = {
+            "mod_id": None,
+            "version": None,
+            "name": os.path.basename(jar_path).replace(".jar", ""),
+            "type": mod_type
+        }
+        if error is not None:
+            info["error"] = str(error)
+        return info
+    
+    @staticmethod
+    def analyze_jar(jar_path: str) -> Dict:
+        with open(jar_path, 'rb') as jar_file:
+            try:
+                data = MappedFile(jar_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                return {
+                    "info": ModAnalyzer.get_fallback_info(jar_path, "error", e),
+                    "hashes": ModAnalyzer.get_buffer_hashes(b"")
+                }
             
-            search_results = ModrinthAPI.search_mod(mod_name)
-            if not search_results:
-                self.log(f"No results found for {mod_name}")
+            with data:
+                return {
+                    "info": ModAnalyzer.get_mod_info_from_buffer(data, jar_path),
+                    "hashes": ModAnalyzer.get_buffer_hashes(data)
+                }
+    
+    @staticmethod
+    def get_buffer_hashes(data) -> Dict[str, str]:
+        return {
+            "sha1": hashlib.sha1(data).hexdigest(),
+            "sha512": hashlib.sha512(data).hexdigest()
+        }
+    
+    @staticmethod
+    def get_mod_info_from_jar(jar_path: str) -> Dict:
+        started = time.perf_counter()
+        try:
+            with open(jar_path, 'rb') as jar_file:
+                with MappedFile(jar_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    info = ModAnalyzer.get_mod_info_from_buffer(data, jar_path)
+            METRICS.observe("jar_parse_seconds", time.perf_counter() - started, loader=info.get("type"))
+            return info
+        except Exception as e:
+            logger.warning(f"Error analyzing JAR file {jar_path}: {e}")
+            return ModAnalyzer.get_fallback_info(jar_path, "error", e)
+    
+    @staticmethod
+    def get_mod_info_from_buffer(data, jar_path: str) -> Dict:
+        try:
+            with zipfile.ZipFile(data) as jar:
+                for member_name, mod_type in ModAnalyzer.DESCRIPTORS:
+                    try:
+                        member = jar.getinfo(member_name)
+                    except KeyError:
+                        continue
+                    
+                    content = jar.read(member).decode('utf-8-sig', errors='replace')
+                    if mod_type in ("forge", "neoforge") and member_name.endswith(".toml"):
+                        info = ModAnalyzer.parse_mods_toml(content, mod_type)
+                    elif mod_type == "quilt":
+                        info = ModAnalyzer.parse_quilt_json(content)
+                    elif mod_type == "fabric":
+                        info = ModAnalyzer.parse_fabric_json(content)
+                    else:
+                        info = ModAnalyzer.parse_mcmod_info(content)
+                    
+                    if not info or not info.get("mod_id"):
+                        continue
+                    
+                    if info["version"] and "${" in info["version"]:
+                        info["version"] = ModAnalyzer.get_manifest_version(jar)
+                    
+                    info["name"] = info["name"] or info["mod_id"]
+                    info.setdefault("type", mod_type)
+                    return info
+        except Exception as e:
+            logger.warning(f"Error analyzing JAR file {jar_path}: {e}")
+            return ModAnalyzer.get_fallback_info(jar_path, "error", e)
+        
+        return ModAnalyzer.get_fallback_info(jar_path)
+    
+    @staticmethod
+    def get_manifest_version(jar: zipfile.ZipFile) -> Optional[str]:
+        try:
+            manifest = jar.read(jar.getinfo("META-INF/MANIFEST.MF")).decode('utf-8', errors='replace')
+        except KeyError:
+            return None
+        
+        for line in manifest.splitlines():
+            if line.startswith("Implementation-Version:"):
+                return line.split(":", 1)[1].strip() or None
+        return None
+    
+    @staticmethod
+    def parse_toml(content: str) -> Dict:
+        if tomllib is not None:
+            try:
+                return tomllib.loads(content)
+            except ValueError:
+                pass
+        
+        data = {"mods": []}
+        current = data
+        for line in content.splitlines():
+            line = line.strip()
+            if line == "[[mods]]":
+                current = {}
+                data["mods"].append(current)
+            elif line.startswith("["):
+                current = {}
+            elif "=" in line and not line.startswith("#"):
+                key, value = line.split("=", 1)
+                current[key.strip()] = value.split("#", 1)[0].strip().strip('"\'')
+        return data
+    
+    @staticmethod
+    def parse_mods_toml(content: str, mod_type: str) -> Optional[Dict]:
+        data = ModAnalyzer.parse_toml(content)
+        mods = [mod for mod in data.get("mods", []) if isinstance(mod, dict) and mod.get("modId")]
+        if not mods:
+            return None
+        
+        for dependencies in data.get("dependencies", {}).values():
+            if any(isinstance(dep, dict) and dep.get("modId") == "neoforge" for dep in dependencies or []):
+                mod_type = "neoforge"
+                break
+        
+        return {
+            "mod_id": mods[0]["modId"],
+            "version": mods[0].get("version"),
+            "name": mods[0].get("displayName"),
+            "type": mod_type,
+            "mod_ids": [mod["modId"] for mod in mods]
+        }
+    
+    @staticmethod
+    def parse_fabric_json(content: str) -> Optional[Dict]:
+        data = json.loads(content, strict=False)
+        return {
+            "mod_id": data.get("id"),
+            "version": data.get("version"),
+            "name": data.get("name")
+        }
+    
+    @staticmethod
+    def parse_quilt_json(content: str) -> Optional[Dict]:
+        loader = json.loads(content, strict=False).get("quilt_loader", {})
+        return {
+            "mod_id": loader.get("id"),
+            "version": loader.get("version"),
+            "name": loader.get("metadata", {}).get("name")
+        }
+    
+    @staticmethod
+    def parse_mcmod_info(content: str) -> Optional[Dict]:
+        data = json.loads(content, strict=False)
+        mods = data.get("modList", []) if isinstance(data, dict) else data
+        mods = [mod for mod in mods if isinstance(mod, dict) and mod.get("modid")]
+        if not mods:
+            return None
+        
+        return {
+            "mod_id": mods[0]["modid"],
+            "version": mods[0].get("version"),
+            "name": mods[0].get("name"),
+            "mod_ids": [mod["modid"] for mod in mods]
+        }
+
+
+def analyze_mod_file(jar_path: str) -> Dict:
+    started = time.perf_counter()
+    try:
+        analysis = ModAnalyzer.analyze_jar(jar_path)
+    except OSError as e:
+        logger.warning(f"Could not read {jar_path}: {e}")
+        analysis = {
+            "info": ModAnalyzer.get_fallback_info(jar_path, "error", e),
+            "hashes": {}
+        }
+    
+    analysis["seconds"] = time.perf_counter() - started
+    return analysis
+
+
+class ModIndex:
+    FORMAT_VERSION = 2
+    PARALLEL_THRESHOLD = 16
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        self.last_scan = {"cached": 0, "parsed": 0, "pruned": 0}
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        
+        if path:
+            self.load()
+    
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return
+        
+        if data.get("version") == self.FORMAT_VERSION:
+            self.entries = data.get("entries", {})
+    
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        
+        with self.save_lock:
+            with self.lock:
+                data = {"version": self.FORMAT_VERSION, "entries": dict(self.entries)}
+                self.dirty = False
+            
+            try:
+                write_json_file(self.path, data)
+            except OSError:
+                with self.lock:
+                    self.dirty = True
+                raise
+    
+    def lookup(self, path: str, stat: os.stat_result) -> Optional[Dict]:
+        entry = self.entries.get(path)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+        return None
+    
+    def store(self, path: str, stat: os.stat_result, analysis: Dict) -> Dict:
+        if "seconds" in analysis:
+            METRICS.observe("jar_parse_seconds", analysis["seconds"], loader=analysis["info"].get("type"))
+        
+        entry = {
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "info": analysis["info"],
+            "hashes": analysis["hashes"]
+        }
+        
+        if entry["hashes"] and entry["info"].get("type") != "error":
+            with self.lock:
+                self.entries[path] = entry
+                self.dirty = True
+        
+        return entry
+    
+    def analyze(self, path: str, stat: os.stat_result) -> Dict:
+        return self.store(path, stat, analyze_mod_file(path))
+    
+    def analyze_many(self, jars: List[Tuple[str, os.stat_result]], executor=None, 
+                     cancelled: Optional[threading.Event] = None):
+        if executor is None or len(jars) < self.PARALLEL_THRESHOLD:
+            for path, stat in jars:
+                if cancelled and cancelled.is_set():
+                    return
+                yield self.analyze(path, stat)
+            return
+        
+        futures = {executor.submit(analyze_mod_file, path): (path, stat) for path, stat in jars}
+        try:
+            for future in as_completed(futures):
+                if cancelled and cancelled.is_set():
+                    return
+                
+                path, stat = futures[future]
+                try:
+                    yield self.store(path, stat, future.result())
+                except Exception as e:
+                    logger.warning(f"Parallel analysis failed for {path}, retrying in-process: {e}")
+                    yield self.analyze(path, stat)
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def get_entry(self, path: str, stat: Optional[os.stat_result] = None) -> Dict:
+        stat = stat or os.stat(path)
+        return self.lookup(path, stat) or self.analyze(path, stat)
+    
+    @staticmethod
+    def list_jars(folder: str) -> List[Tuple[str, os.stat_result]]:
+        folder = os.path.abspath(folder)
+        jars = []
+        
+        with os.scandir(folder) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith('.jar') and dir_entry.is_file():
+                    jars.append((os.path.join(folder, dir_entry.name), dir_entry.stat()))
+        
+        return jars
+    
+    def scan(self, folder: str, jars: Optional[List[Tuple[str, os.stat_result]]] = None, 
+             executor=None, on_entry: Optional[Callable[[Dict], None]] = None, 
+             cancelled: Optional[threading.Event] = None) -> List[Dict]:
+        folder = os.path.abspath(folder)
+        if jars is None:
+            jars = self.list_jars(folder)
+        
+        entries = []
+        changed = []
+        stats = {"cached": 0, "parsed": 0, "pruned": 0}
+        
+        for path, stat in jars:
+            entry = self.lookup(path, stat)
+            if entry:
+                stats["cached"] += 1
+                entries.append(entry)
+                if on_entry:
+                    on_entry(entry)
+            else:
+                changed.append((path, stat))
+        
+        for entry in self.analyze_many(changed, executor, cancelled):
+            stats["parsed"] += 1
+            entries.append(entry)
+            if on_entry:
+                on_entry(entry)
+        
+        if not (cancelled and cancelled.is_set()):
+            stats["pruned"] = self.prune(folder, {path for path, _ in jars})
+        
+        self.record_stats(stats)
+        return entries
+    
+    def record_stats(self, stats: Dict[str, int]):
+        self.last_scan = stats
+        for source, count in stats.items():
+            if count:
+                METRICS.inc("jars_scanned_total", count, source=source)
+    
+    def refresh(self, paths, executor=None) -> Tuple[List[Dict], List[str]]:
+        entries = []
+        removed = []
+        changed = []
+        stats = {"cached": 0, "parsed": 0, "pruned": 0}
+        
+        for path in sorted(set(paths)):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            
+            if stat is None or not os.path.isfile(path):
+                with self.lock:
+                    if self.entries.pop(path, None) is not None:
+                        self.dirty = True
+                        stats["pruned"] += 1
+                removed.append(path)
                 continue
             
-            mod = search_results[0]
+            entry = self.lookup(path, stat)
+            if entry:
+                stats["cached"] += 1
+                entries.append(entry)
+            else:
+                changed.append((path, stat))
+        
+        for entry in self.analyze_many(changed, executor):
+            stats["parsed"] += 1
+            entries.append(entry)
+        
+        self.record_stats(stats)
+        return entries, removed
+    
+    def prune(self, folder: str, keep) -> int:
+        with self.lock:
+            stale = [
+                path for path in self.entries
+                if os.path.dirname(path) == folder and path not in keep
+            ]
+            for path in stale:
+                del self.entries[path]
+            if stale:
+                self.dirty = True
+        
+        return len(stale)
+
+
+class FolderWatcher:
+    DEBOUNCE = 0.5
+    MAX_DELAY = 5.0
+    POLL_INTERVAL = 2.0
+    READ_SIZE = 64 * 1024
+    
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | 
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    RESCAN_MASK = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, folder: str, on_change: Callable[[set], None], 
+                 debounce: float = DEBOUNCE, interval: float = POLL_INTERVAL):
+        self.folder = os.path.abspath(folder)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.interval = interval
+        self.snapshot = {}
+        self.backend = None
+        self.stopped = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        self.poll()
+        fd = self.open_inotify()
+        self.backend = "inotify" if fd is not None else "polling"
+        self.thread = threading.Thread(target=self._run, args=(fd,), daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.stopped.set()
+    
+    def open_inotify(self) -> Optional[int]:
+        if not sys.platform.startswith("linux"):
+            return None
+        
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        
+        if libc.inotify_add_watch(fd, os.fsencode(self.folder), self.WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        
+        return fd
+    
+    def poll(self) -> set:
+        current = {}
+        try:
+            for path, stat in ModIndex.list_jars(self.folder):
+                current[path] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass
+        
+        changed = {path for path in current if self.snapshot.get(path) != current[path]}
+        changed.update(path for path in self.snapshot if path not in current)
+        self.snapshot = current
+        return changed
+    
+    def read_events(self, fd: int, timeout: float) -> Optional[set]:
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return set()
+        
+        try:
+            data = os.read(fd, self.READ_SIZE)
+        except BlockingIOError:
+            return set()
+        
+        changed = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            _, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
             
-            versions = ModrinthAPI.get_mod_versions(mod.get('project_id'))
+            if mask & self.RESCAN_MASK:
+                return None
+            if name.endswith('.jar'):
+                changed.add(os.path.join(self.folder, name))
+        
+        return changed
+    
+    def record(self, paths: set):
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                self.snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                self.snapshot.pop(path, None)
+    
+    def _run(self, fd: Optional[int]):
+        pending = set()
+        first_event = last_event = 0.0
+        
+        try:
+            while not self.stopped.is_set():
+                timeout = self.debounce if pending else self.interval
+                
+                if fd is not None:
+                    changed = self.read_events(fd, timeout)
+                    if changed is None:
+                        os.close(fd)
+                        fd = self.open_inotify()
+                        self.backend = "inotify" if fd is not None else "polling"
+                        changed = self.poll()
+                    else:
+                        self.record(changed)
+                else:
+                    self.stopped.wait(timeout)
+                    changed = self.poll()
+                
+                now = time.monotonic()
+                if changed:
+                    if not pending:
+                        first_event = now
+                    pending.update(changed)
+                    last_event = now
+                
+                if pending and not self.stopped.is_set() and (
+                        now - last_event >= self.debounce or now - first_event >= self.MAX_DELAY):
+                    batch, pending = pending, set()
+                    try:
+                        self.on_change(batch)
+                    except Exception as e:
+                        logger.error(f"Error handling changes in {self.folder}: {e}")
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+
+class ModRecord:
+    __slots__ = (
+        "path", "size", "mtime_ns", "sha1", "sha512", "mod_id", "name", "loader", 
+        "current_version", "project_id", "current", "latest", "versions", "status"
+    )
+    
+    def __init__(self, path: str, sha1: Optional[str] = None, sha512: Optional[str] = None, 
+                 mod_id: Optional[str] = None, name: Optional[str] = None, loader: Optional[str] = None, 
+                 current_version: Optional[str] = None, size: int = 0, mtime_ns: int = 0):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.sha1 = sha1
+        self.sha512 = sha512
+        self.mod_id = mod_id
+        self.name = name or os.path.basename(path)
+        self.loader = loader
+        self.current_version = current_version
+        self.project_id = None
+        self.current = None
+        self.latest = None
+        self.versions = None
+        self.status = "Installed"
+    
+    @classmethod
+    def from_entry(cls, entry: Dict) -> "ModRecord":
+        info = entry["info"]
+        hashes = entry.get("hashes", {})
+        return cls(
+            entry["path"],
+            sha1=hashes.get("sha1"),
+            sha512=hashes.get("sha512"),
+            mod_id=info.get("mod_id"),
+            name=info.get("name"),
+            loader=info.get("type"),
+            current_version=info.get("version"),
+            size=entry.get("size", 0),
+            mtime_ns=entry.get("mtime_ns", 0)
+        )
+    
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.path)
+    
+    def get_versions(self, game_version: Optional[str]) -> Optional[List[Dict]]:
+        return (self.versions or {}).get(game_version or "")
+    
+    def set_versions(self, game_version: Optional[str], versions: List[Dict]):
+        if self.versions is None:
+            self.versions = {}
+        self.versions[game_version or ""] = versions
+    
+    def carry_over(self, other: "ModRecord"):
+        self.project_id = other.project_id
+        self.latest = other.latest
+        self.versions = other.versions
+
+
+class ModRegistry:
+    def __init__(self):
+        self.records = {}
+        self.by_project = {}
+        self.by_hash = {}
+        self.by_mod_id = {}
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records.values())
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self.records
+    
+    def get(self, path: str) -> Optional[ModRecord]:
+        return self.records.get(path)
+    
+    def add(self, record: ModRecord) -> ModRecord:
+        if record.path in self.records:
+            self.remove(record.path)
+        
+        self.records[record.path] = record
+        for digest in (record.sha1, record.sha512):
+            if digest:
+                self.by_hash[digest] = record.path
+        if record.mod_id:
+            self.by_mod_id.setdefault(record.mod_id, set()).add(record.path)
+        if record.project_id:
+            self.by_project.setdefault(record.project_id, set()).add(record.path)
+        
+        return record
+    
+    def add_entry(self, entry: Dict) -> ModRecord:
+        return self.add(ModRecord.from_entry(entry))
+    
+    def update_entry(self, entry: Dict) -> ModRecord:
+        record = ModRecord.from_entry(entry)
+        previous = self.records.get(record.path)
+        
+        if previous and previous.sha1 == record.sha1:
+            record.carry_over(previous)
+            record.current = previous.current
+            record.status = previous.status
+        
+        return self.add(record)
+    
+    def remove(self, path: str) -> Optional[ModRecord]:
+        record = self.records.pop(path, None)
+        if record is None:
+            return None
+        
+        for digest in (record.sha1, record.sha512):
+            if digest and self.by_hash.get(digest) == path:
+                del self.by_hash[digest]
+        self._unindex(self.by_mod_id, record.mod_id, path)
+        self._unindex(self.by_project, record.project_id, path)
+        
+        return record
+    
+    @staticmethod
+    def _unindex(index: Dict[str, set], key: Optional[str], path: str):
+        paths = index.get(key)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del index[key]
+    
+    def clear(self):
+        self.records.clear()
+        self.by_project.clear()
+        self.by_hash.clear()
+        self.by_mod_id.clear()
+    
+    def set_project(self, record: ModRecord, project_id: Optional[str]):
+        if record.project_id == project_id:
+            return
+        
+        self._unindex(self.by_project, record.project_id, record.path)
+        record.project_id = project_id
+        if project_id and record.path in self.records:
+            self.by_project.setdefault(project_id, set()).add(record.path)
+    
+    def apply_result(self, path: str, result: Dict) -> Optional[ModRecord]:
+        record = self.records.get(path)
+        if record is None:
+            return None
+        
+        self.set_project(record, result.get("project_id"))
+        record.current = result.get("current")
+        record.latest = result.get("latest")
+        record.status = result.get("status", record.status)
+        return record
+    
+    def find_by_project(self, project_id: str) -> List[ModRecord]:
+        return [self.records[path] for path in self.by_project.get(project_id, ())]
+    
+    def find_by_hash(self, digest: str) -> Optional[ModRecord]:
+        path = self.by_hash.get(digest)
+        return self.records.get(path) if path else None
+    
+    def find_by_mod_id(self, mod_id: str) -> List[ModRecord]:
+        return [self.records[path] for path in self.by_mod_id.get(mod_id, ())]
+
+
+class ModFilter:
+    FIELDS = ("name", "mod_id", "status", "loader")
+    COLUMNS = ("name", "current_version", "latest_version", "loader", "status")
+    NUMBER_PATTERN = re.compile(r"(\d+)")
+    
+    def __init__(self):
+        self.keys = {}
+        self.sort_keys = {}
+        self.last_terms = None
+        self.last_matches = None
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @classmethod
+    def get_natural_key(cls, value: Optional[str]) -> Tuple:
+        return tuple(
+            (0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in cls.NUMBER_PATTERN.split((value or "").lower()) if part
+        )
+    
+    @staticmethod
+    def get_values(record: ModRecord) -> Dict[str, str]:
+        return {
+            "name": record.name or "",
+            "mod_id": record.mod_id or "",
+            "status": record.status or "",
+            "loader": record.loader or "",
+            "current_version": record.current_version or "",
+            "latest_version": (record.latest or {}).get("version_number") or ""
+        }
+    
+    def update(self, record: ModRecord):
+        values = self.get_values(record)
+        key = tuple(values[field].lower() for field in self.FIELDS)
+        
+        if self.keys.get(record.path) != key:
+            self.keys[record.path] = key
+            self.last_terms = None
+        
+        self.sort_keys[record.path] = {
+            column: self.get_natural_key(values[column]) if column.endswith("version") else values[column].lower()
+            for column in self.COLUMNS
+        }
+    
+    def remove(self, path: str):
+        if self.keys.pop(path, None) is not None:
+            self.last_terms = None
+        self.sort_keys.pop(path, None)
+    
+    def clear(self):
+        self.keys.clear()
+        self.sort_keys.clear()
+        self.last_terms = None
+    
+    @classmethod
+    def parse(cls, query: str) -> List[Tuple[int, str]]:
+        terms = []
+        for token in query.lower().split():
+            field, separator, value = token.partition(":")
+            if separator and field in cls.FIELDS:
+                terms.append((cls.FIELDS.index(field), value))
+            else:
+                terms.append((-1, token))
+        return terms
+    
+    @staticmethod
+    def narrows(previous: List[Tuple[int, str]], terms: List[Tuple[int, str]]) -> bool:
+        if len(terms) < len(previous):
+            return False
+        return all(
+            field == old_field and value.startswith(old_value) 
+            for (old_field, old_value), (field, value) in zip(previous, terms)
+        )
+    
+    @staticmethod
+    def matches(key: Tuple[str, ...], terms: List[Tuple[int, str]]) -> bool:
+        for field, value in terms:
+            if field >= 0:
+                if not key[field].startswith(value):
+                    return False
+            elif value not in key[0] and value not in key[1]:
+                return False
+        return True
+    
+    def search(self, query: str) -> List[str]:
+        terms = self.parse(query)
+        if not terms:
+            return list(self.keys)
+        
+        candidates = self.keys
+        if self.last_terms is not None and self.narrows(self.last_terms, terms):
+            candidates = self.last_matches
+        
+        matches = [path for path in candidates if self.matches(self.keys[path], terms)]
+        self.last_terms = terms
+        self.last_matches = matches
+        return matches
+    
+    def sort(self, paths: List[str], column: str, descending: bool = False) -> List[str]:
+        return sorted(paths, key=lambda path: self.sort_keys[path][column], reverse=descending)
+
+
+class UpdateChecker:
+    def __init__(self, api: ModrinthAPI, max_workers: int = 8, log: Callable[[str], None] = print):
+        self.api = api
+        self.max_workers = max_workers
+        self.log = log
+        self.cancelled = threading.Event()
+    
+    def cancel(self):
+        self.cancelled.set()
+    
+    @staticmethod
+    def get_mod_loader(mod: ModRecord, current: Optional[Dict]) -> Optional[str]:
+        if mod.loader in ModrinthAPI.LOADERS:
+            return mod.loader
+        
+        for loader in (current or {}).get("loaders", []):
+            if loader in ModrinthAPI.LOADERS:
+                return loader
+        
+        return None
+    
+    @staticmethod
+    def get_update_status(current: Optional[Dict], latest: Dict, current_version: str) -> str:
+        if current:
+            if latest.get('id') == current.get('id'):
+                return "Up to date"
+            return "Update available"
+        
+        if not current_version or current_version == "Unknown":
+            return "Unknown"
+        elif latest.get('version_number') == current_version:
+            return "Up to date"
+        return "Possible update"
+    
+    def _map_hashes(self, mods: Dict[str, ModRecord], keys, 
+                    lookup: Callable[[List[str]], Dict[str, Dict]]) -> Dict[str, Dict]:
+        keys_by_hash = {}
+        for key in keys:
+            sha1 = mods[key].sha1
+            if sha1:
+                keys_by_hash.setdefault(sha1, []).append(key)
+        
+        if not keys_by_hash:
+            return {}
+        
+        found = {}
+        for sha1, version in lookup(list(keys_by_hash)).items():
+            for key in keys_by_hash.get(sha1, []):
+                found[key] = version
+        
+        return found
+    
+    def identify(self, mods: Dict[str, ModRecord]) -> Dict[str, Dict]:
+        return self._map_hashes(mods, mods, self.api.get_versions_from_hashes)
+    
+    def find_latest_versions(self, mods: Dict[str, ModRecord], identified: Dict[str, Dict], 
+                             game_version: str, executor: ThreadPoolExecutor, 
+                             revalidate: bool = False) -> Dict[str, Dict]:
+        groups = {}
+        for key, current in identified.items():
+            groups.setdefault(self.get_mod_loader(mods[key], current), []).append(key)
+        
+        futures = [
+            executor.submit(
+                self._map_hashes, mods, keys,
+                lambda hashes, loader=loader: self.api.get_latest_versions_from_hashes(
+                    hashes,
+                    loaders=[loader] if loader else None,
+                    game_versions=[game_version] if game_version else None,
+                    revalidate=revalidate
+                )
+            )
+            for loader, keys in groups.items()
+        ]
+        
+        latest_versions = {}
+        for future in as_completed(futures):
+            latest_versions.update(future.result())
+        
+        return latest_versions
+    
+    def search_project(self, name: str) -> Optional[Dict]:
+        search_results = self.api.search_mod(name)
+        if not search_results:
+            self.log(f"No results found for {name}")
+            return None
+        
+        mod = search_results[0]
+        self.log(f"Found mod: {mod.get('title')} (ID: {mod.get('project_id')})")
+        return mod
+    
+    def _check_by_search(self, mod: ModRecord, game_version: str) -> Dict:
+        result = {"project_id": None, "current": None, "latest": None}
+        
+        if self.cancelled.is_set():
+            return result
+        
+        project = self.search_project(mod.name)
+        if project:
+            result["project_id"] = project.get("project_id")
+            versions = self.api.get_mod_versions(
+                result["project_id"], game_version, 
+                loaders=self.api.get_compatible_loaders(self.get_mod_loader(mod, None)), 
+                limit=1
+            )
+            result["latest"] = versions[0] if versions else None
+        
+        return result
+    
+    def _finish_result(self, mod: ModRecord, result: Dict) -> Dict:
+        result["name"] = mod.name
+        result["current_version"] = mod.current_version or "Unknown"
+        
+        if result["latest"]:
+            result["status"] = self.get_update_status(result["current"], result["latest"], result["current_version"])
+        else:
+            result["status"] = "Not found"
+        
+        return result
+    
+    def check(self, mods: Dict[str, ModRecord], game_version: str, 
+              on_result: Callable[[str, Dict], None], revalidate: bool = False) -> Dict[str, Dict]:
+        self.cancelled.clear()
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            identified = self.identify(mods)
+            self.log(f"Identified {len(identified)} of {len(mods)} mods by file hash.")
             
-            if not versions:
-                self.log(f"No versions found for {mod_name}")
-                continue
+            latest_versions = self.find_latest_versions(mods, identified, game_version, executor, revalidate)
+            
+            for key, current in identified.items():
+                result = self._finish_result(mods[key], {
+                    "project_id": current.get("project_id"),
+                    "current": current,
+                    "latest": latest_versions.get(key)
+                })
+                results[key] = result
+                on_result(key, result)
             
-            dialog = VersionSelectionDialog(self.root, f"Select version for {mod_name}", versions)
+            futures = {
+                executor.submit(self._check_by_search, mods[key], game_version): key
+                for key in mods if key not in identified
+            }
             
-            if dialog.selected_version:
-                selected_version = dialog.selected_version
-                version_number = selected_version.get('version_number')
+            for future in as_completed(futures):
+                if self.cancelled.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    break
                 
-                self.log(f"Selected version {version_number} for {mod_name}")
+                key = futures[future]
+                result = self._finish_result(mods[key], future.result())
+                results[key] = result
+                on_result(key, result)
+        
+        return results
+
+
+class DependencyResolver:
+    LOADER_FALLBACKS = ModrinthAPI.LOADER_FALLBACKS
+    
+    def __init__(self, api: ModrinthAPI, max_workers: int = 8, log: Callable[[str], None] = print):
+        self.api = api
+        self.max_workers = max_workers
+        self.log = log
+        self.projects = {}
+        self.versions = {}
+        self.candidates = {}
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def get_pack_loader(mods) -> Optional[str]:
+        counts = {}
+        for mod in mods:
+            if mod.loader in ModrinthAPI.LOADERS:
+                counts[mod.loader] = counts.get(mod.loader, 0) + 1
+        return max(counts, key=counts.get) if counts else None
+    
+    @classmethod
+    def supports(cls, version: Dict, loader: Optional[str], game_version: Optional[str]) -> bool:
+        if game_version and game_version not in version.get("game_versions", []):
+            return False
+        if loader and not set(cls.LOADER_FALLBACKS.get(loader, (loader,))) & set(version.get("loaders", [])):
+            return False
+        return True
+    
+    def fetch_projects(self, project_ids) -> Dict[str, Dict]:
+        missing = [project_id for project_id in set(project_ids) if project_id not in self.projects]
+        if missing:
+            self.projects.update(self.api.get_projects(missing))
+        return {project_id: self.projects[project_id] for project_id in project_ids if project_id in self.projects}
+    
+    def fetch_versions(self, version_ids) -> Dict[str, Dict]:
+        missing = [version_id for version_id in set(version_ids) if version_id not in self.versions]
+        if missing:
+            self.versions.update(self.api.get_versions(missing))
+        return {version_id: self.versions[version_id] for version_id in version_ids if version_id in self.versions}
+    
+    def get_candidates(self, project_id: str, loader: Optional[str], game_version: Optional[str]) -> List[Dict]:
+        key = (project_id, game_version or "", loader or "")
+        if key not in self.candidates:
+            errors = self.api.errors
+            versions = self.api.get_mod_versions(project_id, game_version, self.api.get_compatible_loaders(loader))
+            if not versions and self.api.errors != errors:
+                return []
+            # Empty results are kept too, so a dependency with no matching build is only looked up once.
+            self.candidates[key] = versions
+            for version in versions:
+                self.versions.setdefault(version["id"], version)
+        
+        return [version for version in self.candidates[key] if self.supports(version, loader, None)]
+    
+    def pick_version(self, project_id: str, loader: Optional[str], game_version: Optional[str], 
+                     pinned: Optional[Dict] = None) -> Optional[Dict]:
+        if pinned and self.supports(pinned, loader, game_version):
+            return pinned
+        
+        candidates = self.get_candidates(project_id, loader, game_version)
+        releases = [version for version in candidates if version.get("version_type") == "release"]
+        return (releases or candidates or [None])[0]
+    
+    def get_name(self, project_id: str, plan: Dict[str, Dict]) -> str:
+        if project_id in plan and plan[project_id]["name"]:
+            return plan[project_id]["name"]
+        return self.projects.get(project_id, {}).get("title") or project_id
+    
+    @staticmethod
+    def describe_issue(issue: Dict) -> str:
+        if issue["type"] == "incompatible":
+            return f"{issue['name']} is incompatible with {issue['dependency_name']}"
+        return f"{issue['name']} requires {issue['dependency_name']}, but no compatible version was found"
+    
+    def _resolve_once(self, mods: Dict[str, ModRecord], installed: Dict[str, Dict], 
+                      proposed: Dict[str, Dict], loader: Optional[str], game_version: Optional[str]) -> Dict:
+        plan = {}
+        for key, mod in mods.items():
+            version = proposed.get(key) or installed.get(key)
+            project_id = (version or {}).get("project_id") or mod.project_id
+            if project_id:
+                plan[project_id] = {"version": version, "path": key, "name": mod.name}
+        
+        issues = []
+        added = []
+        pending = [project_id for project_id, item in plan.items() if item["version"]]
+        
+        while pending:
+            dependencies = [
+                (owner, dependency)
+                for owner in pending
+                for dependency in plan[owner]["version"].get("dependencies") or []
+                if dependency.get("dependency_type") == "required"
+            ]
+            pending = []
+            
+            pinned = self.fetch_versions([dependency["version_id"] for _, dependency in dependencies 
+                                          if dependency.get("version_id")])
+            
+            wanted = {}
+            for owner, dependency in dependencies:
+                version = pinned.get(dependency.get("version_id"))
+                project_id = dependency.get("project_id") or (version or {}).get("project_id")
+                if project_id and project_id not in plan and project_id not in wanted:
+                    wanted[project_id] = (owner, version)
+            
+            if not wanted:
+                break
+            
+            self.fetch_projects(list(wanted))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                picks = dict(zip(wanted, executor.map(
+                    lambda project_id: self.pick_version(project_id, loader, game_version, wanted[project_id][1]), 
+                    wanted
+                )))
+            
+            for project_id, version in picks.items():
+                owner = wanted[project_id][0]
+                if version is None:
+                    issues.append({"type": "missing", "project_id": owner, "dependency": project_id})
+                    continue
+                
+                plan[project_id] = {
+                    "version": version, 
+                    "path": None, 
+                    "name": self.projects.get(project_id, {}).get("title"), 
+                    "required_by": owner
+                }
+                added.append(project_id)
+                pending.append(project_id)
+        
+        for owner, item in plan.items():
+            for dependency in (item["version"] or {}).get("dependencies") or []:
+                if dependency.get("dependency_type") != "incompatible":
+                    continue
+                
+                project_id = dependency.get("project_id")
+                if project_id not in plan or not plan[project_id]["version"]:
+                    continue
+                if dependency.get("version_id") and dependency["version_id"] != plan[project_id]["version"].get("id"):
+                    continue
+                issues.append({"type": "incompatible", "project_id": owner, "dependency": project_id})
+        
+        self.fetch_projects([issue["dependency"] for issue in issues if issue["dependency"] not in plan])
+        for issue in issues:
+            issue["name"] = self.get_name(issue["project_id"], plan)
+            issue["dependency_name"] = self.get_name(issue["dependency"], plan)
+            issue["paths"] = [
+                plan[project_id]["path"] for project_id in (issue["project_id"], issue["dependency"])
+                if project_id in plan and plan[project_id]["path"]
+            ]
+        
+        return {
+            "loader": loader,
+            "versions": {project_id: item["version"] for project_id, item in plan.items() if item["version"]},
+            "added": [
+                {
+                    "project_id": project_id,
+                    "name": self.get_name(project_id, plan),
+                    "version": plan[project_id]["version"],
+                    "required_by": self.get_name(plan[project_id]["required_by"], plan)
+                }
+                for project_id in added
+            ],
+            "issues": issues
+        }
+    
+    def resolve(self, mods: Dict[str, ModRecord], proposed: Dict[str, Dict], 
+                game_version: Optional[str], loader: Optional[str] = None) -> Dict:
+        with self.lock:
+            loader = loader or self.get_pack_loader(mods.values())
+            
+            installed = {key: mod.current for key, mod in mods.items() if mod.current}
+            unknown = {key: mod for key, mod in mods.items() if key not in installed and mod.sha1}
+            if unknown:
+                installed.update(UpdateChecker(self.api, log=self.log).identify(unknown))
+            for version in installed.values():
+                self.versions.setdefault(version["id"], version)
+            
+            held_back = {}
+            while True:
+                resolution = self._resolve_once(
+                    mods, installed, 
+                    {key: version for key, version in proposed.items() if key not in held_back}, 
+                    loader, game_version
+                )
                 
-                self.mods_tree.item(item, values=(
-                    mod_name,
-                    version_number,
-                    values[2],
-                    "Downgraded"
-                ))
+                blamed = {}
+                for issue in resolution["issues"]:
+                    for path in issue["paths"]:
+                        if path in proposed and path not in held_back:
+                            blamed.setdefault(path, issue)
+                            break
+                if not blamed:
+                    break
                 
-                self.log(f"Downgraded {mod_name} to version {version_number}")
+                for path, issue in blamed.items():
+                    held_back[path] = self.describe_issue(issue)
+            
+            resolution["held_back"] = held_back
+            self.log(
+                f"Resolved dependencies for {len(resolution['versions'])} projects: "
+                f"{len(resolution['added'])} to add, {len(held_back)} held back, {len(resolution['issues'])} issues."
+            )
+            return resolution
+
+
+class JarStore:
+    FICLONE = 0x40049409
+    TEMP_MAX_AGE = 24 * 60 * 60
+    
+    def __init__(self, root: str):
+        self.root = root
+        self.refs_path = os.path.join(root, "refs.json")
+        self.refs = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.blob_locks = {}
+        self.stats = {"hits": 0, "stored": 0, "linked": 0, "cloned": 0, "copied": 0}
+        
+        self.load()
+    
+    def load(self):
+        try:
+            with open(self.refs_path, 'r', encoding='utf-8') as refs_file:
+                self.refs = json.load(refs_file)
+        except (OSError, ValueError):
+            self.refs = {}
+    
+    def save(self):
+        with self.save_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                data = {sha512: list(paths) for sha512, paths in self.refs.items()}
+                self.dirty = False
+            
+            try:
+                write_json_file(self.refs_path, data)
+            except OSError:
+                with self.lock:
+                    self.dirty = True
+                raise
+    
+    def count(self, stat: str):
+        with self.lock:
+            self.stats[stat] += 1
+    
+    def get_blob_path(self, sha512: str) -> str:
+        return os.path.join(self.root, "blobs", sha512[:2], f"{sha512}.jar")
+    
+    def get_temp_path(self, sha512: str) -> str:
+        temp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(temp_dir, exist_ok=True)
+        return os.path.join(temp_dir, f"{sha512}.jar")
+    
+    def has(self, sha512: str) -> bool:
+        return os.path.isfile(self.get_blob_path(sha512))
+    
+    def lock_blob(self, sha512: str) -> threading.Lock:
+        with self.lock:
+            return self.blob_locks.setdefault(sha512, threading.Lock())
+    
+    def add(self, path: str, sha512: str) -> str:
+        blob_path = self.get_blob_path(sha512)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        os.replace(path, blob_path)
+        self.count("stored")
+        return blob_path
+    
+    def add_ref(self, sha512: str, path: str):
+        path = os.path.abspath(path)
+        with self.lock:
+            paths = self.refs.setdefault(sha512, [])
+            if path not in paths:
+                paths.append(path)
+                self.dirty = True
+    
+    def move_ref(self, sha512: str, old_path: str, new_path: str):
+        old_path = os.path.abspath(old_path)
+        with self.lock:
+            paths = self.refs.get(sha512, [])
+            if old_path in paths:
+                paths.remove(old_path)
+                self.dirty = True
+        self.add_ref(sha512, new_path)
+    
+    @classmethod
+    def clone(cls, source: str, target: str) -> bool:
+        if fcntl is None or not sys.platform.startswith("linux"):
+            return False
+        
+        try:
+            with open(source, 'rb') as source_file, open(target, 'wb') as target_file:
+                fcntl.ioctl(target_file.fileno(), cls.FICLONE, source_file.fileno())
+            return True
+        except OSError:
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+            return False
+    
+    def materialize(self, sha512: str, target_path: str) -> str:
+        blob_path = self.get_blob_path(sha512)
+        temp_path = f"{target_path}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        
+        try:
+            os.link(blob_path, temp_path)
+            method = "linked"
+        except OSError:
+            if self.clone(blob_path, temp_path):
+                method = "cloned"
+            else:
+                shutil.copyfile(blob_path, temp_path)
+                method = "copied"
+        
+        os.replace(temp_path, target_path)
+        self.count(method)
+        self.add_ref(sha512, target_path)
+        return method
+    
+    def is_referenced(self, sha512: str, blob_path: str, index: Optional[ModIndex] = None) -> bool:
+        live = []
+        for path in self.refs.get(sha512, []):
+            try:
+                if os.path.samefile(path, blob_path):
+                    live.append(path)
+                elif index is not None:
+                    if index.get_entry(path)["hashes"].get("sha512") == sha512:
+                        live.append(path)
+                elif os.path.getsize(path) == os.path.getsize(blob_path):
+                    live.append(path)
+            except OSError:
+                continue
+        
+        with self.lock:
+            if live != self.refs.get(sha512, []):
+                self.dirty = True
+                if live:
+                    self.refs[sha512] = live
+                else:
+                    self.refs.pop(sha512, None)
+        
+        return bool(live) or os.stat(blob_path).st_nlink > 1
+    
+    def iter_blobs(self):
+        blobs_dir = os.path.join(self.root, "blobs")
+        if not os.path.isdir(blobs_dir):
+            return
+        
+        for prefix in sorted(os.listdir(blobs_dir)):
+            prefix_dir = os.path.join(blobs_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in sorted(os.listdir(prefix_dir)):
+                if name.endswith('.jar'):
+                    yield name[:-4], os.path.join(prefix_dir, name)
+    
+    def gc(self, index: Optional[ModIndex] = None, dry_run: bool = False) -> Dict:
+        result = {"kept": 0, "removed": 0, "freed_bytes": 0}
+        
+        for sha512, blob_path in list(self.iter_blobs()):
+            if self.is_referenced(sha512, blob_path, index):
+                result["kept"] += 1
+                continue
+            
+            result["removed"] += 1
+            result["freed_bytes"] += os.path.getsize(blob_path)
+            if not dry_run:
+                os.remove(blob_path)
+                with self.lock:
+                    if self.refs.pop(sha512, None) is not None:
+                        self.dirty = True
+        
+        temp_dir = os.path.join(self.root, "tmp")
+        if not dry_run and os.path.isdir(temp_dir):
+            for name in os.listdir(temp_dir):
+                temp_path = os.path.join(temp_dir, name)
+                try:
+                    if time.time() - os.path.getmtime(temp_path) > self.TEMP_MAX_AGE:
+                        result["freed_bytes"] += os.path.getsize(temp_path)
+                        os.remove(temp_path)
+                except OSError:
+                    pass
+        
+        if not dry_run:
+            self.save()
+        return result
+
+
+class ModInstaller:
+    CHUNK_SIZE = 256 * 1024
+    MAX_WORKERS = 4
+    PART_SUFFIX = ".part"
+    
+    def __init__(self, api: ModrinthAPI, max_workers: int = MAX_WORKERS, log: Callable[[str], None] = print, 
+                 store: Optional[JarStore] = None):
+        self.api = api
+        self.max_workers = max_workers
+        self.log = log
+        self.store = store
+    
+    @staticmethod
+    def get_primary_file(version: Dict) -> Optional[Dict]:
+        files = version.get("files", [])
+        for file_info in files:
+            if file_info.get("primary"):
+                return file_info
+        return files[0] if files else None
+    
+    @staticmethod
+    def hash_partial(part_path: str):
+        sha512 = hashlib.sha512()
+        offset = 0
+        
+        if os.path.exists(part_path):
+            with open(part_path, 'rb') as part_file:
+                for block in iter(lambda: part_file.read(ModAnalyzer.HASH_BLOCK_SIZE), b''):
+                    sha512.update(block)
+                    offset += len(block)
+        
+        return sha512, offset
+    
+    def fetch(self, file_info: Dict, part_path: str):
+        sha512, offset = self.hash_partial(part_path)
+        
+        for attempt in range(self.api.retries + 1):
+            headers = {"Accept-Encoding": "identity"}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            
+            try:
+                with self.api.session.get(file_info["url"], headers=headers, stream=True, 
+                                          timeout=self.api.timeout) as response:
+                    if offset and response.status_code == 416:
+                        break
+                    
+                    if offset and response.status_code != 206:
+                        sha512, offset = hashlib.sha512(), 0
+                    
+                    response.raise_for_status()
+                    
+                    with open(part_path, 'ab' if offset else 'wb') as part_file:
+                        for chunk in response.iter_content(self.CHUNK_SIZE):
+                            part_file.write(chunk)
+                            sha512.update(chunk)
+                            offset += len(chunk)
+                            self.api.metrics.inc("download_bytes_total", len(chunk))
+                        part_file.flush()
+                        os.fsync(part_file.fileno())
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                if attempt == self.api.retries:
+                    raise
+                self.api.metrics.inc("api_retries_total", endpoint="download", reason="resume")
+                self.log(f"Download of {file_info.get('filename')} interrupted ({e}), resuming...")
+                time.sleep(self.api.get_retry_delay(attempt))
+        
+        return sha512
+    
+    def download(self, file_info: Dict, target_path: str) -> str:
+        expected = file_info.get("hashes", {}).get("sha512")
+        # Keyed by the expected hash so a partial file of another version with the same name is never resumed.
+        part_path = target_path + (f".{expected[:16]}" if expected else "") + self.PART_SUFFIX
+        
+        started = time.perf_counter()
+        for attempt in range(2):
+            sha512 = self.fetch(file_info, part_path)
+            if not expected or sha512.hexdigest() == expected:
+                break
+            
+            os.remove(part_path)
+            self.api.metrics.inc("downloads_total", result="hash_mismatch")
+            if attempt:
+                raise ValueError(f"SHA-512 mismatch for {file_info.get('filename')}")
+            self.log(f"Download of {file_info.get('filename')} failed the hash check, restarting...")
+        
+        self.api.metrics.inc("downloads_total", result="ok")
+        self.api.metrics.observe("download_seconds", time.perf_counter() - started)
+        return part_path
+    
+    def install(self, version: Dict, folder: str, replace_path: Optional[str] = None) -> str:
+        file_info = self.get_primary_file(version)
+        if not file_info:
+            raise ValueError(f"Version {version.get('version_number')} has no files")
+        
+        target_path = os.path.join(folder, os.path.basename(file_info["filename"]))
+        sha512 = file_info.get("hashes", {}).get("sha512")
+        
+        if self.store and sha512:
+            with self.store.lock_blob(sha512):
+                if self.store.has(sha512):
+                    self.store.count("hits")
+                else:
+                    self.store.add(self.download(file_info, self.store.get_temp_path(sha512)), sha512)
+            self.store.materialize(sha512, target_path)
+        else:
+            os.replace(self.download(file_info, target_path), target_path)
+        
+        if replace_path and os.path.abspath(replace_path) != os.path.abspath(target_path):
+            try:
+                os.remove(replace_path)
+            except FileNotFoundError:
+                pass
+        
+        return target_path
+    
+    def install_many(self, jobs: Dict[str, Dict], folder: str, 
+                     on_done: Callable[[str, Optional[str], Optional[Exception]], None]):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.install, job["version"], folder, job.get("replace")): key
+                for key, job in jobs.items()
+            }
+            
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    on_done(key, future.result(), None)
+                except Exception as e:
+                    on_done(key, None, e)
+        
+        if self.store:
+            try:
+                self.store.save()
+            except OSError as e:
+                self.log(f"Could not save jar store references: {e}")
+
+
+class Lockfile:
+    FILENAME = "mods.lock.json"
+    STAGING_DIR = ".sync"
+    FORMAT_VERSION = 1
+    
+    def __init__(self, path: str, entries: Optional[List[Dict]] = None, 
+                 game_version: Optional[str] = None, loader: Optional[str] = None):
+        self.path = path
+        self.entries = entries or []
+        self.game_version = game_version
+        self.loader = loader
+    
+    @classmethod
+    def load(cls, path: str) -> "Lockfile":
+        with open(path, 'r', encoding='utf-8') as lock_file:
+            data = json.load(lock_file)
+        
+        if data.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported lockfile version: {data.get('version')}")
+        
+        lockfile = cls(path, data.get("mods", []), data.get("game_version"), data.get("loader"))
+        lockfile.validate()
+        return lockfile
+    
+    @staticmethod
+    def is_safe_filename(filename) -> bool:
+        return (
+            isinstance(filename, str) and filename not in ("", ".", "..") 
+            and filename == os.path.basename(filename) and "/" not in filename and "\\" not in filename 
+            and filename.endswith(".jar")
+        )
+    
+    def validate(self):
+        # Filenames are joined onto the mods folder by sync, so they must not point anywhere else.
+        seen = set()
+        for entry in self.entries:
+            filename = entry.get("filename") if isinstance(entry, dict) else None
+            if not self.is_safe_filename(filename):
+                raise ValueError(f"Invalid file name in lockfile: {filename!r}")
+            if filename in seen:
+                raise ValueError(f"Duplicate file name in lockfile: {filename!r}")
+            if not isinstance(entry.get("hashes"), dict):
+                raise ValueError(f"Missing hashes for {filename!r} in lockfile")
+            seen.add(filename)
+    
+    def save(self):
+        data = {
+            "version": self.FORMAT_VERSION,
+            "game_version": self.game_version,
+            "loader": self.loader,
+            "mods": sorted(self.entries, key=lambda entry: entry["filename"])
+        }
+        
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as lock_file:
+            json.dump(data, lock_file, indent=2)
+            lock_file.write("\n")
+        os.replace(temp_path, self.path)
+    
+    @staticmethod
+    def create_entry(record: ModRecord, version: Optional[Dict]) -> Dict:
+        file_info = {}
+        for candidate in (version or {}).get("files", []):
+            if candidate.get("hashes", {}).get("sha1") == record.sha1:
+                file_info = candidate
+                break
+        
+        return {
+            "filename": record.filename,
+            "project_id": (version or {}).get("project_id"),
+            "version_id": (version or {}).get("id"),
+            "version_number": (version or {}).get("version_number") or record.current_version,
+            "hashes": {"sha1": record.sha1, "sha512": record.sha512},
+            "size": record.size,
+            "url": file_info.get("url")
+        }
+    
+    @staticmethod
+    def to_version(entry: Dict) -> Dict:
+        return {
+            "id": entry.get("version_id"),
+            "project_id": entry.get("project_id"),
+            "version_number": entry.get("version_number"),
+            "files": [{
+                "url": entry["url"],
+                "filename": entry["filename"],
+                "hashes": entry["hashes"],
+                "size": entry.get("size"),
+                "primary": True
+            }]
+        }
+    
+    def diff(self, registry: ModRegistry, keep_extra: bool = False) -> Dict[str, List]:
+        by_hash = {}
+        for record in registry:
+            for digest in (record.sha512, record.sha1):
+                if digest:
+                    by_hash.setdefault(digest, []).append(record)
+        
+        plan = {"keep": [], "rename": [], "download": [], "remove": []}
+        used = set()
+        
+        for entry in self.entries:
+            hashes = entry.get("hashes", {})
+            candidates = [
+                record for record in by_hash.get(hashes.get("sha512") or hashes.get("sha1"), [])
+                if record.path not in used
+            ]
+            if not candidates:
+                plan["download"].append(entry)
+                continue
+            
+            record = next((record for record in candidates if record.filename == entry["filename"]), candidates[0])
+            used.add(record.path)
+            if record.filename == entry["filename"]:
+                plan["keep"].append(entry)
+            else:
+                plan["rename"].append((record.path, entry))
+        
+        if not keep_extra:
+            plan["remove"] = [record.path for record in registry if record.path not in used]
+        return plan
+
+
+class UpdateScheduler:
+    FORMAT_VERSION = 1
+    FULL_CHECK_INTERVAL = 24 * 60 * 60
+    
+    def __init__(self, api: ModrinthAPI, game_version: str, state_path: Optional[str] = None, 
+                 max_workers: int = 8, log: Callable[[str], None] = print):
+        self.api = api
+        self.game_version = game_version
+        self.state_path = state_path
+        self.checker = UpdateChecker(api, max_workers=max_workers, log=log)
+        self.log = log
+        self.state = self.load_state()
+    
+    @staticmethod
+    def get_state_path(folder: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(folder).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(get_cache_dir(), "schedule", f"{digest}.json")
+    
+    def create_state(self) -> Dict:
+        return {"version": self.FORMAT_VERSION, "game_version": self.game_version, 
+                "full_check_at": 0, "projects": {}, "mods": {}}
+    
+    def load_state(self) -> Dict:
+        if not self.state_path:
+            return self.create_state()
+        
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as state_file:
+                state = json.load(state_file)
+        except (OSError, ValueError):
+            return self.create_state()
+        
+        if state.get("version") != self.FORMAT_VERSION or state.get("game_version") != self.game_version:
+            return self.create_state()
+        return state
+    
+    def save_state(self):
+        if not self.state_path:
+            return
+        
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as state_file:
+            json.dump(self.state, state_file, separators=(",", ":"))
+        os.replace(temp_path, self.state_path)
+    
+    @staticmethod
+    def get_key(mod: ModRecord) -> str:
+        return mod.sha1 or mod.path
+    
+    @staticmethod
+    def create_entry(mod: ModRecord, result: Dict) -> Dict:
+        latest = result.get("latest") or {}
+        return {
+            "file": mod.filename,
+            "name": mod.name,
+            "project_id": result.get("project_id"),
+            "current_version": mod.current_version or "Unknown",
+            "latest_version": latest.get("version_number"),
+            "latest_version_id": latest.get("id"),
+            "status": result.get("status")
+        }
+    
+    @staticmethod
+    def to_result(entry: Dict) -> Dict:
+        latest = None
+        if entry.get("latest_version_id"):
+            latest = {
+                "id": entry["latest_version_id"], 
+                "project_id": entry.get("project_id"), 
+                "version_number": entry.get("latest_version")
+            }
+        return {
+            "project_id": entry.get("project_id"),
+            "current": None,
+            "latest": latest,
+            "name": entry.get("name"),
+            "current_version": entry.get("current_version"),
+            "status": entry.get("status")
+        }
+    
+    @staticmethod
+    def is_miss(result: Dict) -> bool:
+        return result.get("status") == "Not found" or not result.get("project_id")
+    
+    @staticmethod
+    def get_updates(entries) -> Dict[str, Dict]:
+        # Keyed by project rather than by hash, since updating a mod changes its hash.
+        updates = {}
+        for entry in entries:
+            if entry["status"] == "Update available":
+                updates.setdefault(entry.get("project_id") or entry["file"], entry)
+        return updates
+    
+    def run_once(self, mods: Dict[str, ModRecord]) -> Dict:
+        started = time.time()
+        known = self.state["mods"]
+        full = started - self.state["full_check_at"] >= self.FULL_CHECK_INTERVAL
+        
+        by_key = {}
+        for key, mod in mods.items():
+            by_key.setdefault(self.get_key(mod), []).append(key)
+        
+        project_ids = sorted({
+            known[mod_key]["project_id"] for mod_key in by_key 
+            if mod_key in known and known[mod_key].get("project_id")
+        })
+        projects = self.api.get_projects(project_ids, revalidate=True) if project_ids and not full else {}
+        changed = {
+            project_id for project_id, project in projects.items() 
+            if project.get("updated") != self.state["projects"].get(project_id)
+        }
+        # Projects the lookup did not return (failed request or removed project) are rechecked.
+        missing = set() if full else set(project_ids) - set(projects)
+        
+        recheck = {
+            keys[0]: mods[keys[0]] for mod_key, keys in by_key.items()
+            if full or mod_key not in known or known[mod_key].get("project_id") in changed | missing
+        }
+        if missing:
+            self.log(f"Could not look up {len(missing)} of {len(project_ids)} projects, rechecking their mods.")
+        self.log(f"{len(changed)} of {len(project_ids)} projects changed, rechecking {len(recheck)} mods.")
+        errors_before = self.api.errors
+        checked = self.checker.check(recheck, self.game_version, lambda key, result: None, revalidate=True)
+        lookup_errors = self.api.errors - errors_before
+        failed = lookup_errors > 0
+        
+        new_projects = sorted({
+            result["project_id"] for result in checked.values() 
+            if result.get("project_id") and result["project_id"] not in projects
+        })
+        if new_projects:
+            projects.update(self.api.get_projects(new_projects, revalidate=True))
+        
+        entries = {}
+        results = {}
+        stale_projects = set()
+        for mod_key, keys in by_key.items():
+            mod = mods[keys[0]]
+            result = checked.get(keys[0])
+            if result is not None and failed and self.is_miss(result):
+                # A miss during a run with failed lookups may not be real, so keep what the last run found.
+                checked.pop(keys[0])
+                result = None
+                stale_projects.add((known.get(mod_key) or {}).get("project_id"))
+            
+            entry = self.create_entry(mod, result) if result is not None else known.get(mod_key)
+            if entry is None:
+                continue
+            
+            entries[mod_key] = entry
+            for key in keys:
+                results[key] = checked.get(key) or self.to_result(entry)
+        
+        previous_updates = self.get_updates(known.values())
+        updates = self.get_updates(entries.values())
+        new_updates = [
+            entry for update_key, entry in updates.items()
+            if previous_updates.get(update_key, {}).get("latest_version_id") != entry["latest_version_id"]
+        ]
+        installed = {entry.get("project_id") or entry["file"]: entry for entry in entries.values()}
+        resolved = [
+            installed[update_key] for update_key in previous_updates
+            if update_key not in updates and update_key in installed
+        ]
+        
+        self.state["mods"] = entries
+        self.state["projects"].update({
+            project_id: project.get("updated") for project_id, project in projects.items()
+            if project_id not in stale_projects
+        })
+        if full and not failed:
+            self.state["full_check_at"] = started
+        self.state["checked_at"] = started
+        
+        try:
+            self.save_state()
+        except OSError as e:
+            self.log(f"Could not save scheduler state: {e}")
+        
+        return {
+            "results": results,
+            "diff": {
+                "checked_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+                "game_version": self.game_version,
+                "full": full,
+                "projects": len(project_ids),
+                "changed_projects": sorted(changed),
+                "missing_projects": sorted(missing),
+                "lookup_errors": lookup_errors,
+                "rechecked": len(recheck),
+                "updates": len([entry for entry in entries.values() if entry["status"] == "Update available"]),
+                "new_updates": new_updates,
+                "resolved": resolved
+            }
+        }
+    
+    def run(self, get_mods: Callable[[], Dict[str, ModRecord]], interval: float, 
+            on_diff: Callable[[Dict], None], stopped: threading.Event):
+        while not stopped.is_set():
+            try:
+                outcome = self.run_once(get_mods())
+            except Exception as e:
+                self.log(f"Scheduled check failed: {type(e).__name__}: {e}")
+            else:
+                on_diff(outcome)
+            stopped.wait(interval)
+
+
+def open_default_cache() -> Optional[ResponseCache]:
+    try:
+        return ResponseCache(os.path.join(get_cache_dir(), "http_cache.sqlite"))
+    except (OSError, sqlite3.Error) as e:
+        print(f"Response cache disabled: {e}", file=sys.stderr)
+        return None
+
+
+def get_snapshot_path(args) -> str:
+    return args.snapshot or os.path.join(get_cache_dir(), "snapshot.sqlite")
+
+
+def open_default_index() -> ModIndex:
+    return ModIndex(os.path.join(get_cache_dir(), "mod_index.json"))
+
+
+def open_default_store() -> JarStore:
+    return JarStore(os.path.join(get_cache_dir(), "store"))
+
+
+def scan_folders(folders: List[str], index: ModIndex, max_workers: int = 8) -> Dict[str, ModRegistry]:
+    jars = {folder: index.list_jars(folder) for folder in folders}
+    executor = None
+    if sum(map(len, jars.values())) >= ModIndex.PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(folders), max_workers))) as pool:
+            futures = {
+                folder: pool.submit(index.scan, folder, jars=jars[folder], executor=executor)
+                for folder in folders
+            }
+            entries = {folder: future.result() for folder, future in futures.items()}
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    try:
+        index.save()
+    except OSError as e:
+        print(f"Could not save mod index: {e}", file=sys.stderr)
+    
+    registries = {}
+    for folder, folder_entries in entries.items():
+        registry = ModRegistry()
+        for entry in sorted(folder_entries, key=lambda entry: entry["path"]):
+            registry.add_entry(entry)
+        registries[folder] = registry
+    return registries
+
+
+def scan_folder(folder: str, index: ModIndex) -> ModRegistry:
+    return scan_folders([folder], index)[folder]
+
+
+def describe_mod(record: ModRecord) -> Dict:
+    return {
+        "file": record.filename,
+        "mod_id": record.mod_id,
+        "name": record.name,
+        "version": record.current_version,
+        "loader": record.loader,
+        "sha1": record.sha1,
+        "sha512": record.sha512
+    }
+
+
+def describe_result(record: ModRecord) -> Dict:
+    latest = record.latest or {}
+    return {
+        "file": record.filename,
+        "name": record.name,
+        "project_id": record.project_id,
+        "current_version": record.current_version or "Unknown",
+        "latest_version": latest.get("version_number"),
+        "latest_version_id": latest.get("id"),
+        "status": record.status
+    }
+
+
+def describe_dependency(dependency: Dict) -> Dict:
+    version = dependency["version"]
+    primary = ModInstaller.get_primary_file(version) or {}
+    return {
+        "file": primary.get("filename") or dependency["name"],
+        "name": dependency["name"],
+        "project_id": dependency["project_id"],
+        "current_version": None,
+        "latest_version": version.get("version_number"),
+        "latest_version_id": version.get("id"),
+        "status": f"Required by {dependency['required_by']}"
+    }
+
+
+def print_table(rows: List[Dict], columns: List[str]):
+    def cell(row: Dict, column: str) -> str:
+        value = row.get(column)
+        return "-" if value is None or value == "" else str(value)
+    
+    widths = {column: max([len(column)] + [len(cell(row, column)) for row in rows]) for column in columns}
+    print("  ".join(column.upper().ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(cell(row, column).ljust(widths[column]) for column in columns))
+
+
+def get_timings() -> Dict[str, float]:
+    return {"total_ms": round((time.perf_counter() - START_TIME) * 1000, 1)}
+
+
+def create_api(args) -> ModrinthAPI:
+    return ModrinthAPI(
+        base_url=args.api_url,
+        pool_size=args.concurrency * 2,
+        cache=None if args.no_cache or args.offline else open_default_cache(),
+        snapshot=MetadataSnapshot(get_snapshot_path(args)) if args.offline else None
+    )
+
+
+def get_log(args) -> Callable[[str], None]:
+    if args.verbose:
+        return lambda message: print(message, file=sys.stderr)
+    return lambda message: None
+
+
+def run_check(args, api: ModrinthAPI, registry: ModRegistry):
+    checker = UpdateChecker(api, max_workers=args.concurrency, log=get_log(args))
+    results = checker.check(registry.records, args.game_version, lambda key, result: None)
+    
+    for path, result in results.items():
+        registry.apply_result(path, result)
+
+
+def command_fleet(args) -> int:
+    folders = list(dict.fromkeys(args.folders))
+    registries = scan_folders(folders, open_default_index(), args.concurrency)
+    
+    unique = {}
+    for registry in registries.values():
+        for record in registry:
+            unique.setdefault(record.sha1 or record.path, record)
+    
+    total = sum(len(registry) for registry in registries.values())
+    get_log(args)(f"Checking {len(unique)} unique jars across {len(folders)} instances ({total} jars in total).")
+    
+    checker = UpdateChecker(create_api(args), max_workers=args.concurrency, log=get_log(args))
+    results = checker.check(unique, args.game_version, lambda key, result: None)
+    
+    instances = []
+    for folder, registry in registries.items():
+        summary = {}
+        for record in registry:
+            result = results.get(record.sha1 or record.path)
+            if result:
+                registry.apply_result(record.path, result)
+            summary[record.status] = summary.get(record.status, 0) + 1
+        
+        instances.append({
+            "folder": folder,
+            "mods": len(registry),
+            "summary": summary,
+            "updates": [describe_result(record) for record in registry if record.status == "Update available"]
+        })
+    
+    if args.json:
+        print(json.dumps({
+            "game_version": args.game_version,
+            "instances": instances,
+            "total_jars": total,
+            "unique_jars": len(unique),
+            "timings": get_timings()
+        }, indent=2))
+        return 0
+    
+    print_table([
+        {
+            "instance": instance["folder"],
+            "mods": instance["mods"],
+            "up_to_date": instance["summary"].get("Up to date", 0),
+            "updates": instance["summary"].get("Update available", 0),
+            "unknown": instance["mods"] - instance["summary"].get("Up to date", 0) 
+                       - instance["summary"].get("Update available", 0)
+        }
+        for instance in instances
+    ], ["instance", "mods", "up_to_date", "updates", "unknown"])
+    
+    updates = [dict(row, instance=instance["folder"]) for instance in instances for row in instance["updates"]]
+    if updates:
+        print()
+        print_table(updates, ["instance", "file", "current_version", "latest_version"])
+    
+    return 0
+
+
+def command_prefetch(args) -> int:
+    snapshot = MetadataSnapshot(get_snapshot_path(args))
+    api = ModrinthAPI(
+        base_url=args.api_url,
+        pool_size=args.concurrency * 2,
+        cache=None if args.no_cache else open_default_cache()
+    )
+    log = get_log(args)
+    
+    project_ids = list(args.project)
+    if args.folders:
+        registries = scan_folders(list(dict.fromkeys(args.folders)), open_default_index(), args.concurrency)
+        unique = {}
+        for registry in registries.values():
+            for record in registry:
+                unique.setdefault(record.sha1 or record.path, record)
+        
+        identified = UpdateChecker(api, max_workers=args.concurrency, log=log).identify(unique)
+        project_ids.extend(version["project_id"] for version in identified.values())
+        log(f"Identified {len(identified)} of {len(unique)} jars.")
+    
+    if not project_ids:
+        project_ids = list(snapshot.get_updated())
+    
+    try:
+        stats = snapshot.refresh(api, project_ids, dependencies=not args.no_deps, log=log)
+        counts = snapshot.get_counts()
+    finally:
+        api.close()
+        snapshot.close()
+    
+    if args.json:
+        print(json.dumps({
+            "snapshot": snapshot.path,
+            "refresh": stats,
+            "contents": counts,
+            "timings": get_timings()
+        }, indent=2))
+    else:
+        print(
+            f"Snapshot {snapshot.path}: {stats['updated']} projects refreshed, {stats['unchanged']} unchanged, "
+            f"{stats['missing']} not found ({counts['projects']} projects, {counts['versions']} versions stored)"
+        )
+    return 0
+
+
+def print_schedule_diff(diff: Dict, as_json: bool):
+    if as_json:
+        print(json.dumps(diff), flush=True)
+        return
+    
+    print(
+        f"[{diff['checked_at']}] {len(diff['new_updates'])} new updates, {diff['updates']} available "
+        f"({len(diff['changed_projects'])} of {diff['projects']} projects changed, {diff['rechecked']} mods rechecked)"
+    )
+    if diff["new_updates"]:
+        print_table(diff["new_updates"], ["file", "current_version", "latest_version"])
+    for entry in diff["resolved"]:
+        print(f"No longer outdated: {entry['file']}")
+    sys.stdout.flush()
+
+
+def command_watch(args) -> int:
+    scheduler = UpdateScheduler(
+        create_api(args), 
+        args.game_version, 
+        args.state or UpdateScheduler.get_state_path(args.folder), 
+        max_workers=args.concurrency, 
+        log=get_log(args)
+    )
+    index = open_default_index()
+    
+    def get_mods() -> Dict[str, ModRecord]:
+        return scan_folder(args.folder, index).records
+    
+    def on_diff(outcome: Dict):
+        print_schedule_diff(outcome["diff"], args.json)
+    
+    if args.once:
+        on_diff(scheduler.run_once(get_mods()))
+        return 0
+    
+    try:
+        scheduler.run(get_mods, args.interval * 60, on_diff, threading.Event())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def command_gc(args) -> int:
+    store = open_default_store()
+    index = open_default_index()
+    result = store.gc(index, dry_run=args.dry_run)
+    
+    try:
+        index.save()
+    except OSError as e:
+        print(f"Could not save mod index: {e}", file=sys.stderr)
+    
+    if args.json:
+        print(json.dumps(dict(result, store=store.root, dry_run=args.dry_run, timings=get_timings()), indent=2))
+    else:
+        verb = "Would remove" if args.dry_run else "Removed"
+        print(f"{verb} {result['removed']} unused jars ({result['freed_bytes'] / 1024 / 1024:.1f} MiB), "
+              f"kept {result['kept']} in {store.root}")
+    return 0
+
+
+def get_lockfile_path(args) -> str:
+    return args.lockfile or os.path.join(args.folder, Lockfile.FILENAME)
+
+
+def command_lock(args) -> int:
+    registry = scan_folder(args.folder, open_default_index())
+    checker = UpdateChecker(create_api(args), max_workers=args.concurrency, log=get_log(args))
+    identified = checker.identify(registry.records)
+    
+    lockfile = Lockfile(
+        get_lockfile_path(args),
+        [Lockfile.create_entry(record, identified.get(record.path)) for record in registry],
+        args.game_version,
+        DependencyResolver.get_pack_loader(registry)
+    )
+    lockfile.save()
+    
+    unpinned = [entry["filename"] for entry in lockfile.entries if not entry["url"]]
+    for filename in unpinned:
+        print(f"Warning: {filename} is not on Modrinth and cannot be downloaded by sync", file=sys.stderr)
+    
+    if args.json:
+        print(json.dumps({
+            "lockfile": lockfile.path,
+            "mods": len(lockfile.entries),
+            "unpinned": unpinned,
+            "timings": get_timings()
+        }, indent=2))
+    else:
+        print(f"Locked {len(lockfile.entries)} mods in {lockfile.path}")
+    return 0
+
+
+def command_sync(args) -> int:
+    try:
+        lockfile = Lockfile.load(get_lockfile_path(args))
+    except (OSError, ValueError) as e:
+        print(f"Could not read lockfile: {e}", file=sys.stderr)
+        return 2
+    
+    folder = os.path.abspath(args.folder)
+    plan = lockfile.diff(scan_folder(folder, open_default_index()), keep_extra=args.keep_extra)
+    
+    api = create_api(args)
+    unpinned = [entry for entry in plan["download"] if not entry.get("url")]
+    if unpinned:
+        versions = api.get_versions([entry["version_id"] for entry in unpinned if entry.get("version_id")])
+        for entry in unpinned:
+            for file_info in versions.get(entry.get("version_id"), {}).get("files", []):
+                if file_info.get("hashes", {}).get("sha512") == entry["hashes"].get("sha512"):
+                    entry["url"] = file_info["url"]
+    
+    rows = [{"file": entry["filename"], "action": "keep", "error": None} for entry in plan["keep"]]
+    
+    def add_row(filename: str, action: str, error=None):
+        rows.append({"file": filename, "action": action, "error": str(error) if error else None})
+    
+    jobs = {}
+    for entry in plan["download"]:
+        if not entry.get("url"):
+            add_row(entry["filename"], "download", "no download URL in the lockfile")
+        elif args.dry_run:
+            add_row(entry["filename"], "download")
+        else:
+            jobs[entry["filename"]] = {"version": Lockfile.to_version(entry), "replace": None}
+    
+    # Downloads land in a staging folder first, so a failed download leaves the folder untouched.
+    staging = os.path.join(folder, Lockfile.STAGING_DIR)
+    store = None
+    downloaded = {}
+    failed = {}
+    
+    def on_done(key: str, path: Optional[str], error):
+        if error:
+            failed[key] = error
+        else:
+            downloaded[key] = path
+    
+    if jobs:
+        os.makedirs(staging, exist_ok=True)
+        store = None if args.no_store else open_default_store()
+        installer = ModInstaller(api, max_workers=args.concurrency, log=get_log(args), store=store)
+        installer.install_many(jobs, staging, on_done)
+    
+    if args.dry_run:
+        for path in plan["remove"]:
+            add_row(os.path.basename(path), "remove")
+        for path, entry in plan["rename"]:
+            add_row(entry["filename"], "rename")
+    elif failed:
+        print("Some downloads failed, so no jars were removed or renamed.", file=sys.stderr)
+        for key, error in failed.items():
+            add_row(key, "download", error)
+        for key, path in downloaded.items():
+            add_row(key, "download", "not applied because another download failed")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    else:
+        for path in plan["remove"]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                add_row(os.path.basename(path), "remove", e)
+                continue
+            add_row(os.path.basename(path), "remove")
+        
+        staged = []
+        for path, entry in plan["rename"]:
+            temp_path = f"{path}.sync"
+            try:
+                os.replace(path, temp_path)
+            except OSError as e:
+                add_row(entry["filename"], "rename", e)
+                continue
+            staged.append((path, temp_path, entry))
+        for path, temp_path, entry in staged:
+            try:
+                os.replace(temp_path, os.path.join(folder, entry["filename"]))
+            except OSError as e:
+                add_row(entry["filename"], "rename", e)
+                try:
+                    os.replace(temp_path, path)
+                except OSError:
+                    pass
+                continue
+            add_row(entry["filename"], "rename")
+        
+        for key, path in downloaded.items():
+            target_path = os.path.join(folder, key)
+            try:
+                os.replace(path, target_path)
+            except OSError as e:
+                add_row(key, "download", e)
+                continue
+            sha512 = jobs[key]["version"]["files"][0]["hashes"].get("sha512")
+            if store and sha512:
+                store.move_ref(sha512, path, target_path)
+            add_row(key, "download")
+        
+        if store:
+            try:
+                store.save()
+            except OSError as e:
+                print(f"Could not save jar store references: {e}", file=sys.stderr)
+    
+    if jobs:
+        try:
+            os.rmdir(staging)
+        except OSError:
+            pass
+    
+    rows.sort(key=lambda row: row["file"])
+    if args.json:
+        print(json.dumps({
+            "folder": args.folder,
+            "lockfile": lockfile.path,
+            "changes": [row for row in rows if row["action"] != "keep"],
+            "unchanged": len(plan["keep"]),
+            "timings": get_timings()
+        }, indent=2))
+    else:
+        print_table([row for row in rows if row["action"] != "keep"], ["file", "action", "error"])
+        print(f"{len(plan['keep'])} mods already match the lockfile.")
+    
+    return 1 if any(row["error"] for row in rows) else 0
+
+
+def command_scan(args) -> int:
+    registry = scan_folder(args.folder, open_default_index())
+    rows = [describe_mod(record) for record in registry]
+    
+    if args.json:
+        print(json.dumps({"folder": args.folder, "mods": rows, "timings": get_timings()}, indent=2))
+    else:
+        print_table(rows, ["file", "mod_id", "version", "loader"])
+    return 0
+
+
+def command_check(args) -> int:
+    registry = scan_folder(args.folder, open_default_index())
+    run_check(args, create_api(args), registry)
+    rows = [describe_result(record) for record in registry]
+    
+    if args.json:
+        print(json.dumps({
+            "folder": args.folder,
+            "game_version": args.game_version,
+            "mods": rows,
+            "timings": get_timings()
+        }, indent=2))
+    else:
+        print_table(rows, ["file", "current_version", "latest_version", "status"])
+    return 0
+
+
+def command_update(args) -> int:
+    registry = scan_folder(args.folder, open_default_index())
+    api = create_api(args)
+    run_check(args, api, registry)
+    
+    wanted = set(args.only)
+    jobs = {}
+    for record in registry:
+        names = {record.filename, record.name, record.mod_id, record.project_id}
+        if record.status == "Update available" and record.current is not None:
+            if wanted and not wanted & names:
+                continue
+        elif record.status == "Possible update":
+            # Matched by name search only, so the jar may be a fork or a custom build.
+            if not wanted & names:
+                continue
+        else:
+            continue
+        
+        jobs[record.path] = {"version": record.latest, "replace": record.path}
+    
+    resolution = {"added": [], "held_back": {}, "issues": []}
+    if jobs and not args.no_deps:
+        resolver = DependencyResolver(api, max_workers=args.concurrency, log=get_log(args))
+        resolution = resolver.resolve(
+            registry.records, {path: job["version"] for path, job in jobs.items()}, args.game_version
+        )
+        for path, reason in resolution["held_back"].items():
+            del jobs[path]
+            print(f"Holding back {os.path.basename(path)}: {reason}", file=sys.stderr)
+        for issue in resolution["issues"]:
+            print(f"Warning: {DependencyResolver.describe_issue(issue)}", file=sys.stderr)
+    
+    dependencies = {}
+    for dependency in resolution["added"]:
+        key = f"dependency:{dependency['project_id']}"
+        dependencies[key] = dependency
+        jobs[key] = {"version": dependency["version"], "replace": None}
+    
+    rows = []
+    
+    def on_done(path, new_path, error):
+        row = describe_dependency(dependencies[path]) if path in dependencies else describe_result(registry.get(path))
+        row["installed"] = os.path.basename(new_path) if new_path else None
+        row["error"] = str(error) if error else None
+        rows.append(row)
+    
+    if not args.dry_run:
+        store = None if args.no_store else open_default_store()
+        installer = ModInstaller(api, max_workers=args.concurrency, log=get_log(args), store=store)
+        installer.install_many(jobs, os.path.abspath(args.folder), on_done)
+    else:
+        for path in jobs:
+            on_done(path, None, None)
+    
+    rows.sort(key=lambda row: row["file"])
+    if args.json:
+        print(json.dumps({
+            "folder": args.folder,
+            "game_version": args.game_version,
+            "updated": rows,
+            "held_back": [
+                {"file": os.path.basename(path), "reason": reason}
+                for path, reason in sorted(resolution["held_back"].items())
+            ],
+            "issues": [DependencyResolver.describe_issue(issue) for issue in resolution["issues"]],
+            "timings": get_timings()
+        }, indent=2))
+    else:
+        print_table(rows, ["file", "current_version", "latest_version", "installed", "error"])
+    
+    return 1 if any(row["error"] for row in rows) else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Check and update Minecraft mods using Modrinth.")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--metrics-json", metavar="PATH", help="write request, cache and scan metrics as JSON")
+    common.add_argument("--metrics-prom", metavar="PATH", help="write metrics as a Prometheus textfile")
+    common.add_argument("--profile", metavar="PATH", help="run under cProfile and dump the stats to PATH")
+    
+    def add_command(name: str, help_text: str, network: bool = True, 
+                    fleet: Optional[str] = None) -> argparse.ArgumentParser:
+        command = subparsers.add_parser(name, help=help_text, parents=[common])
+        if fleet:
+            command.add_argument("folders", nargs=fleet, metavar="folder", help="mods folders of the instances")
+        else:
+            command.add_argument("folder", nargs="?", default=get_default_mods_folder(), help="mods folder to use")
+        command.add_argument("--json", action="store_true", help="print machine-readable JSON")
+        if network:
+            command.add_argument("--game-version", default=DEFAULT_MINECRAFT_VERSION, help="target Minecraft version")
+            command.add_argument("--concurrency", type=int, default=8, help="parallel requests and downloads")
+            command.add_argument("--no-cache", action="store_true", help="bypass the on-disk response cache")
+            command.add_argument("--api-url", default=ModrinthAPI.BASE_URL, help="Modrinth API base URL")
+            command.add_argument("--snapshot", metavar="PATH", help="metadata snapshot path (default: in the cache dir)")
+            if name != "prefetch":
+                command.add_argument("--offline", action="store_true", help="answer lookups from the metadata snapshot")
+            command.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+        return command
+    
+    add_command("scan", "list the mods installed in a folder", network=False)
+    add_command("check", "check installed mods for updates")
+    update = add_command("update", "download available updates")
+    update.add_argument("--only", action="append", default=[], metavar="MOD", 
+                        help="only update this file, mod id or project id (repeatable)")
+    update.add_argument("--dry-run", action="store_true", help="show what would be updated")
+    update.add_argument("--no-deps", action="store_true", help="skip dependency resolution")
+    update.add_argument("--no-store", action="store_true", help="download into the folder instead of the shared jar store")
+    add_command("fleet", "check the mods folders of many instances at once", fleet="+")
+    lock = add_command("lock", f"pin the installed versions in {Lockfile.FILENAME}")
+    lock.add_argument("--lockfile", help=f"lockfile path (default: FOLDER/{Lockfile.FILENAME})")
+    sync = add_command("sync", "make the folder match its lockfile")
+    sync.add_argument("--lockfile", help=f"lockfile path (default: FOLDER/{Lockfile.FILENAME})")
+    sync.add_argument("--dry-run", action="store_true", help="show what would change")
+    sync.add_argument("--keep-extra", action="store_true", help="keep jars that are not in the lockfile")
+    sync.add_argument("--no-store", action="store_true", help="download into the folder instead of the shared jar store")
+    watch = add_command("watch", "recheck for updates on an interval and report new ones")
+    watch.add_argument("--interval", type=float, default=60, metavar="MINUTES", help="minutes between checks")
+    watch.add_argument("--once", action="store_true", help="run a single check and exit")
+    watch.add_argument("--state", metavar="PATH", help="state file for change detection (default: in the cache dir)")
+    prefetch = add_command("prefetch", "download project and version metadata for offline use", fleet="*")
+    prefetch.add_argument("--project", action="append", default=[], metavar="ID", 
+                          help="also snapshot this project id or slug (repeatable)")
+    prefetch.add_argument("--no-deps", action="store_true", help="skip the required dependencies of each project")
+    
+    gc = subparsers.add_parser("gc", help="remove jars from the shared store that no mods folder uses", parents=[common])
+    gc.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+    gc.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    
+    return parser
+
+
+def export_metrics(args, status: int):
+    METRICS.set("last_run_timestamp_seconds", round(time.time(), 3), command=args.command)
+    METRICS.set("run_duration_seconds", round(time.perf_counter() - START_TIME, 3), command=args.command)
+    METRICS.set("run_exit_status", status, command=args.command)
+    
+    if getattr(args, "verbose", False):
+        print(METRICS.describe(), file=sys.stderr)
+    
+    try:
+        if args.metrics_json:
+            METRICS.write_json(args.metrics_json)
+        if args.metrics_prom:
+            METRICS.write_prometheus(args.metrics_prom)
+    except OSError as e:
+        print(f"Could not write metrics: {e}", file=sys.stderr)
+
+
+def run_gui():
+    sys.modules.setdefault("mc_mod_updater", sys.modules[__name__])
+    import mc_mod_gui
+    mc_mod_gui.run()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    
+    if args.command is None:
+        run_gui()
+        return 0
+    
+    logging.basicConfig(
+        level=logging.INFO if getattr(args, "verbose", False) else logging.WARNING,
+        format="%(levelname)s: %(message)s",
+        stream=sys.stderr
+    )
+    
+    if args.command == "sync":
+        os.makedirs(args.folder, exist_ok=True)
+    
+    for folder in getattr(args, "folders", None) or ([args.folder] if "folder" in args else []):
+        if not os.path.isdir(folder):
+            print(f"Folder not found: {folder}", file=sys.stderr)
+            return 2
+    
+    if getattr(args, "offline", False) and not os.path.isfile(get_snapshot_path(args)):
+        print(f"No metadata snapshot at {get_snapshot_path(args)}, run prefetch first", file=sys.stderr)
+        return 2
+    
+    commands = {
+        "scan": command_scan,
+        "check": command_check,
+        "update": command_update,
+        "fleet": command_fleet,
+        "lock": command_lock,
+        "sync": command_sync,
+        "watch": command_watch,
+        "prefetch": command_prefetch,
+        "gc": command_gc
+    }
+    
+    if args.profile:
+        import cProfile
+        
+        profiler = cProfile.Profile()
+        try:
+            status = profiler.runcall(commands[args.command], args)
+        finally:
+            profiler.dump_stats(args.profile)
+            print(f"Profile written to {args.profile}", file=sys.stderr)
+    else:
+        status = commands[args.command](args)
+    
+    export_metrics(args, status)
+    return status
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = ModManagerApp(root)
-    root.mainloop()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+from mc_mod_updater import ModAnalyzer, analyze_mod_file
+
+MODS_TOML = '''modLoader="javafml"
+loaderVersion="[47,)"
+
+[[mods]]
+modId="{mod_id}"
+version="{version}"
+displayName="Example Mod"
+
+[[dependencies.{mod_id}]]
+modId="{loader}"
+mandatory=true
+'''
+
+
+class ModAnalyzerTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def write_jar(self, members, name="mod.jar"):
+        path = os.path.join(self.temp_dir.name, name)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as jar:
+            for member_name, content in members.items():
+                jar.writestr(member_name, content)
+        return path
+    
+    def test_reads_fabric_metadata_and_hashes(self):
+        path = self.write_jar({"fabric.mod.json": json.dumps({"id": "sodium", "version": "0.5.8", "name": "Sodium"})})
+        
+        analysis = ModAnalyzer.analyze_jar(path)
+        
+        self.assertEqual(analysis["info"], {"mod_id": "sodium", "version": "0.5.8", "name": "Sodium", "type": "fabric"})
+        with open(path, "rb") as jar_file:
+            data = jar_file.read()
+        self.assertEqual(analysis["hashes"], {
+            "sha1": hashlib.sha1(data).hexdigest(), "sha512": hashlib.sha512(data).hexdigest()
+        })
+    
+    def test_quilt_takes_precedence_over_fabric(self):
+        path = self.write_jar({
+            "fabric.mod.json": json.dumps({"id": "fabric_id", "version": "1"}),
+            "quilt.mod.json": json.dumps({"quilt_loader": {"id": "quilt_id", "version": "2"}})
+        })
+        
+        info = ModAnalyzer.analyze_jar(path)["info"]
+        
+        self.assertEqual((info["mod_id"], info["version"], info["name"], info["type"]), ("quilt_id", "2", "quilt_id", "quilt"))
+    
+    def test_reads_forge_and_neoforge_toml(self):
+        forge = self.write_jar({"META-INF/mods.toml": MODS_TOML.format(mod_id="jei", version="15.2", loader="forge")}, "forge.jar")
+        neoforge = self.write_jar(
+            {"META-INF/mods.toml": MODS_TOML.format(mod_id="jei", version="19.0", loader="neoforge")}, "neoforge.jar"
+        )
+        
+        self.assertEqual(ModAnalyzer.analyze_jar(forge)["info"]["type"], "forge")
+        info = ModAnalyzer.analyze_jar(neoforge)["info"]
+        self.assertEqual((info["mod_id"], info["version"], info["name"], info["type"]), ("jei", "19.0", "Example Mod", "neoforge"))
+    
+    def test_version_placeholder_uses_manifest(self):
+        path = self.write_jar({
+            "META-INF/MANIFEST.MF": "Manifest-Version: 1.0\r\nImplementation-Version: 4.1.2\r\n",
+            "META-INF/mods.toml": MODS_TOML.format(mod_id="create", version="${file.jarVersion}", loader="forge")
+        })
+        
+        self.assertEqual(ModAnalyzer.analyze_jar(path)["info"]["version"], "4.1.2")
+    
+    def test_reads_legacy_mcmod_info(self):
+        path = self.write_jar({"mcmod.info": json.dumps([{"modid": "oldmod", "version": "1.7", "name": "Old Mod"}])})
+        
+        info = ModAnalyzer.analyze_jar(path)["info"]
+        
+        self.assertEqual((info["mod_id"], info["type"], info["mod_ids"]), ("oldmod", "forge", ["oldmod"]))
+    
+    def test_jar_without_descriptor_falls_back_to_file_name(self):
+        path = self.write_jar({"readme.txt": "hello"}, "library-1.0.jar")
+        
+        info = ModAnalyzer.analyze_jar(path)["info"]
+        
+        self.assertEqual((info["mod_id"], info["name"], info["type"]), (None, "library-1.0", "unknown"))
+    
+    def test_broken_and_empty_files_are_reported_as_errors(self):
+        broken = os.path.join(self.temp_dir.name, "broken.jar")
+        with open(broken, "wb") as broken_file:
+            broken_file.write(b"not a zip file")
+        empty = os.path.join(self.temp_dir.name, "empty.jar")
+        open(empty, "wb").close()
+        
+        with self.assertLogs("mc_mod_updater", "WARNING"):
+            self.assertEqual(ModAnalyzer.analyze_jar(broken)["info"]["type"], "error")
+        self.assertEqual(ModAnalyzer.analyze_jar(empty)["info"]["type"], "error")
+        self.assertEqual(ModAnalyzer.analyze_jar(empty)["hashes"]["sha1"], hashlib.sha1(b"").hexdigest())
+    
+    def test_missing_file_has_no_hashes(self):
+        with self.assertLogs("mc_mod_updater", "WARNING"):
+            analysis = analyze_mod_file(os.path.join(self.temp_dir.name, "missing.jar"))
+        
+        self.assertEqual((analysis["info"]["type"], analysis["hashes"]), ("error", {}))
+        self.assertIn("seconds", analysis)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mc_mod_updater import Metrics, ModrinthAPI, RateLimiter
+
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+    
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        status, headers = self.server.script.pop(0) if self.server.script else (200, {})
+        body = json.dumps({"hits": []}).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def get_free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class ModrinthAPIRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHandler)
+        self.server.script = []
+        self.server.paths = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.api = self.create_api(f"http://127.0.0.1:{self.server.server_port}/v2")
+    
+    def tearDown(self):
+        self.api.close()
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def create_api(self, base_url, retries=3):
+        api = ModrinthAPI(base_url=base_url, retries=retries, rate_limiter=RateLimiter(rate=1000, burst=100), 
+                          metrics=Metrics())
+        api.BACKOFF_BASE = 0.01
+        return api
+    
+    def retries(self, reason):
+        return self.api.metrics.get_counter("api_retries_total", reason=reason)
+    
+    def test_retries_server_errors(self):
+        self.server.script = [(503, {}), (502, {})]
+        
+        response = self.api.request("GET", f"{self.api.base_url}/search")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.paths), 3)
+        self.assertEqual(self.retries("5xx"), 2)
+    
+    def test_gives_up_after_max_retries(self):
+        self.server.script = [(500, {})] * 10
+        
+        response = self.api.request("GET", f"{self.api.base_url}/search")
+        
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(len(self.server.paths), 4)
+    
+    def test_client_errors_are_not_retried(self):
+        self.server.script = [(404, {})]
+        
+        self.assertEqual(self.api.request("GET", f"{self.api.base_url}/project/x").status_code, 404)
+        self.assertEqual(len(self.server.paths), 1)
+    
+    def test_rate_limited_request_pauses_limiter(self):
+        self.server.script = [(429, {"Retry-After": "0"})]
+        
+        response = self.api.request("GET", f"{self.api.base_url}/search")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.retries("429"), 1)
+        self.assertGreater(self.api.rate_limiter.paused_until, 0)
+    
+    def test_every_attempt_takes_a_token(self):
+        self.server.script = [(503, {}), (503, {})]
+        acquired = []
+        acquire = self.api.rate_limiter.acquire
+        self.api.rate_limiter.acquire = lambda: acquired.append(True) or acquire()
+        
+        self.api.request("GET", f"{self.api.base_url}/search")
+        
+        self.assertEqual(len(acquired), 3)
+    
+    def test_retry_delay_is_jittered_and_capped(self):
+        delays = {self.api.get_retry_delay(2) for _ in range(20)}
+        
+        self.assertGreater(len(delays), 1)
+        self.assertTrue(all(0 <= delay <= 0.04 for delay in delays))
+        self.assertLessEqual(self.api.get_retry_delay(50), ModrinthAPI.BACKOFF_CAP)
+    
+    def test_connection_errors_are_retried_then_raised(self):
+        api = self.create_api(f"http://127.0.0.1:{get_free_port()}/v2", retries=2)
+        
+        with self.assertRaises(Exception):
+            api.request("GET", f"{api.base_url}/search")
+        
+        self.assertEqual(api.metrics.get_counter("api_retries_total", reason="connection"), 2)
+        api.close()
+    
+    def test_endpoint_labels_hide_ids(self):
+        self.assertEqual(self.api.get_endpoint(f"{self.api.base_url}/project/AANobbMI/version"), "/project/{id}/version")
+        self.assertEqual(self.api.get_endpoint(f"{self.api.base_url}/version_files/update"), "/version_files/update")
+
+
+if __name__ == "__main__":
+    unittest.main()
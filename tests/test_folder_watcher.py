@@ -0,0 +1,78 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from mc_mod_updater import FolderWatcher
+
+
+class PollingWatcher(FolderWatcher):
+    def open_inotify(self):
+        return None
+
+
+class FolderWatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        self.batches = []
+        self.changed = threading.Event()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def on_change(self, paths):
+        self.batches.append(paths)
+        self.changed.set()
+    
+    def write(self, name, content=b"jar"):
+        path = os.path.join(self.folder, name)
+        with open(path, "wb") as target:
+            target.write(content)
+        return path
+    
+    def start(self, watcher):
+        watcher.start()
+        self.addCleanup(watcher.thread.join, 2)
+        self.addCleanup(watcher.stop)
+        return watcher
+    
+    def test_burst_of_changes_is_one_batch(self):
+        existing = self.write("old.jar")
+        watcher = self.start(PollingWatcher(self.folder, self.on_change, debounce=0.3, interval=0.05))
+        self.assertEqual(watcher.backend, "polling")
+        
+        first = self.write("a.jar")
+        time.sleep(0.1)
+        second = self.write("b.jar")
+        os.remove(existing)
+        self.write("notes.txt")
+        
+        self.assertTrue(self.changed.wait(3))
+        time.sleep(0.4)
+        self.assertEqual(self.batches, [{first, second, existing}])
+    
+    def test_unchanged_folder_reports_nothing(self):
+        self.write("a.jar")
+        self.start(PollingWatcher(self.folder, self.on_change, debounce=0.05, interval=0.05))
+        
+        self.assertFalse(self.changed.wait(0.3))
+    
+    def test_continuous_changes_flush_after_max_delay(self):
+        watcher = PollingWatcher(self.folder, self.on_change, debounce=0.3, interval=0.05)
+        watcher.MAX_DELAY = 0.5
+        self.start(watcher)
+        
+        deadline = time.monotonic() + 3
+        count = 0
+        while not self.changed.is_set() and time.monotonic() < deadline:
+            self.write("a.jar", b"x" * count)
+            count += 1
+            time.sleep(0.1)
+        
+        self.assertTrue(self.changed.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mc_mod_updater import Metrics, ModInstaller, ModrinthAPI
+
+CONTENT = bytes(range(256)) * 64
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+    
+    def do_GET(self):
+        server = self.server
+        server.ranges.append(self.headers.get("Range"))
+        body = server.body
+        
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].split("=", 1)[1].split("-", 1)[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        
+        if server.cut_after:
+            cut, server.cut_after = server.cut_after, None
+            self.wfile.write(body[start:start + cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+class ModInstallerDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+        self.server.body = CONTENT
+        self.server.ranges = []
+        self.server.cut_after = None
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.target = os.path.join(self.temp_dir.name, "mod.jar")
+        self.metrics = Metrics()
+        self.api = ModrinthAPI(base_url=f"http://127.0.0.1:{self.server.server_port}/v2", metrics=self.metrics)
+        self.api.BACKOFF_BASE = 0.01
+        self.installer = ModInstaller(self.api, log=lambda message: None)
+        self.file_info = {
+            "url": f"http://127.0.0.1:{self.server.server_port}/files/mod.jar",
+            "filename": "mod.jar",
+            "hashes": {"sha512": hashlib.sha512(CONTENT).hexdigest()}
+        }
+        self.part_path = self.target + f".{self.file_info['hashes']['sha512'][:16]}" + ModInstaller.PART_SUFFIX
+    
+    def tearDown(self):
+        self.api.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+    
+    def write_part(self, data):
+        with open(self.part_path, "wb") as part_file:
+            part_file.write(data)
+    
+    def read(self, path):
+        with open(path, "rb") as downloaded:
+            return downloaded.read()
+    
+    def test_downloads_and_verifies(self):
+        path = self.installer.download(self.file_info, self.target)
+        
+        self.assertEqual(path, self.part_path)
+        self.assertEqual(self.read(path), CONTENT)
+        self.assertEqual(self.server.ranges, [None])
+        self.assertEqual(self.metrics.get_counter("downloads_total", result="ok"), 1)
+    
+    def test_resumes_valid_partial_file(self):
+        self.write_part(CONTENT[:5000])
+        
+        self.installer.download(self.file_info, self.target)
+        
+        self.assertEqual(self.read(self.part_path), CONTENT)
+        self.assertEqual(self.server.ranges, ["bytes=5000-"])
+        self.assertEqual(self.metrics.get_counter("download_bytes_total"), len(CONTENT) - 5000)
+    
+    def test_complete_partial_file_is_not_downloaded_again(self):
+        self.write_part(CONTENT)
+        
+        self.installer.download(self.file_info, self.target)
+        
+        self.assertEqual(self.server.ranges, [f"bytes={len(CONTENT)}-"])
+        self.assertEqual(self.metrics.get_counter("download_bytes_total"), 0)
+    
+    def test_resumes_after_interrupted_transfer(self):
+        self.server.cut_after = 4000
+        self.installer.CHUNK_SIZE = 1000
+        
+        self.installer.download(self.file_info, self.target)
+        
+        self.assertEqual(self.read(self.part_path), CONTENT)
+        self.assertEqual(self.server.ranges, [None, "bytes=4000-"])
+        self.assertEqual(self.metrics.get_counter("api_retries_total", reason="resume"), 1)
+    
+    def test_corrupt_partial_file_restarts_from_zero(self):
+        self.write_part(b"x" * 5000)
+        
+        self.installer.download(self.file_info, self.target)
+        
+        self.assertEqual(self.read(self.part_path), CONTENT)
+        self.assertEqual(self.server.ranges, ["bytes=5000-", None])
+        self.assertEqual(self.metrics.get_counter("downloads_total", result="hash_mismatch"), 1)
+    
+    def test_partial_file_of_another_version_is_ignored(self):
+        with open(self.target + ModInstaller.PART_SUFFIX, "wb") as stale:
+            stale.write(b"old version")
+        
+        self.installer.download(self.file_info, self.target)
+        
+        self.assertEqual(self.server.ranges, [None])
+    
+    def test_persistent_mismatch_raises_and_removes_partial_file(self):
+        self.server.body = CONTENT[::-1]
+        
+        with self.assertRaises(ValueError):
+            self.installer.download(self.file_info, self.target)
+        
+        self.assertFalse(os.path.exists(self.part_path))
+        self.assertEqual(self.metrics.get_counter("downloads_total", result="hash_mismatch"), 2)
+    
+    def test_install_moves_download_into_place(self):
+        version = {"version_number": "1.0", "files": [dict(self.file_info, primary=True)]}
+        old_path = os.path.join(self.temp_dir.name, "mod-old.jar")
+        with open(old_path, "wb") as old_file:
+            old_file.write(b"old")
+        
+        path = self.installer.install(version, self.temp_dir.name, replace_path=old_path)
+        
+        self.assertEqual(path, self.target)
+        self.assertEqual(self.read(self.target), CONTENT)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertFalse(os.path.exists(self.part_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
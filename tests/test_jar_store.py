@@ -0,0 +1,105 @@
+import hashlib
+import os
+import tempfile
+import time
+import unittest
+
+from mc_mod_updater import JarStore, ModIndex
+
+
+class JarStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temp_dir.name, "store")
+        self.folder = os.path.join(self.temp_dir.name, "mods")
+        os.makedirs(self.folder)
+        self.store = JarStore(self.root)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def add_blob(self, content):
+        sha512 = hashlib.sha512(content).hexdigest()
+        temp_path = self.store.get_temp_path(sha512)
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(content)
+        self.store.add(temp_path, sha512)
+        return sha512
+    
+    def write(self, path, content):
+        with open(path, "wb") as target:
+            target.write(content)
+    
+    def test_materialized_copies_share_the_blob(self):
+        sha512 = self.add_blob(b"jar contents")
+        first = os.path.join(self.folder, "a.jar")
+        second = os.path.join(self.temp_dir.name, "b.jar")
+        
+        self.assertEqual(self.store.materialize(sha512, first), "linked")
+        self.store.materialize(sha512, second)
+        
+        self.assertTrue(os.path.samefile(first, self.store.get_blob_path(sha512)))
+        self.assertTrue(os.path.samefile(second, self.store.get_blob_path(sha512)))
+        self.assertEqual(self.store.refs[sha512], [first, second])
+        self.assertEqual(self.store.stats["linked"], 2)
+    
+    def test_refs_survive_reload(self):
+        sha512 = self.add_blob(b"jar contents")
+        self.store.materialize(sha512, os.path.join(self.folder, "a.jar"))
+        self.store.save()
+        
+        self.assertEqual(JarStore(self.root).refs, {sha512: [os.path.join(self.folder, "a.jar")]})
+    
+    def test_gc_keeps_linked_blobs_and_removes_unreferenced_ones(self):
+        kept = self.add_blob(b"in use")
+        removed = self.add_blob(b"no longer used")
+        self.store.materialize(kept, os.path.join(self.folder, "kept.jar"))
+        self.store.materialize(removed, os.path.join(self.folder, "removed.jar"))
+        os.remove(os.path.join(self.folder, "removed.jar"))
+        
+        result = self.store.gc()
+        
+        self.assertEqual((result["kept"], result["removed"], result["freed_bytes"]), (1, 1, len(b"no longer used")))
+        self.assertTrue(self.store.has(kept))
+        self.assertFalse(self.store.has(removed))
+        self.assertEqual(list(self.store.refs), [kept])
+    
+    def test_gc_dry_run_removes_nothing(self):
+        sha512 = self.add_blob(b"unused")
+        
+        result = self.store.gc(dry_run=True)
+        
+        self.assertEqual(result["removed"], 1)
+        self.assertTrue(self.store.has(sha512))
+    
+    def test_gc_checks_copied_files_by_hash(self):
+        content = b"copied jar"
+        sha512 = self.add_blob(content)
+        copy_path = os.path.join(self.folder, "copy.jar")
+        self.write(copy_path, content)
+        self.store.add_ref(sha512, copy_path)
+        index = ModIndex()
+        
+        with self.assertLogs("mc_mod_updater", "WARNING"):
+            self.assertEqual(self.store.gc(index)["kept"], 1)
+            
+            self.write(copy_path, b"replaced by another version")
+            self.assertEqual(self.store.gc(index)["removed"], 1)
+        self.assertFalse(self.store.has(sha512))
+    
+    def test_gc_removes_old_temp_files(self):
+        old_temp = self.store.get_temp_path("0" * 128)
+        new_temp = self.store.get_temp_path("1" * 128)
+        self.write(old_temp, b"old partial")
+        self.write(new_temp, b"new partial")
+        stale = time.time() - JarStore.TEMP_MAX_AGE - 60
+        os.utime(old_temp, (stale, stale))
+        
+        self.store.gc()
+        
+        self.assertFalse(os.path.exists(old_temp))
+        self.assertTrue(os.path.exists(new_temp))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mc_mod_updater import Lockfile, ModRecord, ModRegistry
+
+FOLDER = os.path.abspath("mods")
+
+
+def make_entry(filename, digest, url="https://cdn.example/file.jar"):
+    return {
+        "filename": filename,
+        "project_id": f"project-{digest}",
+        "version_id": f"version-{digest}",
+        "version_number": "1.0.0",
+        "hashes": {"sha1": f"sha1-{digest}", "sha512": f"sha512-{digest}"},
+        "size": 100,
+        "url": url
+    }
+
+
+def make_registry(files):
+    registry = ModRegistry()
+    for filename, digest in files:
+        registry.add(ModRecord(os.path.join(FOLDER, filename), sha1=f"sha1-{digest}", sha512=f"sha512-{digest}"))
+    return registry
+
+
+class LockfileDiffTest(unittest.TestCase):
+    def diff(self, entries, files, keep_extra=False):
+        return Lockfile("mods.lock.json", entries).diff(make_registry(files), keep_extra=keep_extra)
+    
+    def test_matching_folder_keeps_everything(self):
+        plan = self.diff([make_entry("a.jar", "a"), make_entry("b.jar", "b")], [("a.jar", "a"), ("b.jar", "b")])
+        
+        self.assertEqual([entry["filename"] for entry in plan["keep"]], ["a.jar", "b.jar"])
+        self.assertEqual((plan["rename"], plan["download"], plan["remove"]), ([], [], []))
+    
+    def test_renamed_jar_is_renamed_not_downloaded(self):
+        plan = self.diff([make_entry("a-1.0.jar", "a")], [("a-old-name.jar", "a")])
+        
+        self.assertEqual(plan["rename"], [(os.path.join(FOLDER, "a-old-name.jar"), make_entry("a-1.0.jar", "a"))])
+        self.assertEqual((plan["keep"], plan["download"], plan["remove"]), ([], [], []))
+    
+    def test_swapped_names_are_two_renames(self):
+        plan = self.diff([make_entry("a.jar", "a"), make_entry("b.jar", "b")], [("a.jar", "b"), ("b.jar", "a")])
+        
+        renames = {os.path.basename(path): entry["filename"] for path, entry in plan["rename"]}
+        self.assertEqual(renames, {"b.jar": "a.jar", "a.jar": "b.jar"})
+        self.assertEqual((plan["keep"], plan["download"], plan["remove"]), ([], [], []))
+    
+    def test_duplicate_jars_prefer_the_locked_name(self):
+        plan = self.diff([make_entry("a.jar", "a")], [("a-copy.jar", "a"), ("a.jar", "a")])
+        
+        self.assertEqual([entry["filename"] for entry in plan["keep"]], ["a.jar"])
+        self.assertEqual(plan["rename"], [])
+        self.assertEqual(plan["remove"], [os.path.join(FOLDER, "a-copy.jar")])
+    
+    def test_changed_and_missing_jars_are_downloaded(self):
+        plan = self.diff([make_entry("a.jar", "a2"), make_entry("b.jar", "b")], [("a.jar", "a1")])
+        
+        self.assertEqual([entry["filename"] for entry in plan["download"]], ["a.jar", "b.jar"])
+        self.assertEqual(plan["remove"], [os.path.join(FOLDER, "a.jar")])
+    
+    def test_extra_jars_are_removed(self):
+        plan = self.diff([make_entry("a.jar", "a")], [("a.jar", "a"), ("extra.jar", "x")])
+        
+        self.assertEqual(plan["remove"], [os.path.join(FOLDER, "extra.jar")])
+    
+    def test_keep_extra_removes_nothing(self):
+        plan = self.diff([make_entry("a.jar", "a2")], [("a.jar", "a1"), ("extra.jar", "x")], keep_extra=True)
+        
+        self.assertEqual(plan["remove"], [])
+        self.assertEqual([entry["filename"] for entry in plan["download"]], ["a.jar"])
+    
+    def test_sha1_only_entry_still_matches(self):
+        entry = make_entry("a.jar", "a")
+        entry["hashes"]["sha512"] = None
+        
+        plan = self.diff([entry], [("a.jar", "a")])
+        
+        self.assertEqual(plan["keep"], [entry])
+
+
+class LockfileLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, Lockfile.FILENAME)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def load(self, entries, version=Lockfile.FORMAT_VERSION):
+        with open(self.path, "w", encoding="utf-8") as lock_file:
+            json.dump({"version": version, "game_version": "1.21.5", "loader": "fabric", "mods": entries}, lock_file)
+        return Lockfile.load(self.path)
+    
+    def test_round_trip(self):
+        lockfile = Lockfile(self.path, [make_entry("b.jar", "b"), make_entry("a.jar", "a")], "1.21.5", "fabric")
+        lockfile.save()
+        
+        loaded = Lockfile.load(self.path)
+        
+        self.assertEqual([entry["filename"] for entry in loaded.entries], ["a.jar", "b.jar"])
+        self.assertEqual((loaded.game_version, loaded.loader), ("1.21.5", "fabric"))
+    
+    def test_rejects_unsupported_version(self):
+        with self.assertRaises(ValueError):
+            self.load([], version=99)
+    
+    def test_rejects_filenames_outside_the_folder(self):
+        for filename in ("../evil.jar", "sub/dir.jar", "/tmp/evil.jar", "..\\evil.jar", "..", "", None, "notes.txt"):
+            with self.subTest(filename=filename), self.assertRaises(ValueError):
+                self.load([make_entry("a.jar", "a"), dict(make_entry("x.jar", "x"), filename=filename)])
+    
+    def test_rejects_duplicate_filenames(self):
+        with self.assertRaises(ValueError):
+            self.load([make_entry("a.jar", "a"), make_entry("a.jar", "b")])
+    
+    def test_rejects_entries_without_hashes(self):
+        entry = make_entry("a.jar", "a")
+        del entry["hashes"]
+        
+        with self.assertRaises(ValueError):
+            self.load([entry])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from mc_mod_updater import Metrics
+
+
+class MetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Metrics()
+    
+    def lines(self):
+        return self.metrics.to_prometheus().splitlines()
+    
+    def test_empty_registry_exports_nothing(self):
+        self.assertEqual(self.metrics.to_prometheus(), "\n")
+    
+    def test_counter_family_is_typed_once(self):
+        self.metrics.inc("api_requests_total", endpoint="/search", status=200)
+        self.metrics.inc("api_requests_total", endpoint="/search", status=200)
+        self.metrics.inc("api_requests_total", 3, endpoint="/projects", status=429)
+        
+        self.assertEqual(self.lines(), [
+            "# TYPE mc_mod_updater_api_requests_total counter",
+            'mc_mod_updater_api_requests_total{endpoint="/projects",status="429"} 3',
+            'mc_mod_updater_api_requests_total{endpoint="/search",status="200"} 2',
+        ])
+    
+    def test_gauge_without_labels(self):
+        self.metrics.set("run_exit_status", 0)
+        
+        self.assertEqual(self.lines(), [
+            "# TYPE mc_mod_updater_run_exit_status gauge",
+            "mc_mod_updater_run_exit_status 0",
+        ])
+    
+    def test_label_values_are_escaped(self):
+        self.metrics.inc("errors_total", message='bad "path"\\x\nnext')
+        
+        self.assertEqual(self.lines()[1], 'mc_mod_updater_errors_total{message="bad \\"path\\"\\\\x\\nnext"} 1')
+    
+    def test_histogram_buckets_are_cumulative(self):
+        for value in (0.002, 0.02, 0.2, 60.0):
+            self.metrics.observe("api_request_seconds", value, endpoint="/search")
+        
+        lines = self.lines()
+        self.assertEqual(lines[0], "# TYPE mc_mod_updater_api_request_seconds histogram")
+        buckets = {
+            line.split('le="')[1].split('"')[0]: int(line.rsplit(" ", 1)[1])
+            for line in lines if "_bucket" in line
+        }
+        self.assertEqual(buckets["0.001"], 0)
+        self.assertEqual(buckets["0.005"], 1)
+        self.assertEqual(buckets["0.025"], 2)
+        self.assertEqual(buckets["0.25"], 3)
+        self.assertEqual(buckets["30.0"], 3)
+        self.assertEqual(buckets["+Inf"], 4)
+        self.assertEqual(list(buckets.values()), sorted(buckets.values()))
+        self.assertIn('mc_mod_updater_api_request_seconds_count{endpoint="/search"} 4', lines)
+        self.assertTrue(any(line.startswith('mc_mod_updater_api_request_seconds_sum{endpoint="/search"} 60.22')
+                            for line in lines))
+    
+    def test_get_counter_sums_matching_labels(self):
+        self.metrics.inc("api_cache_total", endpoint="/search", result="hit")
+        self.metrics.inc("api_cache_total", endpoint="/projects", result="hit")
+        self.metrics.inc("api_cache_total", endpoint="/projects", result="miss")
+        
+        self.assertEqual(self.metrics.get_counter("api_cache_total", result="hit"), 2)
+        self.assertEqual(self.metrics.get_counter("api_cache_total"), 3)
+    
+    def test_summary_quantiles(self):
+        for value in (0.003, 0.004, 0.004, 2.0):
+            self.metrics.observe("download_seconds", value)
+        
+        summary = self.metrics.summary()["histograms"]["download_seconds"][""]
+        self.assertEqual((summary["count"], summary["p50"], summary["p95"], summary["max"]), (4, 0.005, 2.5, 2.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
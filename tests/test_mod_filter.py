@@ -0,0 +1,70 @@
+import unittest
+
+from mc_mod_updater import ModFilter, ModRecord
+
+
+def make_record(path, name, mod_id, loader, status="Installed", version=None):
+    record = ModRecord(path, name=name, mod_id=mod_id, loader=loader, current_version=version)
+    record.status = status
+    return record
+
+
+class ModFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.filter = ModFilter()
+        for record in (
+            make_record("sodium.jar", "Sodium", "sodium", "fabric", "Update available", "0.5.10"),
+            make_record("lithium.jar", "Lithium", "lithium", "fabric", "Up to date", "0.5.9"),
+            make_record("jei.jar", "Just Enough Items", "jei", "forge", "Update available", "19.0.2"),
+            make_record("create.jar", "Create", "create", "forge", "Not found", "0.5.1")
+        ):
+            self.filter.update(record)
+    
+    def test_empty_query_matches_everything(self):
+        self.assertEqual(sorted(self.filter.search("  ")), ["create.jar", "jei.jar", "lithium.jar", "sodium.jar"])
+    
+    def test_free_text_matches_name_or_mod_id(self):
+        self.assertEqual(sorted(self.filter.search("ium")), ["lithium.jar", "sodium.jar"])
+        self.assertEqual(self.filter.search("enough"), ["jei.jar"])
+        self.assertEqual(self.filter.search("JEI"), ["jei.jar"])
+    
+    def test_field_prefixes_match_start_of_field(self):
+        self.assertEqual(sorted(self.filter.search("loader:forge")), ["create.jar", "jei.jar"])
+        self.assertEqual(sorted(self.filter.search("status:update")), ["jei.jar", "sodium.jar"])
+        self.assertEqual(sorted(self.filter.search("loader:fab status:up")), ["lithium.jar", "sodium.jar"])
+        self.assertEqual(self.filter.search("loader:abric"), [])
+    
+    def test_unknown_prefix_is_free_text(self):
+        self.assertEqual(self.filter.search("version:1"), [])
+    
+    def test_narrowing_query_matches_full_search(self):
+        for query in ("s", "so", "sod", "sod loader:f", "sod loader:forge"):
+            narrowed = self.filter.search(query)
+            self.filter.last_terms = None
+            self.assertEqual(narrowed, self.filter.search(query), query)
+    
+    def test_widening_query_searches_everything_again(self):
+        self.assertEqual(self.filter.search("sodium"), ["sodium.jar"])
+        self.assertEqual(sorted(self.filter.search("s")), ["jei.jar", "sodium.jar"])
+        self.assertEqual(sorted(self.filter.search("i")), ["jei.jar", "lithium.jar", "sodium.jar"])
+    
+    def test_updated_record_is_found_after_narrowing(self):
+        self.assertEqual(self.filter.search("status:up"), ["sodium.jar", "lithium.jar", "jei.jar"])
+        self.filter.update(make_record("create.jar", "Create", "create", "forge", "Update available", "0.5.1"))
+        self.assertIn("create.jar", self.filter.search("status:upd"))
+    
+    def test_removed_record_is_not_returned(self):
+        self.filter.search("loader:forge")
+        self.filter.remove("jei.jar")
+        self.assertEqual(self.filter.search("loader:forge"), ["create.jar"])
+    
+    def test_sort_uses_natural_version_order(self):
+        paths = ["sodium.jar", "lithium.jar", "create.jar", "jei.jar"]
+        self.assertEqual(self.filter.sort(paths, "current_version"), 
+                         ["create.jar", "lithium.jar", "sodium.jar", "jei.jar"])
+        self.assertEqual(self.filter.sort(paths, "name", descending=True), 
+                         ["sodium.jar", "lithium.jar", "jei.jar", "create.jar"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+from mc_mod_updater import ModIndex
+
+
+class ModIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.temp_dir.name, "mods")
+        os.makedirs(self.folder)
+        self.index_path = os.path.join(self.temp_dir.name, "index.json")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def write_jar(self, name, version):
+        path = os.path.join(self.folder, name)
+        with zipfile.ZipFile(path, "w") as jar:
+            jar.writestr("fabric.mod.json", json.dumps({
+                "schemaVersion": 1, "id": name[:-4], "version": version, "name": name[:-4]
+            }))
+        return path
+    
+    def test_unchanged_jars_come_from_the_index(self):
+        self.write_jar("a.jar", "1.0")
+        self.write_jar("b.jar", "1.0")
+        
+        index = ModIndex(self.index_path)
+        self.assertEqual(len(index.scan(self.folder)), 2)
+        self.assertEqual(index.last_scan["parsed"], 2)
+        index.save()
+        
+        reloaded = ModIndex(self.index_path)
+        reloaded.scan(self.folder)
+        self.assertEqual(reloaded.last_scan, {"cached": 2, "parsed": 0, "pruned": 0})
+    
+    def test_changed_size_or_mtime_invalidates_entry(self):
+        path = self.write_jar("a.jar", "1.0")
+        index = ModIndex()
+        index.scan(self.folder)
+        
+        self.write_jar("a.jar", "2.0.0")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        entries = index.scan(self.folder)
+        
+        self.assertEqual(index.last_scan["parsed"], 1)
+        self.assertEqual(entries[0]["info"]["version"], "2.0.0")
+    
+    def test_removed_jars_are_pruned(self):
+        self.write_jar("a.jar", "1.0")
+        removed = self.write_jar("b.jar", "1.0")
+        index = ModIndex()
+        index.scan(self.folder)
+        
+        os.remove(removed)
+        index.scan(self.folder)
+        
+        self.assertEqual(index.last_scan["pruned"], 1)
+        self.assertNotIn(removed, index.entries)
+    
+    def test_refresh_reports_removed_paths(self):
+        kept = self.write_jar("a.jar", "1.0")
+        removed = self.write_jar("b.jar", "1.0")
+        index = ModIndex()
+        index.scan(self.folder)
+        
+        os.remove(removed)
+        entries, gone = index.refresh([kept, removed])
+        
+        self.assertEqual([entry["path"] for entry in entries], [kept])
+        self.assertEqual(gone, [removed])
+        self.assertNotIn(removed, index.entries)
+    
+    def test_other_format_version_is_ignored(self):
+        with open(self.index_path, "w", encoding="utf-8") as index_file:
+            json.dump({"version": ModIndex.FORMAT_VERSION - 1, "entries": {"x": {}}}, index_file)
+        
+        self.assertEqual(ModIndex(self.index_path).entries, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import time
+import unittest
+
+from mc_mod_updater import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_burst_is_not_throttled(self):
+        limiter = RateLimiter(rate=1.0, burst=5)
+        
+        self.assertEqual([limiter.acquire() for _ in range(5)], [0.0] * 5)
+    
+    def test_waits_for_next_token_after_burst(self):
+        limiter = RateLimiter(rate=50.0, burst=1)
+        limiter.acquire()
+        
+        started = time.monotonic()
+        waited = limiter.acquire()
+        
+        self.assertGreater(waited, 0.01)
+        self.assertGreaterEqual(time.monotonic() - started, 0.015)
+    
+    def test_remaining_budget_sets_rate(self):
+        limiter = RateLimiter(rate=10.0, burst=5, min_rate=0.5)
+        
+        limiter.update_from_headers({"X-Ratelimit-Remaining": "30", "X-Ratelimit-Reset": "10"})
+        self.assertEqual(limiter.rate, 3.0)
+        
+        limiter.update_from_headers({"X-Ratelimit-Remaining": "1", "X-Ratelimit-Reset": "60"})
+        self.assertEqual(limiter.rate, 0.5)
+        
+        limiter.update_from_headers({"X-Ratelimit-Remaining": "900", "X-Ratelimit-Reset": "10"})
+        self.assertEqual(limiter.rate, 10.0)
+    
+    def test_exhausted_budget_pauses_until_reset(self):
+        limiter = RateLimiter(rate=100.0, burst=5)
+        
+        limiter.update_from_headers({"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "0.05"})
+        waited = limiter.acquire()
+        
+        self.assertGreater(waited, 0.03)
+    
+    def test_missing_or_invalid_headers_are_ignored(self):
+        limiter = RateLimiter(rate=10.0)
+        
+        limiter.update_from_headers({})
+        limiter.update_from_headers({"X-Ratelimit-Remaining": "many", "X-Ratelimit-Reset": "10"})
+        
+        self.assertEqual((limiter.rate, limiter.paused_until), (10.0, 0.0))
+    
+    def test_pause_only_extends(self):
+        limiter = RateLimiter()
+        limiter.pause(10)
+        paused_until = limiter.paused_until
+        
+        limiter.pause(1)
+        
+        self.assertEqual(limiter.paused_until, paused_until)
+
+
+if __name__ == "__main__":
+    unittest.main()
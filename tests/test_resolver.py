@@ -0,0 +1,182 @@
+import unittest
+
+from mc_mod_updater import DependencyResolver, ModrinthAPI, ModRecord
+
+
+def make_version(version_id, project_id, loaders=("fabric",), game_versions=("1.21.5",), 
+                 dependencies=(), version_type="release"):
+    return {
+        "id": version_id,
+        "project_id": project_id,
+        "version_number": version_id,
+        "version_type": version_type,
+        "loaders": list(loaders),
+        "game_versions": list(game_versions),
+        "dependencies": [
+            {"project_id": dependency_project, "version_id": None, "dependency_type": dependency_type}
+            for dependency_project, dependency_type in dependencies
+        ]
+    }
+
+
+def make_mod(path, version):
+    mod = ModRecord(path, sha1=f"sha1-{path}", name=path.split(".")[0], loader="fabric")
+    mod.project_id = version["project_id"]
+    mod.current = version
+    return mod
+
+
+class FakeAPI:
+    get_compatible_loaders = ModrinthAPI.get_compatible_loaders
+    
+    def __init__(self, versions):
+        self.versions = {version["id"]: version for version in versions}
+        self.version_queries = []
+        self.errors = 0
+    
+    def get_projects(self, project_ids, revalidate=False):
+        return {project_id: {"id": project_id, "title": project_id.title()} for project_id in project_ids}
+    
+    def get_versions(self, version_ids):
+        return {version_id: self.versions[version_id] for version_id in version_ids if version_id in self.versions}
+    
+    def get_mod_versions(self, project_id, game_version=None, loaders=None, **kwargs):
+        self.version_queries.append(project_id)
+        return [
+            version for version in self.versions.values()
+            if version["project_id"] == project_id
+            and (not game_version or game_version in version["game_versions"])
+            and (not loaders or set(loaders) & set(version["loaders"]))
+        ]
+    
+    def get_versions_from_hashes(self, hashes, algorithm="sha1"):
+        return {}
+
+
+class DependencyResolverTest(unittest.TestCase):
+    def resolve(self, api, mods, proposed):
+        resolver = DependencyResolver(api, max_workers=2, log=lambda message: None)
+        return resolver.resolve({mod.path: mod for mod in mods}, proposed, "1.21.5")
+    
+    def test_adds_missing_required_dependency(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("lib", "required")])
+        library = make_version("l1", "lib")
+        api = FakeAPI([old, new, library])
+        
+        resolution = self.resolve(api, [make_mod("alpha.jar", old)], {"alpha.jar": new})
+        
+        self.assertEqual([added["project_id"] for added in resolution["added"]], ["lib"])
+        self.assertEqual(resolution["added"][0]["version"]["id"], "l1")
+        self.assertEqual(resolution["added"][0]["required_by"], "alpha")
+        self.assertEqual(resolution["held_back"], {})
+        self.assertEqual(resolution["issues"], [])
+    
+    def test_installed_dependency_is_not_added(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("lib", "required")])
+        library = make_version("l1", "lib")
+        api = FakeAPI([old, new, library])
+        
+        resolution = self.resolve(api, [make_mod("alpha.jar", old), make_mod("lib.jar", library)], {"alpha.jar": new})
+        
+        self.assertEqual(resolution["added"], [])
+        self.assertNotIn("lib", api.version_queries)
+    
+    def test_adds_transitive_dependencies(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("lib", "required")])
+        library = make_version("l1", "lib", dependencies=[("core", "required")])
+        core = make_version("c1", "core")
+        api = FakeAPI([old, new, library, core])
+        
+        resolution = self.resolve(api, [make_mod("alpha.jar", old)], {"alpha.jar": new})
+        
+        self.assertEqual(sorted(added["project_id"] for added in resolution["added"]), ["core", "lib"])
+    
+    def test_prefers_release_over_newer_beta(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("lib", "required")])
+        beta = make_version("l2", "lib", version_type="beta")
+        release = make_version("l1", "lib")
+        api = FakeAPI([old, new, beta, release])
+        
+        resolution = self.resolve(api, [make_mod("alpha.jar", old)], {"alpha.jar": new})
+        
+        self.assertEqual(resolution["added"][0]["version"]["id"], "l1")
+    
+    def test_holds_back_update_with_missing_dependency(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("lib", "required")])
+        forge_only = make_version("l1", "lib", loaders=("forge",))
+        api = FakeAPI([old, new, forge_only])
+        
+        resolution = self.resolve(api, [make_mod("alpha.jar", old)], {"alpha.jar": new})
+        
+        self.assertEqual(list(resolution["held_back"]), ["alpha.jar"])
+        self.assertIn("requires Lib, but no compatible version was found", resolution["held_back"]["alpha.jar"])
+        self.assertEqual(resolution["versions"]["alpha"]["id"], "a1")
+        self.assertEqual(resolution["issues"], [])
+        self.assertEqual(api.version_queries, ["lib"])
+    
+    def test_holds_back_update_incompatible_with_installed_mod(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("beta", "incompatible")])
+        other = make_version("b1", "beta")
+        other_update = make_version("b2", "beta")
+        api = FakeAPI([old, new, other, other_update])
+        
+        resolution = self.resolve(
+            api, [make_mod("alpha.jar", old), make_mod("beta.jar", other)], 
+            {"alpha.jar": new, "beta.jar": other_update}
+        )
+        
+        self.assertEqual(list(resolution["held_back"]), ["alpha.jar"])
+        self.assertEqual(resolution["held_back"]["alpha.jar"], "alpha is incompatible with beta")
+        self.assertEqual(resolution["versions"]["beta"]["id"], "b2")
+        self.assertEqual(resolution["added"], [])
+    
+    def test_reports_issue_that_no_update_caused(self):
+        installed = make_version("a1", "alpha", dependencies=[("lib", "required")])
+        api = FakeAPI([installed])
+        
+        resolution = self.resolve(api, [make_mod("alpha.jar", installed)], {})
+        
+        self.assertEqual(resolution["held_back"], {})
+        self.assertEqual([issue["type"] for issue in resolution["issues"]], ["missing"])
+        self.assertEqual(DependencyResolver.describe_issue(resolution["issues"][0]), 
+                         "alpha requires Lib, but no compatible version was found")
+    
+    def test_quilt_pack_accepts_fabric_dependency(self):
+        old = make_version("a1", "alpha", loaders=("quilt",))
+        new = make_version("a2", "alpha", loaders=("quilt",), dependencies=[("lib", "required")])
+        library = make_version("l1", "lib", loaders=("fabric",))
+        api = FakeAPI([old, new, library])
+        mod = make_mod("alpha.jar", old)
+        mod.loader = "quilt"
+        
+        resolution = self.resolve(api, [mod], {"alpha.jar": new})
+        
+        self.assertEqual(resolution["loader"], "quilt")
+        self.assertEqual([added["project_id"] for added in resolution["added"]], ["lib"])
+
+    
+    def test_missing_dependency_is_looked_up_once_across_resolves(self):
+        old = make_version("a1", "alpha")
+        new = make_version("a2", "alpha", dependencies=[("lib", "required")])
+        other_old = make_version("b1", "beta")
+        other_new = make_version("b2", "beta", dependencies=[("lib", "required")])
+        api = FakeAPI([old, new, other_old, other_new])
+        resolver = DependencyResolver(api, max_workers=2, log=lambda message: None)
+        mods = {"alpha.jar": make_mod("alpha.jar", old), "beta.jar": make_mod("beta.jar", other_old)}
+        
+        first = resolver.resolve(mods, {"alpha.jar": new, "beta.jar": other_new}, "1.21.5")
+        second = resolver.resolve(mods, {"alpha.jar": new}, "1.21.5")
+        
+        self.assertEqual(sorted(first["held_back"]), ["alpha.jar", "beta.jar"])
+        self.assertEqual(list(second["held_back"]), ["alpha.jar"])
+        self.assertEqual(api.version_queries, ["lib"])
+
+
+if __name__ == "__main__":
+    unittest.main()
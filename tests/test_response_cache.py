@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from mc_mod_updater import ResponseCache
+
+BASE_URL = "https://api.modrinth.com/v2"
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cache.sqlite")
+        self.cache = ResponseCache(self.path, max_bytes=10 * 1024)
+    
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+    
+    def age(self, key, seconds):
+        self.cache.db.execute("UPDATE responses SET fetched_at = fetched_at - ? WHERE key = ?", (seconds, key))
+        self.cache.db.commit()
+    
+    def set_accessed(self, key, accessed_at):
+        self.cache.db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (accessed_at, key))
+        self.cache.db.commit()
+    
+    def keys(self):
+        return {row[0] for row in self.cache.db.execute("SELECT key FROM responses")}
+    
+    def test_key_ignores_parameter_order(self):
+        first = ResponseCache.get_key("get", f"{BASE_URL}/search", {"query": "sodium", "limit": 10})
+        second = ResponseCache.get_key("GET", f"{BASE_URL}/search", {"limit": 10, "query": "sodium"})
+        
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, ResponseCache.get_key("POST", f"{BASE_URL}/search", {"query": "sodium"}))
+        self.assertNotEqual(first, ResponseCache.get_key("GET", f"{BASE_URL}/search", {"query": "sodium"}, {}))
+    
+    def test_ttl_depends_on_endpoint(self):
+        self.assertEqual(self.cache.get_ttl(f"{BASE_URL}/version_files/update"), 10 * 60)
+        self.assertEqual(self.cache.get_ttl(f"{BASE_URL}/search?query=jei"), 60 * 60)
+        self.assertEqual(self.cache.get_ttl(f"{BASE_URL}/project/AANobbMI/version"), 30 * 60)
+        self.assertEqual(self.cache.get_ttl(f"{BASE_URL}/tag/loader"), ResponseCache.DEFAULT_TTL)
+    
+    def test_entry_goes_stale_after_ttl(self):
+        self.cache.put("search", f"{BASE_URL}/search", b'{"hits": []}', etag='"abc"')
+        
+        entry = self.cache.get("search")
+        self.assertTrue(entry["fresh"])
+        self.assertEqual((entry["body"], entry["etag"]), (b'{"hits": []}', '"abc"'))
+        
+        self.age("search", 60 * 60 + 1)
+        self.assertFalse(self.cache.get("search")["fresh"])
+    
+    def test_touch_makes_stale_entry_fresh(self):
+        self.cache.put("projects", f"{BASE_URL}/projects", b"[]")
+        self.age("projects", 15 * 60 + 1)
+        
+        self.cache.touch("projects")
+        
+        self.assertTrue(self.cache.get("projects")["fresh"])
+    
+    def test_missing_key_returns_none(self):
+        self.assertIsNone(self.cache.get("missing"))
+    
+    def test_evicts_least_recently_used_entries(self):
+        for index in range(4):
+            self.cache.put(f"key{index}", f"{BASE_URL}/project/{index}", os.urandom(2000))
+            self.set_accessed(f"key{index}", 1000 + index)
+        self.set_accessed("key0", 2000)
+        
+        self.cache.put("key4", f"{BASE_URL}/project/4", os.urandom(5000))
+        
+        self.assertEqual(self.keys(), {"key0", "key3", "key4"})
+        self.assertEqual(self.cache.stats["evictions"], 2)
+        self.assertLessEqual(self.cache.total_size, self.cache.max_bytes * 0.9)
+    
+    def test_replacing_entry_does_not_double_count_size(self):
+        self.cache.put("key", f"{BASE_URL}/search", os.urandom(3000))
+        self.cache.put("key", f"{BASE_URL}/search", os.urandom(3000))
+        
+        stored = self.cache.db.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+        self.assertEqual(self.cache.total_size, stored)
+        self.assertEqual(self.cache.stats["evictions"], 0)
+    
+    def test_size_is_restored_on_reopen(self):
+        self.cache.put("key", f"{BASE_URL}/search", os.urandom(3000))
+        size = self.cache.total_size
+        self.cache.close()
+        
+        self.cache = ResponseCache(self.path, max_bytes=10 * 1024)
+        
+        self.assertEqual(self.cache.total_size, size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import threading
+import unittest
+
+from mc_mod_updater import ModRecord, UpdateScheduler
+
+
+def make_result(project_id, status, latest_id):
+    return {
+        "project_id": project_id,
+        "current": {"id": "current"},
+        "latest": {"id": latest_id, "project_id": project_id, "version_number": latest_id},
+        "status": status
+    }
+
+
+def make_miss():
+    return {"project_id": None, "current": None, "latest": None, "status": "Not found"}
+
+
+class FakeChecker:
+    def __init__(self, api):
+        self.api = api
+        self.results = {}
+        self.checked = []
+        self.lookup_errors = 0
+    
+    def check(self, mods, game_version, on_result, revalidate=False):
+        self.checked.extend(mods)
+        self.api.errors += self.lookup_errors
+        return {key: dict(self.results[mod.sha1]) for key, mod in mods.items()}
+
+
+class FakeAPI:
+    def __init__(self):
+        self.updated = {}
+        self.failing = False
+        self.errors = 0
+    
+    def get_projects(self, project_ids, revalidate=False):
+        if self.failing:
+            return {}
+        return {project_id: {"id": project_id, "updated": self.updated.get(project_id, "t0")} 
+                for project_id in project_ids}
+
+
+class UpdateSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeAPI()
+        self.scheduler = UpdateScheduler(self.api, "1.21.5", log=lambda message: None)
+        self.checker = self.scheduler.checker = FakeChecker(self.api)
+    
+    def run_once(self, files):
+        outcome = self.scheduler.run_once({path: ModRecord(path, sha1=sha1) for path, sha1 in files.items()})
+        self.scheduler.state["full_check_at"] = float("inf")
+        self.checker.checked = []
+        return outcome["diff"]
+    
+    def test_unchanged_projects_are_not_rechecked(self):
+        self.checker.results = {"a": make_result("alpha", "Up to date", "a1")}
+        self.run_once({"alpha.jar": "a"})
+        
+        diff = self.run_once({"alpha.jar": "a"})
+        
+        self.assertEqual((diff["rechecked"], self.checker.checked), (0, []))
+        
+        self.api.updated["alpha"] = "t1"
+        diff = self.run_once({"alpha.jar": "a"})
+        self.assertEqual((diff["changed_projects"], diff["rechecked"]), (["alpha"], 1))
+    
+    def test_new_update_is_reported_once(self):
+        self.checker.results = {"a": make_result("alpha", "Up to date", "a1")}
+        self.run_once({"alpha.jar": "a"})
+        
+        self.checker.results["a"] = make_result("alpha", "Update available", "a2")
+        self.api.updated["alpha"] = "t1"
+        diff = self.run_once({"alpha.jar": "a"})
+        self.assertEqual([entry["latest_version_id"] for entry in diff["new_updates"]], ["a2"])
+        
+        self.api.updated["alpha"] = "t2"
+        self.assertEqual(self.run_once({"alpha.jar": "a"})["new_updates"], [])
+    
+    def test_installed_update_is_resolved(self):
+        self.checker.results = {
+            "a1": make_result("alpha", "Update available", "a2"),
+            "a2": make_result("alpha", "Up to date", "a2")
+        }
+        self.run_once({"alpha-1.jar": "a1"})
+        
+        diff = self.run_once({"alpha-2.jar": "a2"})
+        
+        self.assertEqual(diff["updates"], 0)
+        self.assertEqual([entry["file"] for entry in diff["resolved"]], ["alpha-2.jar"])
+        self.assertEqual(diff["new_updates"], [])
+    
+    def test_failed_project_lookup_rechecks_mods(self):
+        self.checker.results = {"a": make_result("alpha", "Up to date", "a1")}
+        self.run_once({"alpha.jar": "a"})
+        
+        self.api.failing = True
+        self.checker.results["a"] = make_result("alpha", "Update available", "a2")
+        diff = self.run_once({"alpha.jar": "a"})
+        
+        self.assertEqual((diff["missing_projects"], diff["rechecked"]), (["alpha"], 1))
+        self.assertEqual([entry["latest_version_id"] for entry in diff["new_updates"]], ["a2"])
+
+    
+    def test_failed_recheck_keeps_previous_entry(self):
+        self.checker.results = {"a": make_result("alpha", "Update available", "a2")}
+        self.run_once({"alpha.jar": "a"})
+        
+        self.api.updated["alpha"] = "t1"
+        self.checker.results["a"] = make_miss()
+        self.checker.lookup_errors = 1
+        diff = self.run_once({"alpha.jar": "a"})
+        
+        self.assertEqual((diff["lookup_errors"], diff["updates"], diff["resolved"]), (1, 1, []))
+        self.assertEqual(self.scheduler.state["mods"]["a"]["project_id"], "alpha")
+        self.assertEqual(self.scheduler.state["projects"]["alpha"], "t0")
+        
+        self.checker.lookup_errors = 0
+        self.checker.results["a"] = make_result("alpha", "Up to date", "a2")
+        diff = self.run_once({"alpha.jar": "a"})
+        self.assertEqual((diff["rechecked"], diff["updates"]), (1, 0))
+    
+    def test_real_miss_is_recorded(self):
+        self.checker.results = {"a": make_result("alpha", "Up to date", "a1")}
+        self.run_once({"alpha.jar": "a"})
+        
+        self.api.updated["alpha"] = "t1"
+        self.checker.results["a"] = make_miss()
+        self.run_once({"alpha.jar": "a"})
+        
+        self.assertEqual(self.scheduler.state["mods"]["a"]["status"], "Not found")
+    
+    def test_new_mod_missed_during_errors_is_checked_again(self):
+        self.checker.results = {"a": make_miss()}
+        self.checker.lookup_errors = 1
+        diff = self.run_once({"alpha.jar": "a"})
+        
+        self.assertNotIn("a", self.scheduler.state["mods"])
+        
+        self.checker.lookup_errors = 0
+        self.checker.results["a"] = make_result("alpha", "Update available", "a2")
+        diff = self.run_once({"alpha.jar": "a"})
+        self.assertEqual((diff["rechecked"], len(diff["new_updates"])), (1, 1))
+    
+    def test_run_keeps_going_after_unexpected_errors(self):
+        stopped = threading.Event()
+        calls = []
+        messages = []
+        self.scheduler.log = messages.append
+        
+        def get_mods():
+            calls.append(True)
+            if len(calls) == 1:
+                raise ValueError("bad response")
+            stopped.set()
+            return {}
+        
+        self.scheduler.run(get_mods, 0, lambda outcome: None, stopped)
+        
+        self.assertEqual(len(calls), 2)
+        self.assertIn("Scheduled check failed: ValueError: bad response", messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
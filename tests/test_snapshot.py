@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+
+from mc_mod_updater import MetadataSnapshot
+
+
+def make_version(version_id, project_id, sha1, dependencies=(), loaders=("fabric",), date="2025-01-01"):
+    return {
+        "id": version_id,
+        "project_id": project_id,
+        "version_number": version_id,
+        "date_published": date,
+        "loaders": list(loaders),
+        "game_versions": ["1.21.5"],
+        "files": [{"hashes": {"sha1": sha1}, "filename": f"{version_id}.jar"}],
+        "dependencies": [{"project_id": dependency, "dependency_type": "required"} for dependency in dependencies]
+    }
+
+
+class FakeAPI:
+    def __init__(self):
+        self.projects = {}
+        self.versions = {}
+        self.version_requests = []
+        self.revalidated = []
+    
+    def add(self, project_id, updated, versions):
+        self.projects[project_id] = {
+            "id": project_id, "slug": project_id, "title": project_id.title(), 
+            "updated": updated, "versions": [version["id"] for version in versions]
+        }
+        self.versions.update({version["id"]: version for version in versions})
+    
+    def get_projects(self, project_ids, revalidate=False):
+        self.revalidated.append(revalidate)
+        return {project_id: self.projects[project_id] for project_id in project_ids if project_id in self.projects}
+    
+    def get_versions(self, version_ids, revalidate=False):
+        self.revalidated.append(revalidate)
+        self.version_requests.append(sorted(version_ids))
+        return {version_id: self.versions[version_id] for version_id in version_ids if version_id in self.versions}
+
+
+class MetadataSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot = MetadataSnapshot(os.path.join(self.temp_dir.name, "snapshot.sqlite"))
+        self.api = FakeAPI()
+        self.api.add("alpha", "t0", [make_version("a1", "alpha", "sha-a1", dependencies=["lib"])])
+        self.api.add("beta", "t0", [make_version("b1", "beta", "sha-b1")])
+        self.api.add("lib", "t0", [make_version("l1", "lib", "sha-l1")])
+    
+    def tearDown(self):
+        self.snapshot.close()
+        self.temp_dir.cleanup()
+    
+    def refresh(self, project_ids, **kwargs):
+        self.api.version_requests = []
+        return self.snapshot.refresh(self.api, project_ids, log=lambda message: None, **kwargs)
+    
+    def test_first_refresh_stores_projects_and_dependencies(self):
+        stats = self.refresh(["alpha", "beta", "missing"])
+        
+        self.assertEqual((stats["updated"], stats["versions"], stats["missing"]), (3, 3, 1))
+        self.assertEqual(sorted(self.snapshot.get_updated()), ["alpha", "beta", "lib"])
+        self.assertEqual(self.snapshot.get_versions_from_hashes(["sha-l1"])["sha-l1"]["id"], "l1")
+    
+    def test_dependencies_can_be_skipped(self):
+        self.refresh(["alpha"], dependencies=False)
+        
+        self.assertEqual(sorted(self.snapshot.get_updated()), ["alpha"])
+    
+    def test_unchanged_projects_fetch_no_versions(self):
+        self.refresh(["alpha", "beta"])
+        
+        stats = self.refresh(["alpha", "beta", "lib"])
+        
+        self.assertEqual((stats["checked"], stats["unchanged"], stats["updated"]), (3, 3, 0))
+        self.assertEqual(self.api.version_requests, [])
+    
+    def test_only_changed_projects_are_refetched(self):
+        self.refresh(["alpha", "beta"])
+        self.api.add("beta", "t1", [make_version("b1", "beta", "sha-b1"), 
+                                    make_version("b2", "beta", "sha-b2", date="2025-02-01")])
+        
+        stats = self.refresh(["alpha", "beta", "lib"])
+        
+        self.assertEqual((stats["updated"], stats["unchanged"]), (1, 2))
+        self.assertEqual(self.api.version_requests, [["b1", "b2"]])
+        latest = self.snapshot.get_latest_versions_from_hashes(["sha-b1"], loaders=["fabric"])
+        self.assertEqual(latest["sha-b1"]["id"], "b2")
+    
+    def test_refresh_bypasses_the_response_cache(self):
+        self.refresh(["alpha"])
+        
+        self.assertTrue(self.api.revalidated)
+        self.assertTrue(all(self.api.revalidated))
+    
+    def test_offline_lookups_filter_by_loader(self):
+        self.api.add("beta", "t1", [make_version("b1", "beta", "sha-b1"), 
+                                    make_version("b2", "beta", "sha-b2", loaders=("forge",), date="2025-02-01")])
+        self.refresh(["beta"])
+        
+        self.assertEqual(self.snapshot.get_latest_versions_from_hashes(["sha-b1"], loaders=["fabric"])["sha-b1"]["id"], "b1")
+        self.assertEqual([version["id"] for version in self.snapshot.get_project_versions("beta")], ["b2", "b1"])
+        self.assertEqual(self.snapshot.search("bet")[0]["project_id"], "beta")
+
+
+if __name__ == "__main__":
+    unittest.main()